@@ -1,27 +1,124 @@
+from itertools import islice
+
 import streamlit as st
-from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_cache import RenderCache, owner_key
+from pawpal_db import PawPalDB
+from pawpal_profile import SchedulerStats, disable, enable
+from pawpal_system import PRIORITY_LABELS, Owner, Pet, Task, Scheduler
+from pawpal_whatif import WhatIf
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
+MAX_CONFLICTS_SHOWN = 20
+MAX_CACHED_RENDERS = 32
+MAX_EXPLANATIONS_SHOWN = 50
+DB_PATH = "pawpal.db"
+
+
+def save_owner(owner: Owner) -> None:
+    """Write the owner and all their pets and tasks to the local database."""
+    with PawPalDB(DB_PATH) as db:
+        db.save_owner(owner)
+
+
+def conflict_lines(scheduler: Scheduler):
+    """Return markdown for the first few overlapping pairs and the total pair count."""
+    pairs = scheduler.iter_conflicts()
+    lines = []
+    for a, b in islice(pairs, MAX_CONFLICTS_SHOWN):
+        when = f"{a.date} " if a.date else ""
+        lines.append(f"- **{a.title}** (`{when}{a.time}`) overlaps **{b.title}** (`{b.time}`)")
+    return lines, len(lines) + sum(1 for _ in pairs)
+
+
+def show_conflicts(cache: RenderCache, scheduler: Scheduler, heading: str) -> None:
+    """List the first few overlapping task pairs, reusing them until a task changes."""
+    lines, total = cache.get_or_compute(("conflicts",) + owner_key(scheduler.owner),
+                                        lambda: conflict_lines(scheduler))
+    if not lines:
+        return
+    st.warning(f"⚠️ {total} time conflict(s) {heading}:")
+    for line in lines:
+        st.markdown(line)
+    if total > len(lines):
+        st.caption(f"…and {total - len(lines)} more.")
+
+
+def task_rows(tasks, done_column: bool = True):
+    """Turn tasks into table rows."""
+    rows = []
+    for t in tasks:
+        row = {
+            "title": t.title,
+            "duration (min)": t.duration_minutes,
+            "priority": PRIORITY_LABELS.get(t.priority, "?"),
+            "repeats": t.frequency or "none",
+            "time slot": t.time or "—",
+        }
+        if done_column:
+            row["done"] = "✔" if t.completed else ""
+        rows.append(row)
+    return rows
+
+
+def schedule_view(scheduler: Scheduler) -> dict:
+    """Collect everything the schedule section shows, so it can be cached as one entry."""
+    scheduled = scheduler.schedule
+    unscheduled = scheduler.get_unscheduled()
+    return {
+        "count": len(scheduled),
+        "minutes": sum(t.duration_minutes for t in scheduled),
+        "rows": task_rows(scheduled, done_column=False),
+        "unscheduled": [{"title": t.title, "duration (min)": t.duration_minutes} for t in unscheduled],
+        "explanations": scheduler.explain(limit=MAX_EXPLANATIONS_SHOWN),
+    }
+
 # --- Session state init ---
 if "owner" not in st.session_state:
-    st.session_state.owner = Owner(name="Default User", available_minutes=60)
+    with PawPalDB(DB_PATH) as db:
+        saved = db.list_owners()
+        st.session_state.owner = (
+            db.load_owner(saved[0][0], lazy=False) if saved
+            else Owner(name="Default User", available_minutes=60)
+        )
 
 owner = st.session_state.owner
 
+# One scheduler per session: once built it follows task changes instead of rebuilding.
+if "scheduler" not in st.session_state:
+    st.session_state.scheduler = Scheduler(owner=owner)
+    st.session_state.schedule_mode = ""
+scheduler = st.session_state.scheduler
+
+# Derived tables are cached on the owner's version, so reruns that change nothing
+# (most widget clicks) render from stored rows instead of recomputing them.
+if "render_cache" not in st.session_state:
+    st.session_state.render_cache = RenderCache(max_entries=MAX_CACHED_RENDERS)
+cache = st.session_state.render_cache
+
+# Opt-in timing of scheduler calls, toggled from the "Scheduler timings" panel below.
+if "scheduler_stats" not in st.session_state:
+    st.session_state.scheduler_stats = SchedulerStats()
+if st.session_state.get("profile_scheduler"):
+    enable(scheduler, st.session_state.scheduler_stats)
+else:
+    disable(scheduler)
+
 st.title("🐾 PawPal+")
 
 # --- Owner Info ---
 st.subheader("Owner Info")
 col1, col2 = st.columns(2)
 with col1:
-    owner_name = st.text_input("Your name", value="", placeholder="e.g. Default User")
+    owner_name = st.text_input("Your name", value=owner.name, placeholder="e.g. Default User")
 with col2:
     available_minutes = st.number_input(
         "Time available today (minutes)", min_value=1, max_value=480, value=owner.available_minutes
     )
-owner.name = owner_name
-owner.available_minutes = available_minutes
+if (owner_name, available_minutes) != (owner.name, owner.available_minutes):
+    owner.name = owner_name
+    owner.available_minutes = available_minutes
+    save_owner(owner)
 
 st.divider()
 
@@ -35,6 +132,7 @@ with col2:
 
 if st.button("Add pet"):
     owner.add_pet(Pet(name=pet_name, species=species))
+    save_owner(owner)
     st.success(f"{pet_name} the {species} added!")
 
 if owner.pets:
@@ -78,6 +176,7 @@ else:
             frequency="" if frequency == "none" else frequency,
             time=task_time.strip(),
         ))
+        save_owner(owner)
         st.success(f"'{task_title}' added to {selected_pet_name}.")
 
 st.divider()
@@ -96,39 +195,25 @@ if all_tasks:
     with col2:
         sort_mode = st.selectbox("Sort by", ["priority (default)", "duration (shortest first)"])
 
-    filtered = all_tasks
-    if priority_filter == "high (3)":
-        filtered = owner.filter_by_priority(3)
-    elif priority_filter == "medium (2)":
-        filtered = owner.filter_by_priority(2)
-    elif priority_filter == "low (1)":
-        filtered = owner.filter_by_priority(1)
-
-    if sort_mode == "duration (shortest first)":
-        scheduler_preview = Scheduler(owner=owner)
-        filtered = scheduler_preview.sort_by_time(filtered)
-
-    priority_labels = {1: "low", 2: "medium", 3: "high"}
-    display_rows = [
-        {
-            "title": t.title,
-            "duration (min)": t.duration_minutes,
-            "priority": priority_labels.get(t.priority, "?"),
-            "repeats": t.frequency or "none",
-            "time slot": t.time or "—",
-            "done": "✔" if t.completed else "",
-        }
-        for t in filtered
-    ]
+    def filtered_rows():
+        filtered = all_tasks
+        if priority_filter == "high (3)":
+            filtered = owner.filter_by_priority(3)
+        elif priority_filter == "medium (2)":
+            filtered = owner.filter_by_priority(2)
+        elif priority_filter == "low (1)":
+            filtered = owner.filter_by_priority(1)
+
+        if sort_mode == "duration (shortest first)":
+            filtered = scheduler.sort_by_time(filtered)
+        return task_rows(filtered)
+
+    display_rows = cache.get_or_compute(("tasks", priority_filter, sort_mode) + owner_key(owner),
+                                        filtered_rows)
     st.table(display_rows)
 
     # Conflict warning
-    conflict_checker = Scheduler(owner=owner)
-    conflicts = conflict_checker.detect_conflicts()
-    if conflicts:
-        st.warning(f"⚠️ {len(conflicts)} time conflict(s) detected:")
-        for a, b in conflicts:
-            st.markdown(f"- **{a.title}** and **{b.title}** are both scheduled at `{a.time}`")
+    show_conflicts(cache, scheduler, "detected")
 else:
     st.info("No tasks yet. Add some above.")
 
@@ -137,46 +222,88 @@ st.divider()
 # --- Generate Schedule ---
 st.subheader("Generate Today's Schedule")
 st.caption(f"Time budget: {owner.available_minutes} minutes")
+schedule_mode = st.radio(
+    "Scheduling mode",
+    ["greedy", "optimal"],
+    horizontal=True,
+    help="Greedy takes the highest-priority tasks first; optimal packs the most "
+         "priority-weighted minutes into your budget.",
+)
 
 if st.button("Generate schedule"):
     all_tasks = owner.get_all_tasks()
     if not all_tasks:
         st.warning("Add at least one task before generating a schedule.")
     else:
-        scheduler = Scheduler(owner=owner)
-        scheduler.build_schedule()
+        if st.session_state.schedule_mode != schedule_mode:
+            scheduler.build_schedule(mode=schedule_mode)
+            st.session_state.schedule_mode = schedule_mode
 
-        if scheduler.schedule:
-            total_scheduled = sum(t.duration_minutes for t in scheduler.schedule)
+        view = cache.get_or_compute(("schedule", schedule_mode) + owner_key(owner),
+                                    lambda: schedule_view(scheduler))
+        if view["count"]:
             st.success(
-                f"Scheduled {len(scheduler.schedule)} task(s) — "
-                f"{total_scheduled} of {owner.available_minutes} minutes used."
+                f"Scheduled {view['count']} task(s) — "
+                f"{view['minutes']} of {owner.available_minutes} minutes used."
             )
-            priority_labels = {1: "low", 2: "medium", 3: "high"}
-            st.table([
-                {
-                    "title": t.title,
-                    "duration (min)": t.duration_minutes,
-                    "priority": priority_labels.get(t.priority, "?"),
-                    "repeats": t.frequency or "none",
-                    "time slot": t.time or "—",
-                }
-                for t in scheduler.schedule
-            ])
+            st.table(view["rows"])
         else:
             st.warning("No tasks fit within your time budget.")
 
-        unscheduled = scheduler.get_unscheduled()
-        if unscheduled:
-            st.error(f"{len(unscheduled)} task(s) could not be scheduled:")
-            st.table([{"title": t.title, "duration (min)": t.duration_minutes} for t in unscheduled])
+        if view["unscheduled"]:
+            st.error(f"{len(view['unscheduled'])} task(s) could not be scheduled:")
+            st.table(view["unscheduled"])
 
-        conflicts = scheduler.detect_conflicts()
-        if conflicts:
-            st.warning(f"⚠️ {len(conflicts)} time conflict(s) in your task list:")
-            for a, b in conflicts:
-                st.markdown(f"- **{a.title}** and **{b.title}** overlap at `{a.time}`")
+        show_conflicts(cache, scheduler, "in your task list")
 
         with st.expander("Scheduling explanations"):
-            for line in scheduler.explain():
+            for line in view["explanations"]:
                 st.markdown(f"- {line}")
+            hidden = view["count"] + len(view["unscheduled"]) - len(view["explanations"])
+            if hidden > 0:
+                st.caption(f"…and {hidden} more.")
+
+with st.expander("What if I had more or less time?"):
+    # One pass gives the greedy result at every budget; the owner is never modified.
+    curve = cache.get_or_compute(("budget_curve",) + owner_key(owner), lambda: WhatIf(owner).curve())
+    if owner.get_all_tasks():
+        what_if_minutes = st.slider("Time budget (minutes)", min_value=1, max_value=len(curve),
+                                    value=min(max(owner.available_minutes, 1), len(curve)))
+        point = curve[what_if_minutes - 1]
+        st.caption(f"With {what_if_minutes} minutes, {point.tasks} task(s) fit, "
+                   f"using {point.minutes} minutes.")
+        st.line_chart([{"budget (min)": p.budget, "minutes scheduled": p.minutes} for p in curve],
+                      x="budget (min)")
+    else:
+        st.caption("Add tasks to see how the schedule changes with your time budget.")
+
+st.divider()
+
+# --- Cache instrumentation ---
+with st.expander("Render cache"):
+    stats = cache.stats
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Hits", stats.hits)
+    col2.metric("Misses", stats.misses)
+    col3.metric("Evictions", stats.evictions)
+    col4.metric("Hit rate", f"{stats.hit_rate:.0%}")
+    st.caption(f"{len(cache)} of {cache.max_entries} entries in use · owner version {owner.version}")
+
+with st.expander("Scheduler timings"):
+    st.checkbox("Time scheduler calls", key="profile_scheduler",
+                help="Takes effect from the next interaction.")
+    timings = st.session_state.scheduler_stats
+    if timings.methods:
+        st.table([
+            {
+                "method": name,
+                "calls": timings.methods[name].calls,
+                "total (ms)": round(timings.methods[name].total_seconds * 1000, 2),
+                "max (ms)": round(timings.methods[name].max_seconds * 1000, 2),
+                "max tasks": timings.methods[name].max_tasks,
+            }
+            for name in timings.slowest()
+        ])
+        st.download_button("Download JSON", timings.to_json(), file_name="scheduler_stats.json")
+    else:
+        st.caption("No scheduler calls recorded yet.")
@@ -0,0 +1,58 @@
+"""Compare a plain build_schedule loop with BatchScheduler across worker counts.
+
+Run with:  python benchmarks/bench_batch.py
+"""
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task, Scheduler  # noqa: E402
+from pawpal_batch import BatchScheduler, pack_owner  # noqa: E402
+
+OWNERS = 5_000
+TASKS_PER_OWNER = 40
+
+
+def make_owners(count: int, seed: int = 42):
+    """Build count owners with two pets and TASKS_PER_OWNER tasks each."""
+    rng = random.Random(seed)
+    owners = []
+    for n in range(count):
+        owner = Owner(name=f"Owner {n}", available_minutes=rng.randint(60, 480))
+        pets = [Pet(name="Mochi", species="dog"), Pet(name="Luna", species="cat")]
+        for pet in pets:
+            owner.add_pet(pet)
+        for i in range(TASKS_PER_OWNER):
+            pets[i % 2].add_task(Task(title=f"Task {i}", duration_minutes=rng.randint(5, 60),
+                                      priority=rng.randint(1, 3)))
+        owners.append(owner)
+    return owners
+
+
+def main() -> None:
+    owners = make_owners(OWNERS)
+    payloads = [pack_owner(o) for o in owners]
+
+    start = time.perf_counter()
+    for owner in owners:
+        Scheduler(owner).build_schedule()
+    loop_s = time.perf_counter() - start
+    print(f"{OWNERS:,} owners x {TASKS_PER_OWNER} tasks")
+    print(f"{'loop':<12} {loop_s:>7.2f}s {OWNERS / loop_s:>10,.0f} owners/s")
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        batch = BatchScheduler(workers=workers, chunk_size=200)
+        start = time.perf_counter()
+        count = sum(1 for _ in batch.run(payloads))
+        elapsed = time.perf_counter() - start
+        per_worker = ", ".join(f"{rate:,.0f}" for rate in batch.throughput().values())
+        print(f"{workers:>2} workers  {elapsed:>7.2f}s {count / elapsed:>10,.0f} owners/s"
+              f"   per worker: {per_worker}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare the interval-index conflict check against an all-pairs scan.
+
+Run with:  python benchmarks/bench_conflicts.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import IntervalIndex, Owner, Pet, Task, Scheduler  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+PAIRWISE_LIMIT = 10_000   # the quadratic scan is too slow to time beyond this
+
+
+def make_owner(n_tasks: int, seed: int = 42) -> Owner:
+    """Build an owner with ten pets and n_tasks tasks over a week, about a third of them timed."""
+    rng = random.Random(seed)
+    owner = Owner(name="Kennel", available_minutes=480)
+    pets = [Pet(name=f"Pet {i}", species="dog") for i in range(10)]
+    for pet in pets:
+        owner.add_pet(pet)
+    for i in range(n_tasks):
+        timed = rng.random() < 0.3
+        minute = rng.randrange(24 * 60)
+        pets[i % len(pets)].add_task(Task(
+            title=f"Task {i}",
+            duration_minutes=rng.randint(5, 60),
+            priority=rng.randint(1, 3),
+            date=f"2026-03-{rng.randint(1, 7):02d}",
+            time=f"{minute // 60:02d}:{minute % 60:02d}" if timed else "",
+        ))
+    return owner
+
+
+def pairwise_conflicts(owner: Owner) -> int:
+    """Count overlapping pairs the O(n^2) way, as a reference for the sweep."""
+    timed = [(t.date, IntervalIndex.span(t)) for t in owner.get_all_tasks() if t.time]
+    count = 0
+    for i, (day_a, (start_a, end_a)) in enumerate(timed):
+        for day_b, (start_b, end_b) in timed[i + 1:]:
+            if day_a == day_b and start_a < end_b and start_b < end_a:
+                count += 1
+    return count
+
+
+def main() -> None:
+    print(f"{'tasks':>8} {'conflicts':>10} {'indexed (ms)':>13} {'pairwise (ms)':>14}")
+    for n in SIZES:
+        owner = make_owner(n)
+        scheduler = Scheduler(owner=owner)
+
+        start = time.perf_counter()
+        conflicts = sum(1 for _ in scheduler.iter_conflicts())
+        indexed_ms = (time.perf_counter() - start) * 1000
+
+        pairwise = "skipped"
+        if n <= PAIRWISE_LIMIT:
+            start = time.perf_counter()
+            assert pairwise_conflicts(owner) == conflicts
+            pairwise = f"{(time.perf_counter() - start) * 1000:.1f}"
+
+        print(f"{n:>8} {conflicts:>10} {indexed_ms:>13.1f} {pairwise:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time scans before and after compacting a year of recurring completions.
+
+A household with 30 daily tasks completes each one every day for DAYS days via
+Scheduler.mark_task_complete, which leaves a finished instance behind each time.
+The script times a schedule build and conflict sweep over the grown task lists,
+compacts them into the archive, and times the same again. It also compares reading
+30-day stats from the ring buffer with recomputing them from the log.
+
+Run with:  python benchmarks/bench_history.py
+"""
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Scheduler, Task  # noqa: E402
+from pawpal_history import CompletionLog  # noqa: E402
+
+START = date(2026, 1, 1)
+DAYS = 365
+TASKS = 30
+CATEGORIES = ["exercise", "feeding", "meds", "grooming", "enrichment"]
+
+
+def scan_seconds(owner: Owner) -> float:
+    """Return the time for one schedule build plus a conflict sweep."""
+    start = time.perf_counter()
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule()
+    scheduler.detect_conflicts()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    pets = [Pet(name=f"Pet {i}", species="dog") for i in range(3)]
+    for i in range(TASKS):
+        pets[i % 3].add_task(Task(title=f"Task {i}", duration_minutes=5 + i % 6 * 5, priority=1 + i % 3,
+                                  category=CATEGORIES[i % 5], frequency="daily", date=START.isoformat(),
+                                  time=f"{7 + i % 12:02d}:{i % 4 * 15:02d}"))
+    owner = Owner(name="Jordan", available_minutes=240, pets=pets)
+    today = START
+    log = CompletionLog(owner, clock=lambda: today)
+    scheduler = Scheduler(owner=owner)
+    for n in range(DAYS):
+        today = START + timedelta(days=n)
+        for task in [t for t in owner.query(date=today.isoformat(), completed=False)]:
+            scheduler.mark_task_complete(task)
+
+    before = len(owner.get_all_tasks())
+    before_s = scan_seconds(owner)
+    start = time.perf_counter()
+    archived = log.compact(today)
+    compact_s = time.perf_counter() - start
+    after_s = scan_seconds(owner)
+    print(f"completions logged:   {len(log):,}")
+    print(f"tasks before compact: {before:,}  (build + conflicts {before_s * 1000:.1f} ms)")
+    print(f"tasks after compact:  {len(owner.get_all_tasks()):,}  (build + conflicts {after_s * 1000:.1f} ms)")
+    print(f"archived {archived:,} tasks in {compact_s * 1000:.1f} ms")
+
+    stats = log.stats[30]
+    start = time.perf_counter()
+    for _ in range(1000):
+        ring = stats.minutes_by_category(today)
+    ring_s = (time.perf_counter() - start) / 1000
+    start = time.perf_counter()
+    cutoff = (today - timedelta(days=29)).isoformat()
+    rescan = {}
+    for completion in log:
+        if completion.day >= cutoff:
+            rescan[completion.category] = rescan.get(completion.category, 0) + completion.minutes
+    rescan_s = time.perf_counter() - start
+    assert ring == rescan
+    print(f"30-day minutes by category: ring {ring_s * 1e6:.1f} us, log rescan {rescan_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Time Scheduler.plan_range over a 90-day horizon for growing accounts.
+
+Run with:  python benchmarks/bench_plan_range.py
+"""
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task, Scheduler  # noqa: E402
+
+SIZES = [100, 1_000, 5_000]
+START = date(2026, 3, 1)
+DAYS = 90
+
+
+def make_owner(n_tasks: int, seed: int = 42) -> Owner:
+    """Build an owner with ten pets and a mix of daily, weekly and one-off tasks."""
+    rng = random.Random(seed)
+    owner = Owner(name="Kennel", available_minutes=480, daily_minutes={"sunday": 240})
+    pets = [Pet(name=f"Pet {i}", species="dog") for i in range(10)]
+    for pet in pets:
+        owner.add_pet(pet)
+    for i in range(n_tasks):
+        pets[i % len(pets)].add_task(Task(
+            title=f"Task {i}",
+            duration_minutes=rng.randint(5, 60),
+            priority=rng.randint(1, 3),
+            frequency=rng.choice(["daily", "weekly", "weekly", "", ""]),
+            date=(START + timedelta(days=rng.randint(0, DAYS - 1))).isoformat(),
+        ))
+    return owner
+
+
+def main() -> None:
+    print(f"{'tasks':>6} {'days':>5} {'scheduled':>10} {'carried at end':>15} {'ms':>9}")
+    for n in SIZES:
+        scheduler = Scheduler(owner=make_owner(n))
+        start = time.perf_counter()
+        plans = scheduler.plan_range(START, START + timedelta(days=DAYS - 1))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        scheduled = sum(len(p.scheduled) for p in plans)
+        print(f"{n:>6} {DAYS:>5} {scheduled:>10} {len(plans[-1].unscheduled):>15} {elapsed_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time a month view built from lazy recurrence rules against materialising every instance.
+
+Run with:  python benchmarks/bench_recurrence.py
+"""
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task, Scheduler  # noqa: E402
+
+SIZES = [100, 1_000, 5_000]
+START, END = date(2026, 3, 1), date(2026, 3, 31)
+
+
+def make_owner(n_tasks: int, seed: int = 42) -> Owner:
+    """Build an owner whose tasks are mostly daily or weekly rules."""
+    rng = random.Random(seed)
+    owner = Owner(name="Kennel", available_minutes=480)
+    pet = Pet(name="Mochi", species="dog")
+    owner.add_pet(pet)
+    for i in range(n_tasks):
+        pet.add_task(Task(
+            title=f"Task {i}",
+            duration_minutes=rng.randint(5, 60),
+            priority=rng.randint(1, 3),
+            frequency=rng.choice(["daily", "daily", "weekly", ""]),
+            date=(START - timedelta(days=rng.randint(0, 14))).isoformat(),
+        ))
+    return owner
+
+
+def materialise(scheduler: Scheduler) -> int:
+    """Create one Task per due date with handle_recurring, as planning used to require."""
+    created = 0
+    for task in scheduler.owner.get_all_tasks():
+        current = task
+        while current.frequency and current.date <= END.isoformat():
+            if current.date >= START.isoformat():
+                created += 1
+            current = scheduler.handle_recurring(current)
+        if not task.frequency and START.isoformat() <= task.date <= END.isoformat():
+            created += 1
+    return created
+
+
+def main() -> None:
+    print(f"{'rules':>6} {'occurrences':>12} {'lazy (ms)':>10} {'materialised (ms)':>18}")
+    for n in SIZES:
+        scheduler = Scheduler(owner=make_owner(n))
+        start = time.perf_counter()
+        lazy = sum(1 for _ in scheduler.iter_occurrences(START, END))
+        lazy_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        eager = materialise(scheduler)
+        eager_ms = (time.perf_counter() - start) * 1000
+        assert lazy == eager
+        print(f"{n:>6} {lazy:>12} {lazy_ms:>10.1f} {eager_ms:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
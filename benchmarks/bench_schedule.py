@@ -0,0 +1,83 @@
+"""Compare greedy and optimal build_schedule on plan quality and latency, and time
+live (incremental) schedule updates against rebuilding after every edit.
+
+Run with:  python benchmarks/bench_schedule.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task, Scheduler  # noqa: E402
+
+SIZES = [10, 25, 50, 100, 1_000, 10_000]
+BUDGET = 480
+
+
+def make_owner(n_tasks: int, seed: int = 42) -> Owner:
+    """Build an owner with a full-day budget and n_tasks tasks of mixed length and priority."""
+    rng = random.Random(seed)
+    owner = Owner(name="Kennel", available_minutes=BUDGET)
+    pet = Pet(name="Mochi", species="dog")
+    owner.add_pet(pet)
+    for i in range(n_tasks):
+        pet.add_task(Task(
+            title=f"Task {i}",
+            duration_minutes=rng.choice([5, 10, 15, 20, 30, 45, 60, 90]) + rng.randint(0, 4),
+            priority=rng.randint(1, 3),
+        ))
+    return owner
+
+
+def run(owner: Owner, mode: str):
+    """Build one schedule and return (ms, minutes used, weighted value, mode that ran)."""
+    scheduler = Scheduler(owner=owner)
+    start = time.perf_counter()
+    scheduler.build_schedule(mode=mode)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    used = sum(t.duration_minutes for t in scheduler.schedule)
+    value = sum(t.priority * t.duration_minutes for t in scheduler.schedule)
+    return elapsed_ms, used, value, scheduler.mode_used
+
+
+def incremental_vs_rebuild(owner: Owner, edits: int = 200):
+    """Return per-edit ms for (a live scheduler following add_task, a rebuild after each add)."""
+    rng = random.Random(7)
+    pet = owner.pets[0]
+    new_tasks = [Task(title=f"Extra {i}", duration_minutes=rng.randint(5, 60),
+                      priority=rng.randint(1, 3)) for i in range(2 * edits)]
+    live = Scheduler(owner=owner)
+    live.build_schedule()
+    start = time.perf_counter()
+    for task in new_tasks[:edits]:
+        pet.add_task(task)
+        live.remaining_minutes
+    live_ms = (time.perf_counter() - start) * 1000 / edits
+
+    start = time.perf_counter()
+    for task in new_tasks[edits:]:
+        pet.add_task(task)
+        rebuilt = Scheduler(owner=owner)
+        rebuilt.build_schedule()
+    rebuild_ms = (time.perf_counter() - start) * 1000 / edits
+    return live_ms, rebuild_ms
+
+
+def main() -> None:
+    print(f"{'tasks':>7} {'mode':>8} {'ran':>8} {'ms':>9} {'minutes':>8} {'value':>7}")
+    for n in SIZES:
+        owner = make_owner(n)
+        for mode in ("greedy", "optimal"):
+            elapsed_ms, used, value, ran = run(owner, mode)
+            print(f"{n:>7} {mode:>8} {ran:>8} {elapsed_ms:>9.2f} {used:>5}/{BUDGET} {value:>7}")
+
+    print(f"\n{'tasks':>7} {'live ms/edit':>13} {'rebuild ms/edit':>16}")
+    for n in SIZES:
+        live_ms, rebuild_ms = incremental_vs_rebuild(make_owner(n), edits=min(200, 10 * n))
+        print(f"{n:>7} {live_ms:>13.3f} {rebuild_ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
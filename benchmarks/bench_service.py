@@ -0,0 +1,100 @@
+"""Load-test the async service over its local TCP server.
+
+Many clients fire a mix of schedule, conflict and occurrence requests at a handful
+of owners. Latency percentiles and throughput are reported for a baseline that
+computes each request inline on the event loop, and for the batching service.
+
+Run with:  python benchmarks/bench_service.py
+"""
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task  # noqa: E402
+from pawpal_service import (PawPalClient, PawPalServer, PawPalService,  # noqa: E402
+                            run_batch, snapshot_owner)
+
+OWNERS = 4
+TASKS_PER_OWNER = 300
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 40
+
+
+def make_owner(n: int, rng: random.Random) -> Owner:
+    """Build an owner with two pets and TASKS_PER_OWNER dated, timed tasks."""
+    owner = Owner(name=f"Owner {n}", available_minutes=rng.randint(60, 480))
+    pets = [Pet(name="Mochi", species="dog"), Pet(name="Luna", species="cat")]
+    for pet in pets:
+        owner.add_pet(pet)
+    for i in range(TASKS_PER_OWNER):
+        minute = rng.randrange(6 * 60, 22 * 60)
+        pets[i % 2].add_task(Task(
+            title=f"Task {i}", duration_minutes=rng.randint(5, 60), priority=rng.randint(1, 3),
+            frequency=rng.choice(["", "daily", "weekly"]),
+            date=f"2026-03-{rng.randint(1, 28):02d}", time=f"{minute // 60:02d}:{minute % 60:02d}",
+        ))
+    return owner
+
+
+class InlineService(PawPalService):
+    """Baseline: answer every request on the event loop as it arrives, no batching."""
+
+    async def _submit(self, name, key):
+        self.stats.requests += 1
+        ok, value = run_batch(snapshot_owner(self.owners[name]), [key])[0]
+        if not ok:
+            raise value
+        return value
+
+
+async def client_load(port: int, owners, rng: random.Random, latencies) -> None:
+    """Send REQUESTS_PER_CLIENT requests one after another, recording each latency."""
+    async with PawPalClient(port=port) as client:
+        for _ in range(REQUESTS_PER_CLIENT):
+            owner = rng.choice(owners).name
+            kind = rng.random()
+            start = time.perf_counter()
+            if kind < 0.5:
+                await client.schedule(owner)
+            elif kind < 0.8:
+                await client.conflicts(owner)
+            else:
+                await client.occurrences(owner, "2026-03-01", "2026-03-07")
+            latencies.append(time.perf_counter() - start)
+
+
+async def run(service: PawPalService, owners):
+    """Drive CLIENTS concurrent clients against service and return (latencies, seconds)."""
+    latencies = []
+    async with service, PawPalServer(service) as server:
+        start = time.perf_counter()
+        await asyncio.gather(*(client_load(server.port, owners, random.Random(c), latencies)
+                               for c in range(CLIENTS)))
+        return latencies, time.perf_counter() - start
+
+
+def main() -> None:
+    rng = random.Random(42)
+    owners = [make_owner(n, rng) for n in range(OWNERS)]
+    total = CLIENTS * REQUESTS_PER_CLIENT
+    print(f"{CLIENTS} clients x {REQUESTS_PER_CLIENT} requests, {OWNERS} owners x {TASKS_PER_OWNER} tasks")
+    print(f"{'service':<24} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8} {'computed':>9}")
+    for label, service in (
+        ("inline (no batching)", InlineService(owners)),
+        ("batched, window 0 ms", PawPalService(owners, batch_window=0)),
+        ("batched, window 2 ms", PawPalService(owners, batch_window=0.002)),
+    ):
+        latencies, seconds = asyncio.run(run(service, owners))
+        cuts = statistics.quantiles(latencies, n=100)
+        jobs = service.stats.jobs or service.stats.requests
+        print(f"{label:<24} {cuts[49] * 1000:>8.1f} {cuts[98] * 1000:>8.1f} "
+              f"{total / seconds:>8,.0f} {jobs:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Time slot packing on dense days against a linear gap scan.
+
+Each day has n tasks: a fifth are one-minute checks at fixed times, which cut the
+06:00-22:00 window into many small gaps, and the rest are flexible 1-10 minute
+tasks. Besides the full plan_day, the flexible tasks are packed into the same
+gaps twice, once with FreeIntervals and once by scanning a plain gap list, to
+show what the (length, start) index saves as the gap count grows.
+
+Run with:  python benchmarks/bench_slots.py
+"""
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task, parse_minute_of_day  # noqa: E402
+from pawpal_slots import FreeIntervals, SlotPlanner  # noqa: E402
+
+SIZES = [100, 300, 1_000, 3_000, 10_000]
+DAY = date(2026, 3, 2)
+REPEATS = 5
+
+
+def make_owner(n_tasks: int, seed: int = 42) -> Owner:
+    """Build an owner whose n_tasks tasks all fall on DAY."""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(n_tasks):
+        fixed = rng.random() < 0.2
+        minute = rng.randrange(6 * 60, 22 * 60 - 10)
+        tasks.append(Task(
+            title=f"Task {i}", duration_minutes=1 if fixed else rng.randint(1, 10),
+            priority=rng.randint(1, 3),
+            date=DAY.isoformat(), time=f"{minute // 60:02d}:{minute % 60:02d}" if fixed else "",
+        ))
+    return Owner(name="Kennel", available_minutes=24 * 60,
+                 pets=[Pet(name="Mochi", species="dog", tasks=tasks)])
+
+
+def free_after_fixed(owner: Owner, planner: SlotPlanner):
+    """Return the free (start, end) ranges left once the fixed-time tasks are reserved."""
+    free = FreeIntervals(planner.windows)
+    for task in owner.get_all_tasks():
+        if task.time:
+            start = parse_minute_of_day(task.time)
+            free.reserve(start, start + task.duration_minutes)
+    return list(free)
+
+
+def bisect_pack(gaps, durations) -> int:
+    """Place durations best-fit using FreeIntervals; return how many fit."""
+    free = FreeIntervals(gaps)
+    placed = 0
+    for duration in durations:
+        start = free.best_fit(duration)
+        if start is not None:
+            free.reserve(start, start + duration)
+            placed += 1
+    return placed
+
+
+def linear_pack(gaps, durations) -> int:
+    """Reference: the same best-fit placement, scanning a plain gap list each time."""
+    gaps = list(gaps)
+    placed = 0
+    for duration in durations:
+        best = None
+        for i, (start, end) in enumerate(gaps):
+            length = end - start
+            if length >= duration and (best is None or length < gaps[best][1] - gaps[best][0]):
+                best = i
+        if best is None:
+            continue
+        start, end = gaps[best]
+        if end - start == duration:
+            del gaps[best]
+        else:
+            gaps[best] = (start + duration, end)
+        placed += 1
+    return placed
+
+
+def best_of(fn):
+    """Return (fastest seconds, result) over REPEATS runs."""
+    best, result = float("inf"), None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    print(f"{'tasks/day':>9} {'placed':>7} {'free gaps':>10} {'plan_day (ms)':>14} "
+          f"{'bisect pack (ms)':>17} {'linear pack (ms)':>17}")
+    for size in SIZES:
+        owner = make_owner(size)
+        planner = SlotPlanner(owner)
+        seconds, itinerary = best_of(lambda: planner.plan_day(DAY))
+        gaps = free_after_fixed(owner, planner)
+        # Pack every flexible task with no budget limit, so both packers do the full job.
+        durations = [t.duration_minutes for t in owner.get_all_tasks() if not t.time]
+        bisect_s, bisect_placed = best_of(lambda: bisect_pack(gaps, durations))
+        linear_s, linear_placed = best_of(lambda: linear_pack(gaps, durations))
+        assert bisect_placed == linear_placed
+        print(f"{size:>9,} {len(itinerary.slots):>7,} {len(gaps):>10,} {seconds * 1000:>14.2f} "
+              f"{bisect_s * 1000:>17.2f} {linear_s * 1000:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
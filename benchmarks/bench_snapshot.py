@@ -0,0 +1,66 @@
+"""Measure snapshot encode/decode throughput and file size for both modes.
+
+Run with:  python benchmarks/bench_snapshot.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task  # noqa: E402
+from pawpal_snapshot import MODES, iter_tasks, read_snapshot, write_snapshot  # noqa: E402
+
+N = 100_000
+PETS = 20
+CATEGORIES = ["exercise", "feeding", "meds", "grooming", "enrichment"]
+
+
+def make_owner(n: int, seed: int = 42) -> Owner:
+    """Build an owner whose pets share n realistic tasks."""
+    rng = random.Random(seed)
+    tasks = [[] for _ in range(PETS)]
+    for i in range(n):
+        minute = rng.randrange(6 * 60, 22 * 60)
+        tasks[i % PETS].append(Task(
+            title=f"Task {i % 50}",
+            duration_minutes=rng.randint(5, 60),
+            priority=rng.randint(1, 3),
+            category=rng.choice(CATEGORIES),
+            frequency=rng.choice(["", "daily", "weekly"]),
+            date=f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            time=f"{minute // 60:02d}:{minute % 60:02d}",
+        ))
+    pets = [Pet(name=f"Pet {i}", species="dog", tasks=t) for i, t in enumerate(tasks)]
+    return Owner(name="Kennel", available_minutes=480, pets=pets)
+
+
+def main() -> None:
+    owner = make_owner(N)
+    print(f"{N:,} tasks  {'MiB':>6} {'encode/s':>10} {'stream/s':>10} {'load/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in MODES:
+            path = os.path.join(tmp, f"snapshot.{mode}")
+            start = time.perf_counter()
+            write_snapshot(owner, path, mode=mode)
+            encode = time.perf_counter() - start
+
+            start = time.perf_counter()
+            count = sum(1 for _ in iter_tasks(path))
+            stream = time.perf_counter() - start
+            assert count == N
+
+            start = time.perf_counter()
+            loaded = read_snapshot(path)
+            load = time.perf_counter() - start
+            assert len(loaded.get_all_tasks()) == N
+
+            size = os.path.getsize(path) / 2 ** 20
+            print(f"{mode:<11} {size:>6.1f} {N / encode:>10,.0f} {N / stream:>10,.0f} {N / load:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
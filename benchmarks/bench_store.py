@@ -0,0 +1,97 @@
+"""Compare memory use and iteration speed of task layouts.
+
+Layouts: the original dict-backed Task with a uuid4 string id, the slotted Task with
+an integer id, and the columnar TaskStore.
+
+Run with:  python benchmarks/bench_store.py
+"""
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Task  # noqa: E402
+from pawpal_store import TaskStore  # noqa: E402
+
+N = 200_000
+CATEGORIES = ["exercise", "feeding", "meds", "grooming", "enrichment"]
+
+
+@dataclass
+class LegacyTask:
+    """The pre-slots Task layout, kept here only as a baseline."""
+    title: str
+    duration_minutes: int
+    priority: int
+    id: str = field(default_factory=lambda: str(uuid4()))
+    category: str = ""
+    notes: str = ""
+    completed: bool = False
+    frequency: str = ""
+    date: str = ""
+    time: str = ""
+
+
+def rows(n: int, seed: int = 42):
+    """Yield keyword arguments for n realistic recurring-task instances."""
+    rng = random.Random(seed)
+    for i in range(n):
+        minute = rng.randrange(6 * 60, 22 * 60)
+        yield dict(
+            title=f"Task {i % 50}",
+            duration_minutes=rng.randint(5, 60),
+            priority=rng.randint(1, 3),
+            category=rng.choice(CATEGORIES),
+            frequency=rng.choice(["", "daily", "weekly"]),
+            date=f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            time=f"{minute // 60:02d}:{minute % 60:02d}",
+        )
+
+
+def measure(build):
+    """Return (MiB allocated, build seconds, result) for build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / 2 ** 20, elapsed, result
+
+
+def main() -> None:
+    specs = list(rows(N))
+    legacy_mb, _, legacy = measure(lambda: [LegacyTask(**kw) for kw in specs])
+    slotted_mb, _, slotted = measure(lambda: [Task(**kw) for kw in specs])
+
+    def build_store():
+        store = TaskStore()
+        for task in slotted:
+            store.append(task, "Mochi")
+        return store
+
+    store_mb, _, store = measure(build_store)
+
+    def timed_sum(fn):
+        start = time.perf_counter()
+        total = fn()
+        return (time.perf_counter() - start) * 1000, total
+
+    legacy_ms, a = timed_sum(lambda: sum(t.duration_minutes for t in legacy if t.priority == 3))
+    slotted_ms, b = timed_sum(lambda: sum(t.duration_minutes for t in slotted if t.priority == 3))
+    store_ms, c = timed_sum(lambda: sum(d for d, p in zip(store.durations, store.priorities) if p == 3))
+    assert a == b == c
+
+    print(f"{N:,} tasks   {'MiB':>8} {'high-priority minutes scan (ms)':>32}")
+    print(f"{'legacy Task':<14} {legacy_mb:>8.1f} {legacy_ms:>32.1f}")
+    print(f"{'slotted Task':<14} {slotted_mb:>8.1f} {slotted_ms:>32.1f}")
+    print(f"{'TaskStore':<14} {store_mb:>8.1f} {store_ms:>32.1f}")
+
+
+if __name__ == "__main__":
+    main()
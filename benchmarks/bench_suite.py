@@ -0,0 +1,173 @@
+"""Time the main Scheduler and Owner operations across workload sizes, with baselines.
+
+Each case runs against a seeded owner from workload.make_owner at every size (10^2
+to 10^6 tasks by default) and records the best of a few runs. Results can be saved as
+a JSON baseline and later runs compared against it; the script exits with status 1
+if any case got slower than the baseline by more than --threshold.
+
+Run with:  python benchmarks/bench_suite.py [--quick] [--save FILE] [--compare FILE]
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Scheduler  # noqa: E402
+from workload import make_owner  # noqa: E402
+
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+QUICK_SIZES = [100, 1_000, 10_000]
+RECURRING_CALLS = 1_000
+TARGET_SECONDS = 0.5      # keep repeating a case until it has run about this long...
+MAX_REPEATS = 10          # ...or this many times, and keep the fastest run
+NOISE_FLOOR = 0.002       # differences below this many seconds never count as regressions
+
+
+def built(owner: Owner) -> Scheduler:
+    """Return a scheduler for owner with a greedy schedule already built."""
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule()
+    return scheduler
+
+
+def case_build_greedy(owner: Owner) -> Callable[[], object]:
+    """Build a greedy schedule from scratch."""
+    return lambda: Scheduler(owner=owner).build_schedule()
+
+
+def case_build_optimal(owner: Owner) -> Callable[[], object]:
+    """Build an optimal (knapsack) schedule from scratch."""
+    return lambda: Scheduler(owner=owner).build_schedule(mode="optimal")
+
+
+def case_detect_conflicts(owner: Owner) -> Callable[[], object]:
+    """List every overlapping pair of tasks."""
+    scheduler = Scheduler(owner=owner)
+    return scheduler.detect_conflicts
+
+
+def case_explain(owner: Owner) -> Callable[[], object]:
+    """Explain an already-built schedule."""
+    return built(owner).explain
+
+
+def case_get_unscheduled(owner: Owner) -> Callable[[], object]:
+    """List the tasks an already-built schedule left out."""
+    return built(owner).get_unscheduled
+
+
+def case_filter_by_priority(owner: Owner) -> Callable[[], object]:
+    """Fetch every high-priority task."""
+    return lambda: owner.filter_by_priority(3)
+
+
+def case_handle_recurring(owner: Owner) -> Callable[[], object]:
+    """Create the next instance of RECURRING_CALLS recurring tasks."""
+    scheduler = Scheduler(owner=owner)
+    recurring = [t for t in owner.get_all_tasks() if t.frequency][:RECURRING_CALLS]
+    return lambda: [scheduler.handle_recurring(t) for t in recurring]
+
+
+CASES: Dict[str, Callable[[Owner], Callable[[], object]]] = {
+    "build_schedule[greedy]": case_build_greedy,
+    "build_schedule[optimal]": case_build_optimal,
+    "detect_conflicts": case_detect_conflicts,
+    "explain": case_explain,
+    "get_unscheduled": case_get_unscheduled,
+    "filter_by_priority": case_filter_by_priority,
+    f"handle_recurring x{RECURRING_CALLS}": case_handle_recurring,
+}
+
+
+def best_time(fn: Callable[[], object]) -> float:
+    """Return the fastest of up to MAX_REPEATS runs of fn, stopping after TARGET_SECONDS.
+
+    The garbage collector is paused while fn runs, as timeit does, so collections
+    triggered by earlier allocations do not land in a random run.
+    """
+    best = float("inf")
+    spent = 0.0
+    for _ in range(MAX_REPEATS):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= TARGET_SECONDS:
+            break
+    return best
+
+
+def run_suite(sizes, cases) -> dict:
+    """Time every case at every size and return {"meta": ..., "results": {case: {size: s}}}."""
+    results: Dict[str, Dict[str, float]] = {name: {} for name in cases}
+    for size in sizes:
+        owner = make_owner(size)
+        for name in cases:
+            seconds = best_time(CASES[name](owner))
+            results[name][str(size)] = seconds
+            print(f"{name:<26} {size:>9,} {seconds * 1000:>11.2f} ms", flush=True)
+    meta = {"python": platform.python_version(), "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Print current vs baseline for shared cases and return the regressions found."""
+    regressions = []
+    print(f"\n{'case':<26} {'tasks':>9} {'baseline ms':>12} {'now ms':>10} {'change':>8}")
+    for name, by_size in current["results"].items():
+        for size, seconds in by_size.items():
+            before = baseline["results"].get(name, {}).get(size)
+            if before is None:
+                continue
+            change = seconds / before - 1 if before else 0.0
+            slower = change > threshold and seconds - before > NOISE_FLOOR
+            flag = "  REGRESSION" if slower else ""
+            print(f"{name:<26} {int(size):>9,} {before * 1000:>12.2f} {seconds * 1000:>10.2f} "
+                  f"{change:>+8.0%}{flag}")
+            if slower:
+                regressions.append((name, size, change))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help=f"only run sizes {QUICK_SIZES}")
+    parser.add_argument("--sizes", type=int, nargs="+", help="explicit task counts to run")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="only run these cases")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="allowed slowdown before a case fails, as a fraction (default 0.5)")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else SIZES)
+    current = run_suite(sizes, args.cases or list(CASES))
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"\nSaved baseline to {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+        print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Time team assignment against a scan over every caregiver per task.
+
+Each day has n tasks shared by c caregivers on staggered shifts; a third of the
+caregivers hold one skill (meds or grooming). Both sides apply the same rules and
+produce the same plan; the reference just finds the least-loaded caregiver by
+checking all of them for every task.
+
+Run with:  python benchmarks/bench_team.py
+"""
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Owner, Pet, Task  # noqa: E402
+from pawpal_slots import FreeIntervals, parse_window, split_fixed  # noqa: E402
+from pawpal_team import SKILLED_CATEGORIES, Caregiver, TeamPlanner  # noqa: E402
+
+SIZES = [(50, 2_000), (100, 10_000), (300, 30_000)]   # (caregivers, tasks)
+DAY = date(2026, 3, 2)
+CATEGORIES = ["exercise", "feeding", "enrichment", "meds", "grooming"]
+SHIFTS = [("06:00", "14:00"), ("10:00", "18:00"), ("14:00", "22:00")]
+
+
+def make_owner(n_tasks: int, seed: int = 42) -> Owner:
+    """Build a shop whose n_tasks tasks all fall on DAY, a quarter of them at fixed times."""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(n_tasks):
+        minute = rng.randrange(6 * 60, 21 * 60)
+        tasks.append(Task(
+            title=f"Task {i}", duration_minutes=rng.choice([5, 10, 15, 20, 30]),
+            priority=rng.randint(1, 3), category=rng.choice(CATEGORIES), date=DAY.isoformat(),
+            time=f"{minute // 60:02d}:{minute % 60:02d}" if rng.random() < 0.25 else "",
+        ))
+    return Owner(name="Shop", available_minutes=0, pets=[Pet(name="Boarders", species="other", tasks=tasks)])
+
+
+def make_team(n: int) -> list:
+    """Return n caregivers on rotating shifts with a 6-8 hour budget."""
+    skills = [(), ("meds",), ("grooming",)]
+    return [Caregiver(f"C{i}", 360 + 60 * (i % 3), skills=skills[i % 3], windows=[SHIFTS[i % 3]])
+            for i in range(n)]
+
+
+def scan_plan(owner: Owner, team: list) -> int:
+    """Reference: the same rules, picking each caregiver by scanning the whole team."""
+    from pawpal_system import Scheduler
+
+    fixed, flexible = split_fixed(Scheduler(owner=owner).occurrences_on(DAY))
+    free = [FreeIntervals(parse_window(w) for w in c.windows) for c in team]
+    left = [c.available_minutes for c in team]
+    assigned = 0
+
+    def assign(task, span):
+        nonlocal assigned
+        skilled = task.category in SKILLED_CATEGORIES
+        best = None
+        for i, caregiver in enumerate(team):
+            if skilled and task.category not in caregiver.skills:
+                continue
+            if task.duration_minutes > left[i]:
+                continue
+            start = free[i].best_fit(task.duration_minutes) if span is None else (
+                span[0] if free[i].covers(*span) else None)
+            if start is None:
+                continue
+            load = 1.0 - left[i] / caregiver.available_minutes
+            if best is None or load < best[0]:
+                best = (load, i, start)
+        if best is not None:
+            _, i, start = best
+            free[i].reserve(start, span[1] if span else start + task.duration_minutes)
+            left[i] -= task.duration_minutes
+            assigned += 1
+
+    fixed.sort(key=lambda f: f[2].priority, reverse=True)
+    for start, end, task in fixed:
+        assign(task, (start, end))
+    flexible.sort(key=lambda t: (t.priority, t.duration_minutes), reverse=True)
+    for task in flexible:
+        assign(task, None)
+    return assigned
+
+
+def main() -> None:
+    print(f"{'caregivers':>10} {'tasks':>7} {'assigned':>9} {'heap (ms)':>10} {'scan (ms)':>10} "
+          f"{'load spread':>12}")
+    for n_caregivers, n_tasks in SIZES:
+        owner = make_owner(n_tasks)
+        team = make_team(n_caregivers)
+
+        start = time.perf_counter()
+        plan = TeamPlanner(owner, team).plan_day(DAY)
+        heap_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = scan_plan(owner, team)
+        scan_s = time.perf_counter() - start
+
+        assigned = n_tasks - len(plan.unassigned)
+        assert assigned == scanned
+        shares = [plan.minutes_for(c.name) / c.available_minutes for c in team]
+        print(f"{n_caregivers:>10,} {n_tasks:>7,} {assigned:>9,} {heap_s * 1000:>10.1f} "
+              f"{scan_s * 1000:>10.1f} {max(shares) - min(shares):>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
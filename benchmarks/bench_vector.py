@@ -0,0 +1,68 @@
+"""Time the NumPy batch path against per-owner Python loops over many accounts.
+
+For each workload the script builds ACCOUNTS owners, then does the same analytics
+pass both ways: a greedy schedule, the unscheduled tasks, high-priority tasks,
+tasks sorted by duration and conflicts for every owner. The Python side runs a
+Scheduler per owner; the NumPy side converts every task once into TaskArrays and
+answers each step for all owners together. The one-off conversion is timed
+separately, and the two sides' totals are checked against each other.
+
+Needs NumPy (pip install numpy).
+Run with:  python benchmarks/bench_vector.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Scheduler  # noqa: E402
+from pawpal_vector import TaskArrays  # noqa: E402
+from workload import make_owner  # noqa: E402
+
+WORKLOADS = [(2_000, 50), (500, 1_000), (20, 25_000)]   # (accounts, tasks per account)
+
+
+def python_pass(owners) -> tuple:
+    """Return (scheduled, unscheduled, high priority, sorted, conflicts) counts from Python loops."""
+    totals = [0] * 5
+    for owner in owners:
+        scheduler = Scheduler(owner=owner)
+        scheduler.build_schedule()
+        totals[0] += len(scheduler.schedule)
+        totals[1] += len(scheduler.get_unscheduled())
+        totals[2] += len(owner.filter_by_priority(3))
+        totals[3] += len(scheduler.sort_by_time(owner.get_all_tasks()))
+        totals[4] += len(scheduler.detect_conflicts())
+    return tuple(totals)
+
+
+def vector_pass(arrays: TaskArrays) -> tuple:
+    """Return the same counts from the vectorized batch path."""
+    return (len(arrays.schedule()), len(arrays.get_unscheduled()), len(arrays.filter_by_priority(3)),
+            len(arrays.sort_by_time()), len(arrays.conflicts()))
+
+
+def main() -> None:
+    print(f"{'accounts':>9} {'tasks':>10} {'convert (ms)':>13} {'numpy (ms)':>11} {'python (ms)':>12}")
+    for accounts, size in WORKLOADS:
+        owners = [make_owner(size, seed=seed) for seed in range(accounts)]
+
+        start = time.perf_counter()
+        arrays = TaskArrays.from_owners(owners)
+        convert_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vector = vector_pass(arrays)
+        vector_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        python = python_pass(owners)
+        python_s = time.perf_counter() - start
+        assert vector == python, (vector, python)
+        print(f"{accounts:>9,} {len(arrays):>10,} {convert_s * 1000:>13.1f} {vector_s * 1000:>11.1f} "
+              f"{python_s * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
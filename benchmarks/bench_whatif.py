@@ -0,0 +1,57 @@
+"""Time a budget sensitivity curve (1-480 minutes) against rescheduling per budget.
+
+The reference does what the app used to: set owner.available_minutes and run the
+greedy schedule again for every budget. WhatIf sorts the tasks once and answers
+all 480 budgets from prefix sums; a scenario that drops a few tasks and edits a few
+more reuses that order instead of copying the owner.
+
+Run with:  python benchmarks/bench_whatif.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pawpal_system import Scheduler  # noqa: E402
+from pawpal_whatif import DEFAULT_BUDGETS, WhatIf  # noqa: E402
+from workload import make_owner  # noqa: E402
+
+SIZES = [1_000, 10_000, 30_000]
+
+
+def main() -> None:
+    print(f"{'tasks':>9} {'curve (ms)':>11} {'scenario curve (ms)':>20} {'reschedule x480 (ms)':>21}")
+    for size in SIZES:
+        owner = make_owner(size)
+        what_if = WhatIf(owner)
+        what_if.order()                                    # the one-off sort, shared by every call
+
+        start = time.perf_counter()
+        curve = what_if.curve()
+        curve_s = time.perf_counter() - start
+
+        tasks = owner.get_all_tasks()
+        start = time.perf_counter()
+        scenario = what_if.scenario("variation")
+        for task in tasks[:10]:
+            scenario.drop(task)
+        for task in tasks[10:20]:
+            scenario.edit(task, priority=3)
+        what_if.curve(scenario)
+        scenario_s = time.perf_counter() - start
+
+        scheduler = Scheduler(owner=owner)
+        scheduler.build_schedule()
+        start = time.perf_counter()
+        minutes = []
+        for budget in DEFAULT_BUDGETS:
+            owner.available_minutes = budget
+            minutes.append(sum(t.duration_minutes for t in scheduler.schedule))
+        reschedule_s = time.perf_counter() - start
+        assert minutes == [p.minutes for p in curve]
+        print(f"{size:>9,} {curve_s * 1000:>11.1f} {scenario_s * 1000:>20.1f} {reschedule_s * 1000:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Seeded synthetic owners for benchmarks.
+
+make_owner(n_tasks, n_pets, seed) always builds the same owner for the same
+arguments. The distributions are loosely modelled on a real household:
+
+- durations cluster on round numbers (5-60 minutes, mostly 10-30);
+- most tasks are medium priority, with fewer high and low ones;
+- about 60% have a time slot, bunched around a morning and an evening peak;
+- roughly half recur (daily more often than weekly);
+- tasks spread over enough days to keep about TASKS_PER_DAY per day, so the
+  number of genuine time conflicts grows with the task count, not its square.
+"""
+import random
+from datetime import date, timedelta
+
+from pawpal_system import Owner, Pet, Task
+
+START = date(2026, 3, 1)
+TASKS_PER_DAY = 25
+DURATIONS = [5, 10, 15, 20, 30, 45, 60]
+DURATION_WEIGHTS = [10, 25, 25, 15, 15, 6, 4]
+PRIORITIES = [1, 2, 3]
+PRIORITY_WEIGHTS = [30, 45, 25]
+FREQUENCIES = ["", "daily", "weekly"]
+FREQUENCY_WEIGHTS = [50, 35, 15]
+TIMED_SHARE = 0.6
+PEAKS = [(7 * 60 + 30, 60), (18 * 60, 90)]   # (mean minute of day, spread) of each busy period
+CATEGORIES = ["exercise", "feeding", "meds", "grooming", "enrichment"]
+SPECIES = ["dog", "cat", "other"]
+
+
+def time_slot(rng: random.Random) -> str:
+    """Return an "HH:MM" near one of the daily peaks, or "" for an untimed task."""
+    if rng.random() >= TIMED_SHARE:
+        return ""
+    mean, spread = rng.choice(PEAKS)
+    minute = min(max(int(rng.gauss(mean, spread)), 0), 24 * 60 - 1)
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def make_tasks(n_tasks: int, rng: random.Random):
+    """Yield n_tasks tasks drawn from the workload distributions."""
+    days = max(n_tasks // TASKS_PER_DAY, 1)
+    durations = rng.choices(DURATIONS, DURATION_WEIGHTS, k=n_tasks)
+    priorities = rng.choices(PRIORITIES, PRIORITY_WEIGHTS, k=n_tasks)
+    frequencies = rng.choices(FREQUENCIES, FREQUENCY_WEIGHTS, k=n_tasks)
+    for i in range(n_tasks):
+        yield Task(
+            title=f"Task {i % 200}",
+            duration_minutes=durations[i],
+            priority=priorities[i],
+            category=rng.choice(CATEGORIES),
+            frequency=frequencies[i],
+            date=(START + timedelta(days=rng.randrange(days))).isoformat(),
+            time=time_slot(rng),
+        )
+
+
+def make_owner(n_tasks: int, n_pets: int = 3, seed: int = 42, available_minutes: int = 480) -> Owner:
+    """Build an owner with n_pets pets sharing n_tasks tasks round-robin."""
+    rng = random.Random(seed)
+    groups = [[] for _ in range(n_pets)]
+    for i, task in enumerate(make_tasks(n_tasks, rng)):
+        groups[i % n_pets].append(task)
+    pets = [Pet(name=f"Pet {i}", species=SPECIES[i % len(SPECIES)], tasks=tasks)
+            for i, tasks in enumerate(groups)]
+    return Owner(name="Benchmark", available_minutes=available_minutes, pets=pets)
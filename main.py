@@ -73,13 +73,14 @@ print("New recurring task date:", new_task.date)
 # --- Conflict Detection ---
 print("\n=== Conflict Detection ===")
 mochi.tasks[0].time = "09:00"
-luna.tasks[0].time = "09:00"
+luna.tasks[0].date = "2026-02-23"   # same day as the walk, so the two can clash
+luna.tasks[0].time = "09:10"        # starts while the 20-minute walk is still going
 
 conflicts = scheduler.detect_conflicts()
 
 if conflicts:
     print("Conflicts found:")
     for a, b in conflicts:
-        print(f" - {a.title} conflicts with {b.title}")
+        print(f" - {a.title} ({a.time}) overlaps {b.title} ({b.time})")
 else:
     print("No conflicts detected.")
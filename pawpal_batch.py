@@ -0,0 +1,186 @@
+import os
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pawpal_system import Owner, Pet, Scheduler, Task, greedy_fill, optimal_fill
+
+# (name, available_minutes, task ids, durations, priorities) with tasks in
+# Owner.get_all_tasks() order. Arrays pickle as raw bytes, so a payload costs
+# a few machine words per task instead of a pickled Task object graph.
+OwnerPayload = Tuple[str, int, array, array, array]
+
+
+def pack_owner(owner: Owner) -> OwnerPayload:
+    """Reduce an owner to the fields build_schedule reads."""
+    tasks = owner.get_all_tasks()
+    return (
+        owner.name,
+        owner.available_minutes,
+        array("q", (t.id for t in tasks)),
+        array("l", (t.duration_minutes for t in tasks)),
+        array("l", (t.priority for t in tasks)),
+    )
+
+
+def unpack_owner(payload: OwnerPayload) -> Owner:
+    """Rebuild a minimal owner (one pet, untitled tasks) that schedules like the original."""
+    name, minutes, ids, durations, priorities = payload
+    pet = Pet(name=name, species="other", tasks=[
+        Task(title="", duration_minutes=d, priority=p, id=i)
+        for i, d, p in zip(ids, durations, priorities)
+    ])
+    return Owner(name=name, available_minutes=minutes, pets=[pet])
+
+
+@dataclass
+class BatchResult:
+    """The schedule computed for one owner of a batch."""
+    index: int                         # position of the owner in the input
+    name: str
+    scheduled_ids: List[int]           # task ids in schedule order
+    remaining_minutes: int
+    mode_used: str
+    worker: int                        # process id that computed it
+
+
+@dataclass
+class WorkerStats:
+    """Throughput counters for one worker process."""
+    owners: int = 0
+    tasks: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def owners_per_second(self) -> float:
+        """Return owners scheduled per second of busy time."""
+        return self.owners / self.busy_seconds if self.busy_seconds else 0.0
+
+
+def schedule_payload(payload: OwnerPayload, mode: str = "greedy") -> Tuple[List[int], int, str]:
+    """Schedule a packed owner straight from its columns.
+
+    Returns (scheduled task ids, remaining minutes, mode used), exactly what
+    Scheduler.build_schedule would produce, without rebuilding Task objects.
+    """
+    _, minutes, ids, durations, priorities = payload
+    budget = max(minutes, 0)
+    order = sorted(range(len(ids)), key=priorities.__getitem__, reverse=True)
+    ordered_durations = [durations[i] for i in order]
+    picked = None
+    if mode == "optimal":
+        picked = optimal_fill(ordered_durations, [priorities[i] for i in order], budget,
+                              Scheduler.OPTIMAL_MAX_CELLS)
+    mode_used = "optimal" if picked is not None else "greedy"
+    if picked is None:
+        picked = greedy_fill(ordered_durations, budget)
+    used = sum(ordered_durations[i] for i in picked)
+    return [ids[order[i]] for i in picked], budget - used, mode_used
+
+
+def _schedule_chunk(chunk: List[Tuple[int, OwnerPayload]], mode: str) -> Tuple[int, List[BatchResult], int, float]:
+    """Schedule a chunk of packed owners; runs inside a worker process."""
+    start = time.perf_counter()
+    pid = os.getpid()
+    results = []
+    tasks = 0
+    for index, payload in chunk:
+        scheduled_ids, remaining, mode_used = schedule_payload(payload, mode)
+        tasks += len(payload[2])
+        results.append(BatchResult(
+            index=index,
+            name=payload[0],
+            scheduled_ids=scheduled_ids,
+            remaining_minutes=remaining,
+            mode_used=mode_used,
+            worker=pid,
+        ))
+    return pid, results, tasks, time.perf_counter() - start
+
+
+class BatchScheduler:
+    """Schedule many owners across a process pool.
+
+    Owners are packed into compact payloads in the parent, sent to workers in chunks,
+    and yielded back as results arrive. At most two chunks per worker are in flight,
+    counting, in ordered runs, finished chunks still waiting for an earlier one, so a
+    huge input iterable is never read into memory all at once.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 64, mode: str = "greedy"):
+        """Configure the pool size (0 runs inline), owners per chunk, and schedule mode."""
+        if mode not in Scheduler.SCHEDULE_MODES:
+            raise ValueError(f"Unknown schedule mode {mode!r}; expected one of {Scheduler.SCHEDULE_MODES}")
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = max(chunk_size, 1)
+        self.mode = mode
+        self.stats: Dict[int, WorkerStats] = {}
+
+    def _chunks(self, owners: Iterable[Union[Owner, OwnerPayload]]) -> Iterator[List[Tuple[int, OwnerPayload]]]:
+        """Pack owners lazily and group them into numbered chunks."""
+        packed = (
+            (i, pack_owner(o) if isinstance(o, Owner) else o)
+            for i, o in enumerate(owners)
+        )
+        while True:
+            chunk = list(islice(packed, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _record(self, pid: int, results: List[BatchResult], tasks: int, seconds: float) -> None:
+        """Add one finished chunk to the per-worker counters."""
+        stats = self.stats.setdefault(pid, WorkerStats())
+        stats.owners += len(results)
+        stats.tasks += tasks
+        stats.busy_seconds += seconds
+
+    def run(self, owners: Iterable[Union[Owner, OwnerPayload]], ordered: bool = False) -> Iterator[BatchResult]:
+        """Yield a BatchResult per owner, as soon as each is ready or in input order."""
+        self.stats = {}
+        if self.workers <= 0:
+            for chunk in self._chunks(owners):
+                pid, results, tasks, seconds = _schedule_chunk(chunk, self.mode)
+                self._record(pid, results, tasks, seconds)
+                yield from results
+            return
+
+        chunks = self._chunks(owners)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending: Dict[Future, int] = {}
+            finished: Dict[int, List[BatchResult]] = {}
+            next_submit = next_yield = 0
+            exhausted = False
+            while True:
+                while not exhausted:
+                    # Ordered runs hold finished chunks until the earlier ones arrive; count them.
+                    in_flight = next_submit - next_yield if ordered else len(pending)
+                    if in_flight >= 2 * self.workers:
+                        break
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    pending[pool.submit(_schedule_chunk, chunk, self.mode)] = next_submit
+                    next_submit += 1
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    number = pending.pop(future)
+                    pid, results, tasks, seconds = future.result()
+                    self._record(pid, results, tasks, seconds)
+                    if not ordered:
+                        yield from results
+                    else:
+                        finished[number] = results
+                while next_yield in finished:
+                    yield from finished.pop(next_yield)
+                    next_yield += 1
+
+    def throughput(self) -> Dict[int, float]:
+        """Return owners per busy second for each worker of the last run."""
+        return {pid: stats.owners_per_second for pid, stats in self.stats.items()}
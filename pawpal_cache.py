@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Tuple, TypeVar
+
+from pawpal_system import Owner
+
+T = TypeVar("T")
+
+
+def owner_key(owner: Owner) -> Tuple[int, int, int]:
+    """Return a cheap key that changes whenever anything a schedule depends on changes.
+
+    Owner.version counts pet and task events; the budget is a plain field with no
+    event, so it is part of the key too.
+    """
+    return id(owner), owner.version, owner.available_minutes
+
+
+@dataclass
+class CacheStats:
+    """Hit, miss and eviction counters for a RenderCache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RenderCache:
+    """A bounded least-recently-used cache for values derived from an owner.
+
+    Keys should include owner_key(owner) so edits invalidate naturally: stale entries
+    are never read again and age out once max_entries is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """Create an empty cache holding at most max_entries values."""
+        self.max_entries = max(max_entries, 1)
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the value cached under key, calling compute() to fill it on a miss."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.stats.misses += 1
+            value = self._entries[key] = compute()
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+            return value
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value; counters are kept."""
+        self._entries.clear()
@@ -0,0 +1,84 @@
+"""Schedule an owner saved with pawpal_snapshot and print the plan.
+
+Only the scheduling core and the snapshot reader are imported up front; the slot
+planner is loaded if --day asks for it, and nothing from the Streamlit app is.
+
+Run with:  python pawpal_cli.py SNAPSHOT [--mode optimal] [--minutes 90] [--explain] [--conflicts]
+"""
+import argparse
+import sys
+from datetime import date
+from typing import List, Optional, TextIO
+
+from pawpal_snapshot import read_snapshot
+from pawpal_system import PRIORITY_LABELS, Owner, Scheduler
+
+
+def print_schedule(owner: Owner, scheduler: Scheduler, out: TextIO) -> None:
+    """Print the scheduled and skipped tasks, as main.py does."""
+    print(f"=== Today's Schedule for {owner.name} ===", file=out)
+    print(f"Time budget: {owner.available_minutes} minutes\n", file=out)
+    if scheduler.schedule:
+        print("Scheduled tasks:", file=out)
+        for task in scheduler.schedule:
+            label = PRIORITY_LABELS.get(task.priority, "?")
+            print(f"  - [{label}] {task.title} ({task.duration_minutes} min)", file=out)
+    else:
+        print("  No tasks could be scheduled.", file=out)
+    unscheduled = scheduler.get_unscheduled()
+    if unscheduled:
+        print("\nSkipped (not enough time):", file=out)
+        for task in unscheduled:
+            print(f"  - {task.title} ({task.duration_minutes} min)", file=out)
+
+
+def main(argv: Optional[List[str]] = None, out: TextIO = sys.stdout) -> int:
+    """Run the CLI on argv, printing to out; return 0, or 2 if the snapshot cannot be read."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("snapshot", help="file written by pawpal_snapshot.write_snapshot")
+    parser.add_argument("--mode", choices=Scheduler.SCHEDULE_MODES, default="greedy")
+    parser.add_argument("--minutes", type=int, help="override the owner's time budget")
+    parser.add_argument("--explain", type=int, nargs="?", const=20, metavar="N",
+                        help="print the first N explanations (default 20)")
+    parser.add_argument("--conflicts", action="store_true", help="list overlapping tasks")
+    parser.add_argument("--day", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="also print a timed itinerary for this day")
+    args = parser.parse_args(argv)
+
+    try:
+        owner = read_snapshot(args.snapshot)
+    except (OSError, ValueError) as exc:
+        print(f"Could not read {args.snapshot}: {exc}", file=sys.stderr)
+        return 2
+    if args.minutes is not None:
+        owner.available_minutes = args.minutes
+
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule(mode=args.mode)
+    print_schedule(owner, scheduler, out)
+
+    if args.explain:
+        print("\nExplanations:", file=out)
+        for line in scheduler.explain(limit=args.explain):
+            print(f"  {line}", file=out)
+
+    if args.conflicts:
+        conflicts = scheduler.detect_conflicts()
+        print(f"\nConflicts: {len(conflicts)}", file=out)
+        for a, b in conflicts:
+            print(f"  - {a.title} ({a.date} {a.time}) overlaps {b.title} ({b.time})", file=out)
+
+    if args.day:
+        from pawpal_slots import SlotPlanner
+
+        itinerary = SlotPlanner(owner).plan_day(args.day)
+        print(f"\nItinerary for {itinerary.date}:", file=out)
+        for line in itinerary.lines():
+            print(f"  {line}", file=out)
+        for task in itinerary.unplaced:
+            print(f"  (no room) {task.title}", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
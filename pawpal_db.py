@@ -0,0 +1,273 @@
+import json
+import os
+import sqlite3
+from itertools import count
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pawpal_system import Owner, Pet, Task, reserve_task_ids
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS owners (
+    id                INTEGER PRIMARY KEY,
+    name              TEXT NOT NULL,
+    available_minutes INTEGER NOT NULL,
+    daily_minutes     TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS pets (
+    id       INTEGER PRIMARY KEY,
+    owner_id INTEGER NOT NULL REFERENCES owners(id),
+    position INTEGER NOT NULL,
+    name     TEXT NOT NULL,
+    species  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    pet_id           INTEGER NOT NULL REFERENCES pets(id),
+    position         INTEGER NOT NULL,
+    task_id          INTEGER NOT NULL,
+    title            TEXT NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    priority         INTEGER NOT NULL,
+    category         TEXT NOT NULL,
+    notes            TEXT NOT NULL,
+    completed        INTEGER NOT NULL,
+    frequency        TEXT NOT NULL,
+    date             TEXT NOT NULL,
+    time             TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pets_owner     ON pets(owner_id, position);
+CREATE INDEX IF NOT EXISTS tasks_pet      ON tasks(pet_id, position);
+CREATE INDEX IF NOT EXISTS tasks_date     ON tasks(pet_id, date);
+CREATE INDEX IF NOT EXISTS tasks_time     ON tasks(pet_id, time);
+CREATE INDEX IF NOT EXISTS tasks_priority ON tasks(pet_id, priority);
+"""
+
+_memory_dbs = count(1)   # in-memory databases are told apart by a per-process serial
+
+TASK_COLUMNS = ("task_id, title, duration_minutes, priority, category, notes, "
+                "completed, frequency, date, time")
+
+
+def _task_from_row(row: tuple) -> Task:
+    """Build a Task from a row selected with TASK_COLUMNS."""
+    task_id, title, duration, priority, category, notes, completed, frequency, day, time = row
+    return Task(title=title, duration_minutes=duration, priority=priority, id=task_id,
+                category=category, notes=notes, completed=bool(completed),
+                frequency=frequency, date=day, time=time)
+
+
+class LazyPet(Pet):
+    """A Pet whose tasks are read from the database the first time they are needed.
+
+    Attaching it to an Owner does not trigger the read; anything that touches
+    pet.tasks (scheduling, get_all_tasks, conflict checks, the UI) does, and the loaded
+    tasks reach the owner's indexes through the usual add events. Reading the tasks
+    does not count as an edit, so saving the owner afterwards leaves them alone in
+    every database the pet was clean in.
+    """
+    _loader: Optional[Callable[[], List[Task]]] = None
+
+    def __init__(self, name: str, species: str, loader: Callable[[], List[Task]]):
+        """Create the pet with its tasks still on disk."""
+        super().__init__(name=name, species=species)
+        self._loader = loader
+
+    @property
+    def tasks(self) -> List[Task]:
+        """Return the task list, reading it from the database on first access."""
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            marks = getattr(self, "_db_marks", {})
+            clean = [key for key, (_, _, version) in marks.items() if version == self.version]
+            for task in loader():
+                self.add_task(task)
+            for key in clean:
+                marks[key] = marks[key][:2] + (self.version,)
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, value: List[Task]) -> None:
+        """Replace the in-memory task list."""
+        self._tasks = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return True once the tasks have been read."""
+        return self._loader is None
+
+    def _loaded_tasks(self) -> List[Task]:
+        """Return the tasks in memory without triggering a read."""
+        return self._tasks
+
+    def __getstate__(self) -> dict:
+        """Read the tasks before pickling, since the loader holds a database handle."""
+        self.tasks
+        state = super().__getstate__()
+        state.pop("_loader", None)
+        return state
+
+
+def _remember(obj, name: str) -> Dict[str, tuple]:
+    """Return the per-database dict an object keeps under name, creating it if needed."""
+    marks = getattr(obj, name, None)
+    if marks is None:
+        marks = {}
+        setattr(obj, name, marks)
+    return marks
+
+
+class PawPalDB:
+    """Save and load whole Owner -> Pet -> Task graphs in a local SQLite file.
+
+    Saving writes an owner's rows in one transaction using executemany. Loading
+    returns pets whose tasks are read lazily, and query_tasks pushes filters into SQL
+    so a large history can be searched without loading it. Row ids are remembered on
+    the objects per database (owner._db_ids and pet._db_marks, keyed by self.key), so
+    saving a loaded owner again updates it in place while saving it to a different
+    database inserts fresh rows there. Each pet's mark also holds its version at the
+    last save or load, so only pets whose tasks changed since then have their task
+    rows rewritten.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (creating if needed) the database at path."""
+        if path in ("", ":memory:"):
+            self.key = f":memory:{os.getpid()}:{next(_memory_dbs)}"
+        else:
+            self.key = os.path.realpath(path)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        highest = self.conn.execute("SELECT MAX(task_id) FROM tasks").fetchone()[0]
+        if highest is not None:
+            reserve_task_ids(highest)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.conn.close()
+
+    def __enter__(self) -> "PawPalDB":
+        """Use the database as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Close the connection when the with-block ends."""
+        self.close()
+
+    def list_owners(self) -> List[Tuple[int, str]]:
+        """Return (owner id, name) for every saved owner."""
+        return self.conn.execute("SELECT id, name FROM owners ORDER BY id").fetchall()
+
+    def save_owner(self, owner: Owner) -> int:
+        """Write the owner, its pets and their tasks, returning the owner id.
+
+        Pets whose tasks are unchanged since the last save to or load from this
+        database, including lazily loaded pets never read, keep their stored task
+        rows untouched. Pets this database has not seen are inserted with all their
+        tasks, reading them first if they were loaded lazily from somewhere else.
+        """
+        with self.conn:
+            cur = self.conn.cursor()
+            owner_id = getattr(owner, "_db_ids", {}).get(self.key)
+            row = (owner.name, owner.available_minutes, json.dumps(owner.daily_minutes))
+            if owner_id is None:
+                cur.execute("INSERT INTO owners (name, available_minutes, daily_minutes) "
+                            "VALUES (?, ?, ?)", row)
+                owner_id = cur.lastrowid
+            else:
+                cur.execute("UPDATE owners SET name = ?, available_minutes = ?, daily_minutes = ? "
+                            "WHERE id = ?", row + (owner_id,))
+
+            kept = []
+            saved = []
+            for position, pet in enumerate(owner.pets):
+                pet_id, stored_row, stored_version = getattr(pet, "_db_marks", {}).get(self.key, (None, None, None))
+                row = (position, pet.name, pet.species)
+                if pet_id is None:
+                    cur.execute("INSERT INTO pets (owner_id, position, name, species) "
+                                "VALUES (?, ?, ?, ?)", (owner_id,) + row)
+                    pet_id = cur.lastrowid
+                elif stored_row != row:
+                    cur.execute("UPDATE pets SET position = ?, name = ?, species = ? WHERE id = ?",
+                                row + (pet_id,))
+                kept.append(pet_id)
+                saved.append((pet, pet_id, row))
+                if stored_version is not None:
+                    if isinstance(pet, LazyPet) and not pet.is_loaded:
+                        continue
+                    if stored_version == pet.version:
+                        continue
+                cur.execute("DELETE FROM tasks WHERE pet_id = ?", (pet_id,))
+                cur.executemany(
+                    f"INSERT INTO tasks (pet_id, position, {TASK_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((pet_id, i, t.id, t.title, t.duration_minutes, t.priority, t.category,
+                      t.notes, int(t.completed), t.frequency, t.date, t.time)
+                     for i, t in enumerate(pet.tasks)),
+                )
+
+            marks = ",".join("?" * len(kept))
+            stale = cur.execute(f"SELECT id FROM pets WHERE owner_id = ? AND id NOT IN ({marks})",
+                                [owner_id] + kept).fetchall()
+            cur.executemany("DELETE FROM tasks WHERE pet_id = ?", stale)
+            cur.executemany("DELETE FROM pets WHERE id = ?", stale)
+        _remember(owner, "_db_ids")[self.key] = owner_id     # only once the transaction has committed
+        for pet, pet_id, row in saved:
+            _remember(pet, "_db_marks")[self.key] = (pet_id, row, pet.version)
+        return owner_id
+
+    def _pet_tasks(self, pet_id: int) -> List[Task]:
+        """Read one pet's tasks in their saved order."""
+        rows = self.conn.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE pet_id = ? ORDER BY position", (pet_id,))
+        return [_task_from_row(row) for row in rows]
+
+    def load_owner(self, owner_id: int, lazy: bool = True) -> Owner:
+        """Load an owner; with lazy=True each pet's tasks are read on first use."""
+        row = self.conn.execute("SELECT name, available_minutes, daily_minutes FROM owners "
+                                "WHERE id = ?", (owner_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"No owner with id {owner_id}")
+        owner = Owner(name=row[0], available_minutes=row[1], daily_minutes=json.loads(row[2]))
+        owner._db_ids = {self.key: owner_id}
+        pets = self.conn.execute("SELECT id, name, species FROM pets WHERE owner_id = ? "
+                                 "ORDER BY position", (owner_id,)).fetchall()
+        for position, (pet_id, name, species) in enumerate(pets):
+            if lazy:
+                pet = LazyPet(name=name, species=species,
+                              loader=lambda pet_id=pet_id: self._pet_tasks(pet_id))
+            else:
+                pet = Pet(name=name, species=species, tasks=self._pet_tasks(pet_id))
+            pet._db_marks = {self.key: (pet_id, (position, name, species), pet.version)}
+            owner.add_pet(pet)
+        return owner
+
+    def query_tasks(self, owner_id: int, pet: Optional[str] = None,
+                    priority: Optional[int] = None, category: Optional[str] = None,
+                    completed: Optional[bool] = None, date_from: str = "", date_to: str = "",
+                    time_from: str = "", time_to: str = "") -> List[Task]:
+        """Return detached copies of an owner's tasks that match every given filter.
+
+        Filters run in SQL on the indexed columns; dates and times compare as
+        "YYYY-MM-DD" / "HH:MM" strings and the range bounds are inclusive. Results come
+        highest priority first, then in pet and task order.
+        """
+        clauses = ["p.owner_id = ?"]
+        params: list = [owner_id]
+        for column, value in (("p.name", pet), ("t.priority", priority), ("t.category", category)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if completed is not None:
+            clauses.append("t.completed = ?")
+            params.append(int(completed))
+        for column, op, value in (("t.date", ">=", date_from), ("t.date", "<=", date_to),
+                                  ("t.time", ">=", time_from), ("t.time", "<=", time_to)):
+            if value:
+                clauses.append(f"{column} != '' AND {column} {op} ?")
+                params.append(value)
+        columns = ", ".join(f"t.{c.strip()}" for c in TASK_COLUMNS.split(","))
+        rows = self.conn.execute(
+            f"SELECT {columns} FROM tasks t JOIN pets p ON p.id = t.pet_id "
+            f"WHERE {' AND '.join(clauses)} ORDER BY t.priority DESC, p.position, t.position",
+            params,
+        )
+        return [_task_from_row(row) for row in rows]
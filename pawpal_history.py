@@ -0,0 +1,245 @@
+import json
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from pawpal_system import Owner, Task, TaskEvent
+
+DEFAULT_STAT_DAYS = (7, 30)     # rolling-stat window lengths, in days
+
+
+@dataclass(frozen=True, slots=True)
+class Completion:
+    """One task completion, as written to the log."""
+    day: str               # "YYYY-MM-DD" the task was marked done
+    task_id: int
+    pet: str
+    title: str
+    category: str
+    minutes: int
+
+
+class _AppendOnly:
+    """Rows appended as JSON lines to a file, or kept in a list when there is no path."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Open the store; an existing file is appended to, never rewritten."""
+        self.path = path
+        self._rows: List[dict] = []
+        self._count = 0
+        if path is not None:
+            try:
+                with open(path, encoding="utf-8") as fp:
+                    self._count = sum(1 for line in fp if line.strip())
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        """Return the number of rows stored."""
+        return self._count if self.path is not None else len(self._rows)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yield the rows in the order they were appended."""
+        if self.path is None:
+            return iter(list(self._rows))
+        return self._read()
+
+    def _read(self) -> Iterator[dict]:
+        """Stream the rows back from the file."""
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                for line in fp:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            return
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        """Append rows, writing them to the file in one go."""
+        rows = list(rows)
+        if self.path is None:
+            self._rows.extend(rows)
+            return
+        with open(self.path, "a", encoding="utf-8") as fp:
+            fp.writelines(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+        self._count += len(rows)
+
+
+class RollingStats:
+    """Completion totals over the last `days` days, kept in a ring of per-day buckets.
+
+    Each bucket holds one day's count, minutes and minutes per category, and the
+    running totals are the sum of the buckets. Recording a completion or reading a
+    total is O(1); moving the window forward empties one bucket per day passed (at
+    most `days` of them), subtracting it from the totals, instead of rescanning the log.
+    """
+
+    def __init__(self, days: int):
+        """Create an empty window of the given length."""
+        if days < 1:
+            raise ValueError("A rolling window needs at least one day")
+        self.days = days
+        self._counts = [0] * days
+        self._minutes = [0] * days
+        self._categories: List[Dict[str, int]] = [{} for _ in range(days)]
+        self._count = 0
+        self._minutes_total = 0
+        self._category_totals: Dict[str, int] = {}
+        self._newest: Optional[int] = None          # ordinal of the latest day in the window
+        self._last_active: Optional[int] = None     # latest day with a completion
+        self._streak = 0
+
+    def _advance(self, ordinal: int) -> None:
+        """Slide the window so it ends on ordinal, emptying the buckets that fall out."""
+        if self._newest is None:
+            self._newest = ordinal
+            return
+        if ordinal <= self._newest:
+            return
+        for day in range(max(self._newest + 1, ordinal - self.days + 1), ordinal + 1):
+            i = day % self.days
+            self._count -= self._counts[i]
+            self._minutes_total -= self._minutes[i]
+            for category, minutes in self._categories[i].items():
+                left = self._category_totals[category] - minutes
+                if left:
+                    self._category_totals[category] = left
+                else:
+                    del self._category_totals[category]
+            self._counts[i] = self._minutes[i] = 0
+            self._categories[i] = {}
+        self._newest = ordinal
+
+    def add(self, day: date, minutes: int, category: str = "") -> None:
+        """Count one completion on day; days already outside the window are ignored.
+
+        The streak only grows with completions recorded in date order.
+        """
+        ordinal = day.toordinal()
+        self._advance(ordinal)
+        if ordinal <= self._newest - self.days:
+            return
+        i = ordinal % self.days
+        self._counts[i] += 1
+        self._minutes[i] += minutes
+        self._categories[i][category] = self._categories[i].get(category, 0) + minutes
+        self._count += 1
+        self._minutes_total += minutes
+        self._category_totals[category] = self._category_totals.get(category, 0) + minutes
+        if self._last_active is None or ordinal > self._last_active:
+            consecutive = self._last_active is not None and ordinal == self._last_active + 1
+            self._streak = self._streak + 1 if consecutive else 1
+            self._last_active = ordinal
+
+    def completed(self, today: date) -> int:
+        """Return the completions in the window ending today."""
+        self._advance(today.toordinal())
+        return self._count
+
+    def minutes(self, today: date) -> int:
+        """Return the minutes of completed tasks in the window ending today."""
+        self._advance(today.toordinal())
+        return self._minutes_total
+
+    def minutes_by_category(self, today: date) -> Dict[str, int]:
+        """Return completed minutes per category in the window ending today."""
+        self._advance(today.toordinal())
+        return dict(self._category_totals)
+
+    def completion_rate(self, today: date) -> float:
+        """Return the average completions per day over the window ending today."""
+        return self.completed(today) / self.days
+
+    def streak(self, today: date) -> int:
+        """Return the run of consecutive days with a completion, ending today or yesterday."""
+        if self._last_active is None or today.toordinal() - self._last_active > 1:
+            return 0
+        return self._streak
+
+
+class CompletionLog:
+    """An append-only history of an owner's completed tasks, with rolling stats and compaction.
+
+    The log follows the owner's change events, so Task.mark_complete and
+    Scheduler.mark_task_complete are both recorded, once per completion, with the
+    day from clock. compact() moves finished tasks out of Pet.tasks into an archive,
+    so the lists every scan walks hold only live work. With a path or archive_path
+    the rows go to JSON-lines files instead of memory, and reopening a log file
+    replays its rows from the longest window into the stats. Keep a reference to the
+    log: the owner holds it only weakly.
+    """
+
+    def __init__(self, owner: Owner, windows: Sequence[int] = DEFAULT_STAT_DAYS,
+                 path: Optional[str] = None, archive_path: Optional[str] = None,
+                 clock: Callable[[], date] = date.today):
+        """Start logging owner's completions, with a RollingStats per window length."""
+        self.owner = owner
+        self.stats: Dict[int, RollingStats] = {days: RollingStats(days) for days in windows}
+        self._records = _AppendOnly(path)
+        self._archive = _AppendOnly(archive_path)
+        self._clock = clock
+        self._done: Set[int] = {t.id for t in owner.get_all_tasks() if t.completed}
+        if path is not None and self.stats:
+            self._replay(self._clock() - timedelta(days=max(self.stats) - 1))
+        owner.subscribe(self._on_task_event, weak=True)
+
+    def _replay(self, since: date) -> None:
+        """Feed the stats the completions already on disk from since onward."""
+        cutoff = since.isoformat()
+        for row in self._records:
+            if row["day"] >= cutoff:
+                day = date.fromisoformat(row["day"])
+                for stats in self.stats.values():
+                    stats.add(day, row["minutes"], row["category"])
+
+    def __len__(self) -> int:
+        """Return the number of completions logged."""
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Completion]:
+        """Yield every logged completion, oldest first."""
+        return (Completion(**row) for row in self._records)
+
+    def _on_task_event(self, event: TaskEvent) -> None:
+        """Log tasks as they become completed; forget tasks that are reopened or removed."""
+        task = event.task
+        if event.kind == "change" and event.field == "completed":
+            if not task.completed:
+                self._done.discard(task.id)
+            elif task.id not in self._done:
+                self._done.add(task.id)
+                self.record(task, event.pet.name)
+        elif event.kind == "remove":
+            self._done.discard(task.id)
+
+    def record(self, task: Task, pet_name: str = "", day: Optional[date] = None) -> Completion:
+        """Append a completion to the log and the rolling stats, and return it."""
+        day = day or self._clock()
+        completion = Completion(day=day.isoformat(), task_id=task.id, pet=pet_name, title=task.title,
+                                category=task.category, minutes=task.duration_minutes)
+        self._records.extend([asdict(completion)])
+        for stats in self.stats.values():
+            stats.add(day, completion.minutes, completion.category)
+        return completion
+
+    def compact(self, before: Optional[date] = None) -> int:
+        """Archive completed tasks dated before the given day (default today) and return how many.
+
+        Completed tasks with no date are archived too. Pending tasks always stay, so
+        a recurring task keeps its next instance and only its finished ones move out.
+        """
+        cutoff = (before or self._clock()).isoformat()
+        archived = 0
+        for pet in self.owner.pets:
+            done = [t for t in pet.tasks if t.completed and (not t.date or t.date < cutoff)]
+            if not done:
+                continue
+            self._archive.extend(dict(t.to_dict(), pet=pet.name) for t in done)
+            pet.remove_tasks(t.id for t in done)
+            archived += len(done)
+        return archived
+
+    def archived(self) -> Iterator[Tuple[str, Task]]:
+        """Yield (pet name, task) for every archived task, oldest first."""
+        for row in self._archive:
+            yield row["pet"], Task.from_dict(row)
@@ -0,0 +1,150 @@
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional
+
+from pawpal_system import Scheduler
+
+CAPTURE_MODES = ("", "cprofile", "tracemalloc")
+TOP_ROWS = 15
+
+
+@dataclass
+class MethodStats:
+    """Timing and input-size counters for one Scheduler method."""
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    total_tasks: int = 0           # owner task count summed over calls
+    max_tasks: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Return the average time per call."""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class SchedulerStats:
+    """What instrumenting a Scheduler recorded.
+
+    Times are inclusive, so an instrumented method that calls another counts that
+    time too. profile and allocations are filled only in the matching capture mode.
+    """
+    methods: Dict[str, MethodStats] = field(default_factory=dict)
+    profile: List[dict] = field(default_factory=list)       # top cProfile rows by cumulative time
+    allocations: List[dict] = field(default_factory=list)   # top tracemalloc sites by size
+    peak_memory_bytes: int = 0
+
+    def record(self, name: str, seconds: float, tasks: int) -> None:
+        """Add one call of a method."""
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats()
+        stats.calls += 1
+        stats.total_seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.total_tasks += tasks
+        stats.max_tasks = max(stats.max_tasks, tasks)
+
+    def slowest(self) -> List[str]:
+        """Return method names ordered by total time, slowest first."""
+        return sorted(self.methods, key=lambda name: self.methods[name].total_seconds, reverse=True)
+
+    def to_dict(self) -> dict:
+        """Return a JSON-ready dictionary of everything recorded."""
+        data = asdict(self)
+        for name, stats in self.methods.items():
+            data["methods"][name]["mean_seconds"] = stats.mean_seconds
+        return data
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Return the stats as a JSON string."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+def _timed(method: Callable, name: str, stats: SchedulerStats, scheduler: Scheduler) -> Callable:
+    """Wrap a bound method so every call is timed and counted."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.record(name, time.perf_counter() - start, len(scheduler.owner._index))
+    return wrapper
+
+
+def enable(scheduler: Scheduler, stats: SchedulerStats) -> None:
+    """Start timing the scheduler's INSTRUMENTED_METHODS into stats.
+
+    The wrappers are set on the instance, so other schedulers, and this one once
+    disable() removes them again, run the plain class methods with no overhead.
+    """
+    disable(scheduler)
+    for name in Scheduler.INSTRUMENTED_METHODS:
+        setattr(scheduler, name, _timed(getattr(scheduler, name), name, stats, scheduler))
+
+
+def disable(scheduler: Scheduler) -> None:
+    """Remove the timing wrappers added by enable()."""
+    for name in Scheduler.INSTRUMENTED_METHODS:
+        scheduler.__dict__.pop(name, None)
+
+
+def _profile_rows(profiler) -> List[dict]:
+    """Return the top cProfile entries by cumulative time."""
+    import pstats
+
+    entries = pstats.Stats(profiler).stats
+    rows = sorted(entries.items(), key=lambda item: item[1][3], reverse=True)[:TOP_ROWS]
+    return [
+        {"function": f"{path}:{line}({func})", "calls": calls,
+         "own_seconds": own, "cumulative_seconds": cumulative}
+        for (path, line, func), (_, calls, own, cumulative, _) in rows
+    ]
+
+
+@contextmanager
+def instrument(scheduler: Scheduler, capture: str = "",
+               stats: Optional[SchedulerStats] = None) -> Iterator[SchedulerStats]:
+    """Record Scheduler method timings for the duration of a with-block.
+
+    capture="cprofile" also runs cProfile over the block; capture="tracemalloc"
+    records peak memory and the largest allocation sites. Pass an existing stats
+    object to keep adding to it.
+    """
+    if capture not in CAPTURE_MODES:
+        raise ValueError(f"Unknown capture mode {capture!r}; expected one of {CAPTURE_MODES}")
+    if any(name in scheduler.__dict__ for name in Scheduler.INSTRUMENTED_METHODS):
+        raise RuntimeError("Scheduler is already instrumented")
+    stats = stats if stats is not None else SchedulerStats()
+    enable(scheduler, stats)
+    profiler = None
+    tracing = False
+    if capture == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif capture == "tracemalloc":
+        import tracemalloc
+        tracing = not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    try:
+        yield stats
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            stats.profile = _profile_rows(profiler)
+        elif capture == "tracemalloc":
+            stats.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            top = tracemalloc.take_snapshot().statistics("lineno")[:TOP_ROWS]
+            stats.allocations = [{"location": str(s.traceback[0]), "size_bytes": s.size,
+                                  "count": s.count} for s in top]
+            if tracing:
+                tracemalloc.stop()
+        disable(scheduler)
@@ -0,0 +1,377 @@
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pawpal_cache import owner_key
+from pawpal_system import Owner, Pet, Scheduler, Task
+
+TASK_FIELDS = tuple(f.name for f in fields(Task))
+
+# (name, available_minutes, daily_minutes items, ((pet name, species, task rows), ...)),
+# where each task row holds the TASK_FIELDS values. Immutable and picklable, so one
+# snapshot can be shared by every request in a batch and shipped to any executor.
+OwnerSnapshot = Tuple[str, int, Tuple, Tuple[Tuple[str, str, Tuple[tuple, ...]], ...]]
+
+# ("schedule", mode) | ("conflicts",) | ("occurrences", start ISO date, end ISO date)
+RequestKey = Tuple[str, ...]
+
+ENDPOINTS = ("schedule", "conflicts", "occurrences")
+
+
+class ServiceError(Exception):
+    """An error reported by the service to a PawPalClient."""
+
+
+def snapshot_owner(owner: Owner) -> OwnerSnapshot:
+    """Copy the fields every endpoint reads out of a live owner."""
+    return (
+        owner.name,
+        owner.available_minutes,
+        tuple(owner.daily_minutes.items()),
+        tuple(
+            (pet.name, pet.species,
+             tuple(tuple(getattr(t, name) for name in TASK_FIELDS) for t in pet.tasks))
+            for pet in owner.pets
+        ),
+    )
+
+
+def restore_owner(snapshot: OwnerSnapshot) -> Owner:
+    """Rebuild a detached owner from a snapshot; task ids are preserved."""
+    name, minutes, daily, pets = snapshot
+    return Owner(name=name, available_minutes=minutes, daily_minutes=dict(daily), pets=[
+        Pet(name=pet_name, species=species, tasks=[Task(*row) for row in rows])
+        for pet_name, species, rows in pets
+    ])
+
+
+def _answer(scheduler: Scheduler, key: RequestKey) -> dict:
+    """Compute one endpoint's JSON-ready response."""
+    endpoint = key[0]
+    if endpoint == "schedule":
+        scheduler.build_schedule(mode=key[1])
+        return {
+            "mode_used": scheduler.mode_used,
+            "remaining_minutes": scheduler.remaining_minutes,
+            "scheduled": [t.to_dict() for t in scheduler.schedule],
+            "unscheduled": [t.id for t in scheduler.get_unscheduled()],
+        }
+    if endpoint == "conflicts":
+        return {"conflicts": [[a.id, b.id] for a, b in scheduler.iter_conflicts()]}
+    start, end = date.fromisoformat(key[1]), date.fromisoformat(key[2])
+    return {"occurrences": [{"date": o.date, "task_id": o.task.id}
+                            for o in scheduler.iter_occurrences(start, end)]}
+
+
+def run_batch(snapshot: OwnerSnapshot, keys: List[RequestKey]) -> List[Tuple[bool, object]]:
+    """Answer several distinct requests against one owner snapshot; runs in the worker pool.
+
+    Returns (ok, response or exception) per key, so one bad request does not fail the
+    rest of its batch.
+    """
+    scheduler = Scheduler(owner=restore_owner(snapshot))
+    results = []
+    for key in keys:
+        try:
+            results.append((True, _answer(scheduler, key)))
+        except Exception as exc:  # handed back to the waiting request
+            results.append((False, exc))
+    return results
+
+
+@dataclass
+class ServiceStats:
+    """Request counters for a PawPalService."""
+    requests: int = 0
+    batches: int = 0
+    jobs: int = 0                # distinct requests actually computed
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Return how many requests were answered by another request's computation."""
+        return self.requests - self.jobs
+
+
+class PawPalService:
+    """Asyncio front end for scheduling, conflict and recurrence queries.
+
+    Requests for the same owner that arrive within batch_window seconds are grouped
+    into one batch: the owner is snapshotted once, identical requests are computed once,
+    and the work runs in an executor so the event loop never blocks on it. At most
+    max_pending requests are admitted at a time; later callers wait for a slot.
+
+    The default executor is a thread pool. Scheduling is CPU-bound pure Python, so
+    its threads take turns on the GIL: the pool keeps the event loop responsive but
+    gives no parallelism. For parallel batches across cores, pass a
+    ProcessPoolExecutor; each batch then pays for pickling its owner snapshot, which
+    only pays off when a batch does more work than that round trip costs.
+    """
+
+    def __init__(self, owners: Iterable[Owner] = (), workers: Optional[int] = None,
+                 executor: Optional[Executor] = None, batch_window: float = 0.002,
+                 max_pending: int = 256):
+        """Register owners and configure the worker pool, batch window and admission limit."""
+        self.owners: Dict[str, Owner] = {}
+        for owner in owners:
+            self.add_owner(owner)
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=workers)
+        self.batch_window = batch_window
+        self.max_pending = max(max_pending, 1)
+        self.stats = ServiceStats()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._batches: Dict[str, List[Tuple[RequestKey, asyncio.Future]]] = {}
+        self._snapshots: Dict[str, Tuple[tuple, OwnerSnapshot]] = {}
+        self._flushes: set = set()
+
+    def add_owner(self, owner: Owner) -> None:
+        """Serve requests for owner under its name."""
+        self.owners[owner.name] = owner
+
+    async def __aenter__(self) -> "PawPalService":
+        """Use the service as an async context manager that shuts the pool down on exit."""
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Shut the worker pool down when the async with-block ends."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool if the service created it."""
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+    async def schedule(self, owner: str, mode: str = "greedy") -> dict:
+        """Return today's schedule for an owner."""
+        if mode not in Scheduler.SCHEDULE_MODES:
+            raise ValueError(f"Unknown schedule mode {mode!r}; expected one of {Scheduler.SCHEDULE_MODES}")
+        return await self._submit(owner, ("schedule", mode))
+
+    async def conflicts(self, owner: str) -> dict:
+        """Return the id pairs of an owner's overlapping tasks."""
+        return await self._submit(owner, ("conflicts",))
+
+    async def occurrences(self, owner: str, start: str, end: str) -> dict:
+        """Return the (date, task id) occurrences between two ISO dates inclusive."""
+        date.fromisoformat(start), date.fromisoformat(end)     # reject bad dates up front
+        return await self._submit(owner, ("occurrences", start, end))
+
+    async def call(self, endpoint: str, params: dict) -> dict:
+        """Dispatch a request by endpoint name, as the server does."""
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {endpoint!r}; expected one of {ENDPOINTS}")
+        return await getattr(self, endpoint)(**params)
+
+    def _snapshot(self, name: str) -> OwnerSnapshot:
+        """Return a snapshot of the owner, reusing the last one until the owner changes."""
+        owner = self.owners[name]
+        key = owner_key(owner)
+        cached = self._snapshots.get(name)
+        if cached is None or cached[0] != key:
+            cached = self._snapshots[name] = (key, snapshot_owner(owner))
+        return cached[1]
+
+    async def _submit(self, name: str, key: RequestKey) -> dict:
+        """Queue a request into its owner's next batch and wait for the answer."""
+        if name not in self.owners:
+            raise KeyError(f"No owner named {name!r}")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            stats = self.stats
+            stats.requests += 1
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            try:
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                batch = self._batches.get(name)
+                if batch is None:
+                    batch = self._batches[name] = []
+                    loop.call_later(self.batch_window, self._start_flush, name)
+                batch.append((key, future))
+                return await future
+            finally:
+                stats.in_flight -= 1
+
+    def _start_flush(self, name: str) -> None:
+        """Launch the flush of one owner's batch, keeping a reference until it finishes."""
+        task = asyncio.get_running_loop().create_task(self._flush(name))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, name: str) -> None:
+        """Compute one owner's pending batch in the pool and resolve its futures."""
+        batch = self._batches.pop(name)
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        self.stats.batches += 1
+        self.stats.jobs += len(keys)
+        loop = asyncio.get_running_loop()
+        try:
+            outcomes = await loop.run_in_executor(self.executor, run_batch, self._snapshot(name), keys)
+        except Exception as exc:
+            outcomes = [(False, exc)] * len(keys)
+        by_key = dict(zip(keys, outcomes))
+        for key, future in batch:
+            if future.done():
+                continue
+            ok, value = by_key[key]
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+class PawPalServer:
+    """A local stand-in for the HTTP front end: JSON lines over TCP.
+
+    Each request line is {"id", "endpoint", "params"} and each response line is
+    {"id", "result"} or {"id", "error"}. Requests on one connection run concurrently
+    and may be answered out of order. A connection stops being read while the service
+    has no free slot, so a flood of requests backs up into TCP instead of memory.
+    """
+
+    def __init__(self, service: PawPalService, host: str = "127.0.0.1", port: int = 0):
+        """Serve service on host:port; port 0 picks a free port."""
+        self.service = service
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.Server] = None
+
+    async def start(self) -> None:
+        """Start listening; self.port holds the bound port afterwards."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close the server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "PawPalServer":
+        """Start the server for the duration of an async with-block."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Stop the server when the async with-block ends."""
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection until the client closes it."""
+        slots = asyncio.Semaphore(self.service.max_pending)
+        tasks = set()
+        try:
+            while True:
+                await slots.acquire()
+                line = await reader.readline()
+                if not line:
+                    slots.release()
+                    break
+                task = asyncio.create_task(self._respond(line, writer, slots))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter, slots: asyncio.Semaphore) -> None:
+        """Run one request line and write its response line."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            result = await self.service.call(request["endpoint"], request.get("params", {}))
+            response = {"id": request_id, "result": result}
+        except Exception as exc:
+            response = {"id": request_id, "error": f"{type(exc).__name__}: {exc}"}
+        finally:
+            slots.release()
+        writer.write(json.dumps(response).encode("utf-8") + b"\n")
+        await writer.drain()
+
+
+class PawPalClient:
+    """Client for PawPalServer that multiplexes concurrent requests over one connection."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """Remember where the server is; call connect() (or use async with) before requests."""
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._listener: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        """Open the connection and start reading responses."""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+        if self._listener is not None:
+            await self._listener
+
+    async def __aenter__(self) -> "PawPalClient":
+        """Connect for the duration of an async with-block."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        """Close the connection when the async with-block ends."""
+        await self.close()
+
+    async def _listen(self) -> None:
+        """Route each response line to the request waiting for it."""
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self._pending.pop(response["id"], None)
+            if future is None or future.done():
+                continue
+            if "error" in response:
+                future.set_exception(ServiceError(response["error"]))
+            else:
+                future.set_result(response["result"])
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ServiceError("Connection closed"))
+        self._pending.clear()
+
+    async def call(self, endpoint: str, **params) -> dict:
+        """Send one request and wait for its result; errors raise ServiceError."""
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        request = {"id": request_id, "endpoint": endpoint, "params": params}
+        self._writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def schedule(self, owner: str, mode: str = "greedy") -> dict:
+        """Request an owner's schedule."""
+        return await self.call("schedule", owner=owner, mode=mode)
+
+    async def conflicts(self, owner: str) -> dict:
+        """Request an owner's conflicting task pairs."""
+        return await self.call("conflicts", owner=owner)
+
+    async def occurrences(self, owner: str, start: str, end: str) -> dict:
+        """Request an owner's occurrences between two ISO dates."""
+        return await self.call("occurrences", owner=owner, start=start, end=end)
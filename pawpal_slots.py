@@ -0,0 +1,221 @@
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pawpal_system import Owner, Scheduler, Task, parse_minute_of_day
+
+DAY_MINUTES = 24 * 60
+DEFAULT_WINDOWS = (("06:00", "22:00"),)
+
+
+def _hhmm(minute: int) -> str:
+    """Format minutes after midnight as "HH:MM" (1440 is "24:00")."""
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def parse_window(window: Tuple[str, str]) -> Tuple[int, int]:
+    """Convert an ("HH:MM", "HH:MM") availability window to minutes; "24:00" ends the day."""
+    start_text, end_text = window
+    start = parse_minute_of_day(start_text)
+    end = DAY_MINUTES if end_text.strip() == "24:00" else parse_minute_of_day(end_text)
+    if start is None or end is None or end <= start:
+        raise ValueError(f"Invalid availability window {window!r}; expected (\"HH:MM\", \"HH:MM\")")
+    return start, end
+
+
+def split_fixed(tasks: Iterable[Task]) -> Tuple[List[Tuple[int, int, Task]], List[Task]]:
+    """Split pending tasks into fixed (start, end, task) spans in time order and flexible tasks."""
+    fixed: List[Tuple[int, int, Task]] = []
+    flexible: List[Task] = []
+    for task in tasks:
+        if task.completed:
+            continue
+        start = parse_minute_of_day(task.time) if task.time else None
+        if start is None:
+            flexible.append(task)
+        else:
+            fixed.append((start, min(start + task.duration_minutes, DAY_MINUTES), task))
+    fixed.sort(key=lambda f: f[:2])
+    return fixed, flexible
+
+
+class FreeIntervals:
+    """Disjoint free [start, end) minute ranges, searchable by position and by length.
+
+    Two sorted views are kept in step: starts/ends in time order for reserving a span,
+    and (length, start) pairs for finding a gap. best_fit() is one bisect, so placing a
+    task costs O(log n) to find its gap plus a short list shift to record it.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()):
+        """Create the free ranges, merging any that overlap or touch."""
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._by_length: List[Tuple[int, int]] = []   # sorted (length, start)
+        for start, end in ranges:
+            self.add(start, end)
+
+    def __len__(self) -> int:
+        """Return the number of separate free ranges."""
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) of each free range in time order."""
+        return zip(list(self._starts), list(self._ends))
+
+    def total(self) -> int:
+        """Return the free minutes across all ranges."""
+        return sum(length for length, _ in self._by_length)
+
+    def _insert(self, start: int, end: int) -> None:
+        """File a range known not to touch any other."""
+        i = bisect_left(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+        insort(self._by_length, (end - start, start))
+
+    def _remove_at(self, i: int) -> Tuple[int, int]:
+        """Drop the i-th range in time order and return it."""
+        start, end = self._starts.pop(i), self._ends.pop(i)
+        del self._by_length[bisect_left(self._by_length, (end - start, start))]
+        return start, end
+
+    def add(self, start: int, end: int) -> None:
+        """Mark [start, end) free, merging it with any neighbouring free range."""
+        if end <= start:
+            return
+        i = bisect_left(self._ends, start)            # first range that ends at or after start
+        while i < len(self._starts) and self._starts[i] <= end:
+            s, e = self._remove_at(i)
+            start, end = min(start, s), max(end, e)
+        self._insert(start, end)
+
+    def reserve(self, start: int, end: int) -> int:
+        """Mark [start, end) busy and return how many of those minutes had been free."""
+        taken = 0
+        i = bisect_left(self._ends, start + 1)        # first range that ends after start
+        while i < len(self._starts) and self._starts[i] < end:
+            s, e = self._remove_at(i)
+            taken += min(e, end) - max(s, start)
+            if s < start:
+                self._insert(s, start)
+                i += 1
+            if e > end:
+                self._insert(end, e)
+        return taken
+
+    def covers(self, start: int, end: int) -> bool:
+        """Return True if all of [start, end) is free."""
+        i = bisect_right(self._starts, start) - 1
+        return i >= 0 and self._ends[i] >= end
+
+    def longest(self) -> int:
+        """Return the length of the longest free range, or 0 if none is left."""
+        return self._by_length[-1][0] if self._by_length else 0
+
+    def best_fit(self, duration: int) -> Optional[int]:
+        """Return the start of the shortest free range that can hold duration, earliest on ties."""
+        j = bisect_left(self._by_length, (duration, -1))
+        return self._by_length[j][1] if j < len(self._by_length) else None
+
+
+@dataclass(frozen=True, slots=True)
+class Slot:
+    """One task placed on the timeline."""
+    start: int             # minutes after midnight
+    end: int
+    task: Task
+    fixed: bool            # True if the task had its own time
+
+    @property
+    def start_time(self) -> str:
+        """Return the start as "HH:MM"."""
+        return _hhmm(self.start)
+
+    @property
+    def end_time(self) -> str:
+        """Return the end as "HH:MM"."""
+        return _hhmm(self.end)
+
+
+@dataclass
+class Itinerary:
+    """A timed plan for one day."""
+    date: str                                                 # "YYYY-MM-DD"
+    budget: int
+    slots: List[Slot] = field(default_factory=list)           # in start order
+    unplaced: List[Task] = field(default_factory=list)        # flexible tasks with no room or budget
+    clashes: List[Task] = field(default_factory=list)         # fixed tasks overlapping an earlier one
+
+    @property
+    def minutes_used(self) -> int:
+        """Return the total minutes of the placed tasks."""
+        return sum(slot.task.duration_minutes for slot in self.slots)
+
+    def lines(self) -> List[str]:
+        """Return one "HH:MM-HH:MM title" line per slot."""
+        return [f"{s.start_time}-{s.end_time}  {s.task.title}" + ("" if s.fixed else " (flexible)")
+                for s in self.slots]
+
+
+class SlotPlanner:
+    """Place each day's due tasks on a timeline within the owner's availability windows.
+
+    Tasks with an "HH:MM" time keep it. Every other pending task is flexible: in
+    priority order, while the day's budget (Owner.budget_for) allows, it goes into the
+    smallest free gap that holds it, at the start of that gap. Fixed tasks are kept even
+    outside the windows, and overlaps between them are reported as clashes.
+    """
+
+    def __init__(self, owner: Owner, windows: Sequence[Tuple[str, str]] = DEFAULT_WINDOWS):
+        """Plan for owner, who is free during the given ("HH:MM", "HH:MM") windows each day."""
+        self.owner = owner
+        self.windows = [parse_window(w) for w in windows]
+        self._scheduler = Scheduler(owner=owner)
+
+    def plan_day(self, day: date) -> Itinerary:
+        """Return the itinerary for one day."""
+        return self._place(day, self._scheduler.occurrences_on(day))
+
+    def _place(self, day: date, tasks: Iterable[Task]) -> Itinerary:
+        """Lay out the given due tasks on day's timeline."""
+        budget = self.owner.budget_for(day)
+        itinerary = Itinerary(date=day.isoformat(), budget=budget)
+        free = FreeIntervals(self.windows)
+        fixed, flexible = split_fixed(tasks)
+        busy_until = -1
+        left = budget
+        for start, end, task in fixed:
+            if start < busy_until:
+                itinerary.clashes.append(task)
+            busy_until = max(busy_until, end)
+            free.reserve(start, end)
+            left -= task.duration_minutes
+            itinerary.slots.append(Slot(start, end, task, fixed=True))
+
+        flexible.sort(key=lambda t: t.priority, reverse=True)
+        for task in flexible:
+            duration = task.duration_minutes
+            start = free.best_fit(duration) if duration <= left else None
+            if start is None:
+                itinerary.unplaced.append(task)
+                continue
+            free.reserve(start, start + duration)
+            left -= duration
+            itinerary.slots.append(Slot(start, start + duration, task, fixed=False))
+
+        itinerary.slots.sort(key=lambda s: (s.start, s.end))
+        return itinerary
+
+    def plan_range(self, start: date, end: date) -> List[Itinerary]:
+        """Return one itinerary per day from start to end inclusive.
+
+        Occurrences are expanded once over the whole range, as Scheduler.plan_range
+        does, so an undated one-off task lands on the first day rather than every day.
+        """
+        due: Dict[str, List[Task]] = {}
+        for occurrence in self._scheduler.iter_occurrences(start, end):
+            due.setdefault(occurrence.date, []).append(occurrence.task)
+        days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+        return [self._place(day, due.get(day.isoformat(), [])) for day in days]
@@ -0,0 +1,226 @@
+import json
+import struct
+from typing import BinaryIO, Dict, Iterator, Tuple, Union
+
+from pawpal_system import Owner, Pet, Task, reserve_task_ids
+
+FORMAT_VERSION = 1
+MODES = ("jsonl", "binary")
+
+# JSON-lines: a header line, then {"pet": ..., "species": ...} lines each followed by
+# that pet's tasks as Task.to_dict() lines.
+JSONL_FORMAT = "pawpal-snapshot"
+
+# Binary: MAGIC + u16 version, then tagged records. Low-cardinality strings (category,
+# frequency, date, time, species) are written to a table once, the first time they are
+# used, and referenced by index after that, so they cost four bytes per task. Titles,
+# notes and pet names are written inline after their record, so the table stays small
+# however many distinct ones a file holds.
+MAGIC = b"PAWPALSB"
+VERSION = struct.Struct("<H")
+STRING = struct.Struct("<I")                  # byte length, followed by UTF-8 bytes
+OWNER = struct.Struct("<IiI")                 # name, available_minutes, daily_minutes JSON
+PET = struct.Struct("<I")                     # species; the name follows inline
+TASK = struct.Struct("<qiiB4I")               # id, duration, priority, completed, then string
+                                              # ids: category, frequency, date, time; the
+                                              # title and notes follow inline
+TAG_STRING, TAG_OWNER, TAG_PET, TAG_TASK = b"S", b"O", b"P", b"T"
+
+Record = Tuple[str, Union[Owner, Pet, Task]]
+
+
+class SnapshotWriter:
+    """Stream an owner, pets and tasks to a snapshot file one record at a time.
+
+    Call owner() once, then pet() before each pet's tasks. Nothing is buffered beyond
+    the binary string table of low-cardinality values, so a snapshot can be written
+    straight from a database cursor or any other task stream.
+    """
+
+    def __init__(self, path: str, mode: str = "jsonl"):
+        """Open path for writing in "jsonl" or "binary" mode."""
+        if mode not in MODES:
+            raise ValueError(f"Unknown snapshot mode {mode!r}; expected one of {MODES}")
+        self.mode = mode
+        self._strings: Dict[str, int] = {}
+        if mode == "binary":
+            self._file = open(path, "wb")
+            self._file.write(MAGIC + VERSION.pack(FORMAT_VERSION))
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+    def __enter__(self) -> "SnapshotWriter":
+        """Use the writer as a context manager that closes the file on exit."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Close the file when the with-block ends."""
+        self.close()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def _string(self, text: str) -> int:
+        """Return the table index for text, writing it out the first time it is seen."""
+        index = self._strings.get(text)
+        if index is None:
+            data = text.encode("utf-8")
+            self._file.write(TAG_STRING + STRING.pack(len(data)) + data)
+            index = self._strings[text] = len(self._strings)
+        return index
+
+    @staticmethod
+    def _inline(text: str) -> bytes:
+        """Return text as a length-prefixed UTF-8 string to write after a record."""
+        data = text.encode("utf-8")
+        return STRING.pack(len(data)) + data
+
+    def owner(self, owner: Owner) -> None:
+        """Write the header record with the owner's own fields (not pets)."""
+        daily = json.dumps(owner.daily_minutes)
+        if self.mode == "binary":
+            record = OWNER.pack(self._string(owner.name), owner.available_minutes, self._string(daily))
+            self._file.write(TAG_OWNER + record)
+        else:
+            header = {"format": JSONL_FORMAT, "version": FORMAT_VERSION,
+                      "owner": {"name": owner.name, "available_minutes": owner.available_minutes,
+                                "daily_minutes": owner.daily_minutes}}
+            self._file.write(json.dumps(header) + "\n")
+
+    def pet(self, pet: Pet) -> None:
+        """Start a pet; tasks written after this belong to it."""
+        if self.mode == "binary":
+            self._file.write(TAG_PET + PET.pack(self._string(pet.species)) + self._inline(pet.name))
+        else:
+            self._file.write(json.dumps({"pet": pet.name, "species": pet.species}) + "\n")
+
+    def task(self, task: Task) -> None:
+        """Write one task for the current pet."""
+        if self.mode == "binary":
+            s = self._string
+            self._file.write(TAG_TASK + TASK.pack(
+                task.id, task.duration_minutes, task.priority, task.completed,
+                s(task.category), s(task.frequency), s(task.date), s(task.time),
+            ) + self._inline(task.title) + self._inline(task.notes))
+        else:
+            self._file.write(json.dumps(task.to_dict()) + "\n")
+
+
+def write_snapshot(owner: Owner, path: str, mode: str = "jsonl") -> None:
+    """Write a whole owner to a snapshot file."""
+    with SnapshotWriter(path, mode) as writer:
+        writer.owner(owner)
+        for pet in owner.pets:
+            writer.pet(pet)
+            for task in pet.tasks:
+                writer.task(task)
+
+
+def _read_exact(fp: BinaryIO, size: int) -> bytes:
+    """Read exactly size bytes or fail on a truncated file."""
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("Snapshot file is truncated")
+    return data
+
+
+def _read_inline(fp: BinaryIO) -> str:
+    """Read one length-prefixed UTF-8 string."""
+    (size,) = STRING.unpack(_read_exact(fp, STRING.size))
+    return _read_exact(fp, size).decode("utf-8")
+
+
+def _iter_binary(fp: BinaryIO) -> Iterator[Record]:
+    """Yield records from a binary snapshot positioned just after MAGIC."""
+    (version,) = VERSION.unpack(_read_exact(fp, VERSION.size))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    strings = []
+    read = fp.read
+    while True:
+        tag = read(1)
+        if not tag:
+            return
+        if tag == TAG_TASK:
+            task_id, duration, priority, completed, *refs = TASK.unpack(_read_exact(fp, TASK.size))
+            category, frequency, day, time = (strings[i] for i in refs)
+            title = _read_inline(fp)
+            yield "task", Task(title=title, duration_minutes=duration, priority=priority,
+                               id=task_id, category=category, notes=_read_inline(fp),
+                               completed=bool(completed), frequency=frequency, date=day, time=time)
+        elif tag == TAG_STRING:
+            strings.append(_read_inline(fp))
+        elif tag == TAG_PET:
+            (species,) = PET.unpack(_read_exact(fp, PET.size))
+            yield "pet", Pet(name=_read_inline(fp), species=strings[species])
+        elif tag == TAG_OWNER:
+            name, minutes, daily = OWNER.unpack(_read_exact(fp, OWNER.size))
+            yield "owner", Owner(name=strings[name], available_minutes=minutes,
+                                 daily_minutes=json.loads(strings[daily]))
+        else:
+            raise ValueError(f"Unknown snapshot record tag {tag!r}")
+
+
+def _iter_jsonl(lines: Iterator[str]) -> Iterator[Record]:
+    """Yield records from the lines of a JSON-lines snapshot."""
+    header = json.loads(next(lines, "{}"))
+    if header.get("format") != JSONL_FORMAT:
+        raise ValueError("Not a PawPal snapshot")
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {header.get('version')}")
+    owner = header["owner"]
+    yield "owner", Owner(name=owner["name"], available_minutes=owner["available_minutes"],
+                         daily_minutes=owner.get("daily_minutes", {}))
+    for line in lines:
+        data = json.loads(line)
+        if "pet" in data:
+            yield "pet", Pet(name=data["pet"], species=data["species"])
+        else:
+            yield "task", Task.from_dict(data)
+
+
+def iter_records(path: str) -> Iterator[Record]:
+    """Stream ("owner" | "pet" | "task", object) records from a snapshot of either mode.
+
+    Records are produced one at a time. Beyond the current record, memory holds only
+    the binary table of low-cardinality strings, which does not grow with the number
+    of tasks. New Task ids are reserved above each task's as it is read, so a stream
+    stopped early still protects the ids it handed out.
+    """
+    highest = 0
+    with open(path, "rb") as fp:
+        if fp.read(len(MAGIC)) == MAGIC:
+            records = _iter_binary(fp)
+        else:
+            fp.seek(0)
+            records = _iter_jsonl(line.decode("utf-8") for line in fp)
+        for kind, obj in records:
+            if kind == "task" and obj.id > highest:
+                highest = obj.id
+                reserve_task_ids(highest)
+            yield kind, obj
+
+
+def iter_tasks(path: str) -> Iterator[Task]:
+    """Stream just the tasks of a snapshot, in file order."""
+    return (obj for kind, obj in iter_records(path) if kind == "task")
+
+
+def read_snapshot(path: str) -> Owner:
+    """Load a whole snapshot back into an Owner with its pets and tasks."""
+    owner = None
+    pets = []
+    for kind, obj in iter_records(path):
+        if kind == "owner":
+            owner = obj
+        elif kind == "pet":
+            pets.append(obj)
+        else:
+            pets[-1].add_task(obj)
+    if owner is None:
+        raise ValueError("Snapshot has no owner record")
+    # Attaching pets once their tasks are in lets the owner index each pet in one pass.
+    for pet in pets:
+        owner.add_pet(pet)
+    return owner
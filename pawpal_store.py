@@ -0,0 +1,257 @@
+import sys
+from array import array
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Union
+
+from pawpal_system import Owner, Task, parse_minute_of_day
+
+
+class TaskStore:
+    """Columnar storage for large task collections.
+
+    Each task is one row across parallel arrays instead of one Python object, so a
+    hundred thousand tasks cost a few machine words each rather than a full Task.
+    Repeated strings (category, frequency, pet name) are interned into a shared table.
+    Rows point at their pet by position, so two pets with the same name stay apart.
+    Dates must be "YYYY-MM-DD" and times "HH:MM" (or blank), since both are stored as
+    integers: date ordinal (0 = undated) and minute of day (-1 = untimed).
+    """
+
+    def __init__(self):
+        """Create an empty store."""
+        self.ids = array("q")
+        self.durations = array("l")
+        self.priorities = array("l")
+        self.date_ordinals = array("l")
+        self.minutes = array("h")
+        self.completed = bytearray()
+        self.pets = array("l")        # position of the owning pet in pet_names
+        self.pet_names = array("l")   # string-table index of each pet's name, in add_pet() order
+        self.categories = array("l")  # string-table index
+        self.frequencies = array("l") # string-table index
+        self.titles: List[str] = []
+        self.notes: List[str] = []
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._last_pet: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self.ids)
+
+    def intern(self, text: str) -> int:
+        """Return the string-table index for text, adding it if it is new."""
+        index = self._string_ids.get(text)
+        if index is None:
+            index = self._string_ids[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def add_pet(self, name: str) -> int:
+        """Register a pet and return its position; every call adds a new pet, even for a known name."""
+        self.pet_names.append(self.intern(name))
+        self._last_pet[name] = len(self.pet_names) - 1
+        return len(self.pet_names) - 1
+
+    def append(self, task: Task, pet_name: str = "", pet: Optional[int] = None) -> int:
+        """Copy a task into a new row and return the row number.
+
+        The row belongs to pet (a position from add_pet()) if given, otherwise to the
+        most recently added pet called pet_name, which is added first if there is none.
+        """
+        if pet is None:
+            pet = self._last_pet.get(pet_name)
+            if pet is None:
+                pet = self.add_pet(pet_name)
+        minute = parse_minute_of_day(task.time) if task.time else -1
+        if minute is None:
+            raise ValueError(f"Task {task.id} has a time that is not HH:MM: {task.time!r}")
+        self.ids.append(task.id)
+        self.durations.append(task.duration_minutes)
+        self.priorities.append(task.priority)
+        self.date_ordinals.append(date.fromisoformat(task.date).toordinal() if task.date else 0)
+        self.minutes.append(minute)
+        self.completed.append(1 if task.completed else 0)
+        self.pets.append(pet)
+        self.categories.append(self.intern(task.category))
+        self.frequencies.append(self.intern(task.frequency))
+        self.titles.append(sys.intern(task.title))   # recurring instances repeat titles
+        self.notes.append(task.notes)
+        return len(self.ids) - 1
+
+    @classmethod
+    def from_owner(cls, owner: Owner) -> "TaskStore":
+        """Build a store holding every task of every pet the owner has."""
+        store = cls()
+        for pet in owner.pets:
+            position = store.add_pet(pet.name)
+            for task in pet.tasks:
+                store.append(task, pet=position)
+        return store
+
+    def row(self, row: int) -> "TaskView":
+        """Return a lightweight read-only view of one row."""
+        return TaskView(self, row)
+
+    def task(self, row: int) -> Task:
+        """Materialise one row as a standalone Task."""
+        return self.row(row).to_task()
+
+    def __iter__(self) -> Iterator["TaskView"]:
+        """Yield a view of every row in insertion order."""
+        return (TaskView(self, i) for i in range(len(self.ids)))
+
+    def pet_name(self, pet: int) -> str:
+        """Return the name of the pet at a position."""
+        return self.strings[self.pet_names[pet]]
+
+    def pet_view(self, pet: Union[int, str]) -> "PetView":
+        """Return a Pet-like view of the rows belonging to one pet.
+
+        pet is a position (as in owner.pets for a store built by from_owner) or a
+        name, which picks the first pet with that name.
+        """
+        if isinstance(pet, str):
+            name = pet
+            pet = next((p for p in range(len(self.pet_names)) if self.pet_name(p) == name), -1)
+        else:
+            name = self.pet_name(pet)
+        return PetView(self, name, [i for i, p in enumerate(self.pets) if p == pet])
+
+    def owner_view(self, owner_name: str = "", available_minutes: int = 0) -> "OwnerView":
+        """Return an Owner-like view over every row."""
+        return OwnerView(self, owner_name, available_minutes)
+
+
+class TaskView:
+    """Read-only, Task-shaped access to one TaskStore row."""
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: TaskStore, index: int):
+        """Point the view at a row."""
+        self.store = store
+        self.index = index
+
+    @property
+    def id(self) -> int:
+        """Return the task id."""
+        return self.store.ids[self.index]
+
+    @property
+    def title(self) -> str:
+        """Return the task title."""
+        return self.store.titles[self.index]
+
+    @property
+    def duration_minutes(self) -> int:
+        """Return the duration in minutes."""
+        return self.store.durations[self.index]
+
+    @property
+    def priority(self) -> int:
+        """Return the priority level."""
+        return self.store.priorities[self.index]
+
+    @property
+    def category(self) -> str:
+        """Return the category, looked up in the string table."""
+        return self.store.strings[self.store.categories[self.index]]
+
+    @property
+    def notes(self) -> str:
+        """Return the free-text notes."""
+        return self.store.notes[self.index]
+
+    @property
+    def completed(self) -> bool:
+        """Return True if the task is done."""
+        return bool(self.store.completed[self.index])
+
+    @property
+    def frequency(self) -> str:
+        """Return the recurrence frequency, looked up in the string table."""
+        return self.store.strings[self.store.frequencies[self.index]]
+
+    @property
+    def date(self) -> str:
+        """Return the date as "YYYY-MM-DD", or "" if undated."""
+        ordinal = self.store.date_ordinals[self.index]
+        return date.fromordinal(ordinal).isoformat() if ordinal else ""
+
+    @property
+    def time(self) -> str:
+        """Return the time as "HH:MM", or "" if untimed."""
+        minute = self.store.minutes[self.index]
+        return f"{minute // 60:02d}:{minute % 60:02d}" if minute >= 0 else ""
+
+    def is_high_priority(self) -> bool:
+        """Return True if this task has the highest priority level (3)."""
+        return self.priority == 3
+
+    def to_task(self) -> Task:
+        """Copy this row out into a standalone Task with the same id."""
+        return Task(
+            title=self.title,
+            duration_minutes=self.duration_minutes,
+            priority=self.priority,
+            id=self.id,
+            category=self.category,
+            notes=self.notes,
+            completed=self.completed,
+            frequency=self.frequency,
+            date=self.date,
+            time=self.time,
+        )
+
+
+class PetView:
+    """Pet-shaped read access to one pet's rows in a TaskStore."""
+
+    def __init__(self, store: TaskStore, name: str, rows: List[int]):
+        """Wrap the given rows of store."""
+        self.store = store
+        self.name = name
+        self.rows = rows
+
+    @property
+    def tasks(self) -> List[TaskView]:
+        """Return a view of each of this pet's rows in insertion order."""
+        return [TaskView(self.store, i) for i in self.rows]
+
+    def get_tasks_by_priority(self, priority: int) -> List[TaskView]:
+        """Return views of the rows matching the given priority level."""
+        priorities = self.store.priorities
+        return [TaskView(self.store, i) for i in self.rows if priorities[i] == priority]
+
+    def get_all_tasks(self) -> List[TaskView]:
+        """Return views of all rows sorted from highest to lowest priority."""
+        priorities = self.store.priorities
+        ordered = sorted(self.rows, key=lambda i: priorities[i], reverse=True)
+        return [TaskView(self.store, i) for i in ordered]
+
+
+class OwnerView:
+    """Owner-shaped read access to every row in a TaskStore."""
+
+    def __init__(self, store: TaskStore, name: str, available_minutes: int):
+        """Wrap the whole store."""
+        self.store = store
+        self.name = name
+        self.available_minutes = available_minutes
+
+    @property
+    def pets(self) -> List[PetView]:
+        """Return a PetView per pet, in add_pet() order, including pets with no rows."""
+        rows: List[List[int]] = [[] for _ in self.store.pet_names]
+        for i, pet in enumerate(self.store.pets):
+            rows[pet].append(i)
+        return [PetView(self.store, self.store.pet_name(p), r) for p, r in enumerate(rows)]
+
+    def get_all_tasks(self) -> List[TaskView]:
+        """Return a view of every row."""
+        return list(self.store)
+
+    def filter_by_priority(self, priority: int) -> List[TaskView]:
+        """Return views of every row matching the given priority level."""
+        priorities = self.store.priorities
+        return [TaskView(self.store, i) for i in range(len(priorities)) if priorities[i] == priority]
@@ -1,15 +1,102 @@
-from dataclasses import dataclass, field
+import heapq
+import os
+import weakref
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, fields
 from datetime import date, timedelta
-from typing import List, Tuple
-from uuid import uuid4
+from functools import lru_cache
+from importlib import import_module
+from itertools import count, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+# Task ids are namespaced: each process counts up from the start of a randomly drawn
+# block of ID_BLOCK_SIZE ids out of ID_BLOCKS, so tasks created in different processes
+# (and kept by snapshots, the database or the service) do not share ids when they are
+# loaded side by side. Copies of a task (a reload, Scenario.to_owner) keep its id on
+# purpose. Ids stay below 2**53, so they survive a round trip through JSON in any client.
+ID_BLOCK_BITS = 24
+ID_BLOCK_SIZE = 1 << ID_BLOCK_BITS
+ID_BLOCKS = 1 << (53 - ID_BLOCK_BITS)
+_id_block = 0          # first id of the current block
+_id_next = 0
+_id_limit = 0          # one past the last id of the current block
 
-@dataclass
-class Task:
+
+def _new_id_block() -> None:
+    """Start issuing ids from a fresh, randomly chosen block (block 0 is never used)."""
+    global _id_block, _id_next, _id_limit
+    block = int.from_bytes(os.urandom(4), "little") % (ID_BLOCKS - 1) + 1
+    _id_block = _id_next = block * ID_BLOCK_SIZE
+    _id_limit = _id_block + ID_BLOCK_SIZE
+
+
+def _next_task_id() -> int:
+    """Return the next unused id from this process's block, starting a new block when it runs out."""
+    global _id_next
+    if _id_next >= _id_limit:
+        _new_id_block()
+    _id_next += 1
+    return _id_next - 1
+
+
+def reserve_task_ids(highest: int) -> None:
+    """Make sure Tasks created from now on get ids above highest (e.g. after loading saved tasks).
+
+    Only ids in the current block can clash with new ones, so others are ignored.
+    """
+    global _id_next
+    if _id_block <= highest < _id_limit:
+        _id_next = max(_id_next, highest + 1)
+
+
+# A forked child must not hand out the ids its parent goes on to use.
+if hasattr(os, "register_at_fork"):      # POSIX only; Windows has no fork to guard against
+    os.register_at_fork(after_in_child=_new_id_block)
+
+
+def parse_minute_of_day(time_str: str) -> Optional[int]:
+    """Convert an "HH:MM" string to minutes after midnight, or None if it is blank or malformed."""
+    hours, sep, minutes = time_str.strip().partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit():
+        return None
+    total = int(hours) * 60 + int(minutes)
+    return total if int(minutes) < 60 and total < 24 * 60 else None
+
+
+RECURRENCE_DAYS = {"daily": 1, "weekly": 7}
+
+
+@lru_cache(maxsize=4096)
+def _ordinal(iso_date: str) -> int:
+    """Return the proleptic ordinal of a "YYYY-MM-DD" string."""
+    return date.fromisoformat(iso_date).toordinal()
+
+
+@lru_cache(maxsize=4096)
+def _iso(ordinal: int) -> str:
+    """Return the "YYYY-MM-DD" string for a proleptic ordinal."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _series(anchor: int, step: int, start: int, end: int) -> Tuple[int, ...]:
+    """Return the day ordinals in [start, end] hit by a series from anchor repeating every step days."""
+    if anchor < start:
+        anchor += -(-(start - anchor) // step) * step
+    return tuple(range(anchor, end + 1, step))
+
+
+class _PetLink:
+    """Slot for a task's back-reference to its Pet, kept out of the dataclass fields."""
+    __slots__ = ("_pet",)
+
+
+@dataclass(slots=True)
+class Task(_PetLink):
     title: str
     duration_minutes: int
     priority: int          # 1 = low, 2 = medium, 3 = high
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: int = field(default_factory=_next_task_id)
     category: str = ""     # e.g. "exercise", "feeding", "meds", "grooming", "enrichment"
     notes: str = ""
     completed: bool = False
@@ -17,6 +104,47 @@ class Task:
     date: str = ""         # "YYYY-MM-DD", e.g. "2026-02-23"
     time: str = ""         # "HH:MM", e.g. "09:00"
 
+    def __new__(cls, *args, **kwargs):
+        """Create a task with its pet link already empty, before __init__ sets any field."""
+        task = object.__new__(cls)
+        object.__setattr__(task, "_pet", None)
+        return task
+
+    def __setattr__(self, name, value) -> None:
+        """Set an attribute and tell the owning pet so its listeners can update their indexes."""
+        object.__setattr__(self, name, value)
+        if self._pet is not None and name != "_pet":
+            self._pet._emit("change", self, name)
+
+    def __getstate__(self) -> tuple:
+        """Pickle the field values together with the owning pet."""
+        return tuple(getattr(self, f.name) for f in fields(self)), self._pet
+
+    def __setstate__(self, state: tuple) -> None:
+        """Restore fields and the pet link without firing change events."""
+        values, pet = state
+        for f, value in zip(fields(self), values):
+            object.__setattr__(self, f.name, value)
+        object.__setattr__(self, "_pet", pet)
+
+    @property
+    def pet(self) -> Optional["Pet"]:
+        """Return the Pet this task was added to, or None."""
+        return self._pet
+
+    def occurrence_ordinals(self, start: int, end: int) -> Tuple[int, ...]:
+        """Return the day ordinals in [start, end] on which this task is due.
+
+        A pending daily/weekly task is a rule that repeats from its date onward. A
+        completed one covers only its own date, because completing it hands the rule on
+        to the next instance. Undated tasks are due from start.
+        """
+        anchor = _ordinal(self.date) if self.date else start
+        step = RECURRENCE_DAYS.get(self.frequency)
+        if step and not self.completed:
+            return _series(anchor, step, start, end)
+        return (anchor,) if start <= anchor <= end else ()
+
     def mark_complete(self) -> None:
         """Mark this task as completed."""
         self.completed = True
@@ -34,8 +162,220 @@ class Task:
             "priority": self.priority,
             "category": self.category,
             "notes": self.notes,
+            "completed": self.completed,
+            "frequency": self.frequency,
+            "date": self.date,
+            "time": self.time,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
+        """Build a Task from a to_dict() dictionary; missing optional keys take their defaults."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
+@dataclass
+class TaskEvent:
+    """A change to one of a pet's tasks, delivered to every subscribed listener."""
+    kind: str              # "add", "remove", or "change"
+    task: Task
+    pet: "Pet"
+    field: str = ""        # name of the changed attribute for "change" events
+
+
+TaskListener = Callable[[TaskEvent], None]
+
+
+@dataclass(frozen=True, slots=True)
+class Occurrence:
+    """One dated instance of a task, produced on demand instead of stored as a Task."""
+    date: str              # "YYYY-MM-DD"
+    task: Task
+
+
+class IntervalIndex:
+    """Timed tasks grouped by date and kept sorted by start minute, for overlap queries.
+
+    A task occupies [start, start + duration) on its date; zero-length tasks count as one
+    minute so two of them at the same time still clash. Undated tasks share the "" date.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """Create an index, optionally pre-filled with tasks."""
+        self._days: Dict[str, List[Tuple[int, int, int, Task]]] = {}  # date -> sorted (start, end, seq, task)
+        self._longest: Dict[str, int] = {}                             # date -> longest interval ever filed
+        self._key_of: Dict[int, Tuple[str, Tuple[int, int, int]]] = {}  # id(task) -> (date, sort key)
+        self._seq = 0
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._key_of)
+
+    @staticmethod
+    def span(task: Task) -> Optional[Tuple[int, int]]:
+        """Return the (start, end) minutes a task occupies, or None if it has no usable time."""
+        start = parse_minute_of_day(task.time) if task.time else None
+        if start is None:
+            return None
+        return start, start + max(task.duration_minutes, 1)
+
+    def add(self, task: Task) -> None:
+        """File a task under its date; tasks without a usable time are ignored."""
+        span = self.span(task)
+        if span is None:
+            return
+        self._seq += 1
+        key = (span[0], span[1], self._seq)
+        insort(self._days.setdefault(task.date, []), key + (task,))
+        self._longest[task.date] = max(self._longest.get(task.date, 0), span[1] - span[0])
+        self._key_of[id(task)] = (task.date, key)
+
+    def discard(self, task: Task) -> None:
+        """Remove a task if it is indexed."""
+        filed = self._key_of.pop(id(task), None)
+        if filed is None:
+            return
+        day, key = filed
+        entries = self._days[day]
+        del entries[bisect_left(entries, key)]
+        if not entries:
+            del self._days[day]
+            del self._longest[day]
+
+    def overlapping(self, task: Task) -> List[Task]:
+        """Return indexed tasks whose interval overlaps the given task's, in start order."""
+        span = self.span(task)
+        entries = self._days.get(task.date)
+        if span is None or not entries:
+            return []
+        start, end = span
+        # Nothing starting before (start - longest) can still be running at start.
+        lo = bisect_left(entries, (start - self._longest[task.date],))
+        hi = bisect_left(entries, (end,))
+        return [t for s, e, _, t in entries[lo:hi] if e > start and t is not task]
+
+    def pairs(self) -> Iterator[Tuple[Task, Task]]:
+        """Yield every overlapping (earlier, later) pair by sweeping each day once."""
+        for entries in self._days.values():
+            yield from _sweep(entries)
+
+
+def _sweep(entries: List[Tuple[int, int, int, Task]]) -> Iterator[Tuple[Task, Task]]:
+    """Yield overlapping pairs from (start, end, seq, task) entries sorted by start."""
+    active: List[Tuple[int, int, Task]] = []   # min-heap of (end, seq, task) still running
+    for start, end, seq, task in entries:
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, task
+        heapq.heappush(active, (end, seq, task))
+
+
+def iter_overlaps(tasks: Iterable[Task]) -> Iterator[Tuple[Task, Task]]:
+    """Yield overlapping task pairs from any collection in O(n log n + k)."""
+    by_day: Dict[str, List[Tuple[int, int, int, Task]]] = {}
+    for seq, task in enumerate(tasks):
+        span = IntervalIndex.span(task)
+        if span is not None:
+            by_day.setdefault(task.date, []).append((span[0], span[1], seq, task))
+    for entries in by_day.values():
+        entries.sort()
+        yield from _sweep(entries)
+
+
+INDEXED_FIELDS = ("priority", "category", "date", "completed")
+
+
+class TaskIndex:
+    """Secondary indexes from field value to tasks, for equality queries on INDEXED_FIELDS.
+
+    Each field maps a value to a bucket of id(task) -> task. A query intersects the
+    buckets it names, starting from the smallest, and returns the hits in the
+    (rank, seq) order recorded when each task was added.
+    """
+
+    def __init__(self):
+        """Create an empty index."""
+        self._buckets: Dict[str, Dict[object, Dict[int, Task]]] = {name: {} for name in INDEXED_FIELDS}
+        self._tasks: Dict[int, Task] = {}                  # id(task) -> task
+        self._values: Dict[int, Tuple] = {}                # id(task) -> indexed field values
+        self._order: Dict[int, Tuple[int, int]] = {}       # id(task) -> (rank, seq)
+        self._seq = count()
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._values)
+
+    def add(self, task: Task, rank: int = 0) -> None:
+        """File a task under each indexed field; rank orders it ahead of later groups."""
+        key = id(task)
+        values = tuple(getattr(task, name) for name in INDEXED_FIELDS)
+        self._tasks[key] = task
+        self._values[key] = values
+        self._order[key] = (rank, next(self._seq))
+        for name, value in zip(INDEXED_FIELDS, values):
+            self._buckets[name].setdefault(value, {})[key] = task
+
+    def discard(self, task: Task) -> None:
+        """Remove a task if it is indexed."""
+        key = id(task)
+        values = self._values.pop(key, None)
+        if values is None:
+            return
+        del self._tasks[key]
+        del self._order[key]
+        for name, value in zip(INDEXED_FIELDS, values):
+            self._unfile(name, value, key)
+
+    def update(self, task: Task, field_name: str) -> None:
+        """Move a task to the bucket for its new value of field_name, keeping its place in order."""
+        key = id(task)
+        values = self._values.get(key)
+        if values is None or field_name not in INDEXED_FIELDS:
+            return
+        i = INDEXED_FIELDS.index(field_name)
+        value = getattr(task, field_name)
+        if value == values[i]:
+            return
+        self._unfile(field_name, values[i], key)
+        self._buckets[field_name].setdefault(value, {})[key] = task
+        self._values[key] = values[:i] + (value,) + values[i + 1:]
+
+    def _unfile(self, name: str, value: object, key: int) -> None:
+        """Drop key from one bucket, deleting the bucket once it is empty."""
+        buckets = self._buckets[name]
+        bucket = buckets[value]
+        del bucket[key]
+        if not bucket:
+            del buckets[value]
+
+    def count(self, field_name: str, value: object) -> int:
+        """Return how many tasks have the given value for an indexed field."""
+        return len(self._buckets[field_name].get(value, ()))
+
+    def query(self, **criteria) -> List[Task]:
+        """Return tasks matching every field=value criterion; None means "any"."""
+        buckets = []
+        for name, value in criteria.items():
+            if name not in self._buckets:
+                raise ValueError(f"Cannot query on {name!r}; indexed fields are {INDEXED_FIELDS}")
+            if value is None:
+                continue
+            bucket = self._buckets[name].get(value)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        if buckets:
+            buckets.sort(key=len)
+            smallest, rest = buckets[0], buckets[1:]
+            hits = [key for key in smallest if all(key in bucket for bucket in rest)]
+        else:
+            hits = list(self._tasks)
+        hits.sort(key=self._order.__getitem__)
+        return [self._tasks[key] for key in hits]
+
 
 @dataclass
 class Pet:
@@ -43,21 +383,92 @@ class Pet:
     species: str           # "dog", "cat", "other"
     tasks: List[Task] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Claim any tasks passed to the constructor and start with no listeners."""
+        self._listeners: List[TaskListener] = []
+        self._by_priority: Optional[Tuple[List[Task], Dict[int, List[Task]]]] = None
+        self.version = 0                           # bumped on every task change
+        for task in self.tasks:
+            task._pet = self
+
+    def __getstate__(self) -> dict:
+        """Pickle the pet without its listeners; whoever owns it re-subscribes on load."""
+        state = self.__dict__.copy()
+        del state["_listeners"]
+        state.pop("_by_priority", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled pet with no listeners."""
+        self.__dict__.update(state)
+        self._listeners = []
+        self._by_priority = None
+        self.__dict__.setdefault("version", 0)
+
+    def subscribe(self, listener: TaskListener) -> None:
+        """Call listener with a TaskEvent whenever a task is added, removed, or changed."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: TaskListener) -> None:
+        """Stop sending task events to a previously subscribed listener."""
+        self._listeners = [l for l in self._listeners if l != listener]
+
+    def _loaded_tasks(self) -> List[Task]:
+        """Return the tasks already in memory; lazily loaded pets override this."""
+        return self.tasks
+
+    def _emit(self, kind: str, task: Task, field_name: str = "") -> None:
+        """Deliver a task event to every listener."""
+        self.version += 1
+        if kind != "change" or field_name == "priority":
+            self._by_priority = None
+        if self._listeners:
+            event = TaskEvent(kind=kind, task=task, pet=self, field=field_name)
+            for listener in list(self._listeners):
+                listener(event)
+
     def add_task(self, task: Task) -> None:
         """Append a task to this pet's task list."""
+        task._pet = self
         self.tasks.append(task)
+        self._emit("add", task)
 
-    def remove_task(self, task_id: str) -> None:
+    def remove_task(self, task_id: int) -> None:
         """Remove the task with the given ID from this pet's task list."""
-        self.tasks = [t for t in self.tasks if t.id != task_id]
+        self.remove_tasks([task_id])
+
+    def remove_tasks(self, task_ids: Iterable[int]) -> None:
+        """Remove every task whose ID is given, in a single pass over the task list."""
+        ids = set(task_ids)
+        removed = [t for t in self.tasks if t.id in ids]
+        if not removed:
+            return
+        self.tasks = [t for t in self.tasks if t.id not in ids]
+        for task in removed:
+            task._pet = None
+            self._emit("remove", task)
+
+    def iter_conflicts(self) -> Iterator[Tuple[Task, Task]]:
+        """Yield pairs of this pet's tasks whose time intervals overlap on the same date."""
+        return iter_overlaps(self.tasks)
+
+    def _priority_views(self) -> Tuple[List[Task], Dict[int, List[Task]]]:
+        """Return tasks by descending priority and grouped by priority, sorting only after a change."""
+        if self._by_priority is None:
+            ordered = sorted(self.tasks, key=lambda t: t.priority, reverse=True)
+            groups: Dict[int, List[Task]] = {}
+            for task in ordered:
+                groups.setdefault(task.priority, []).append(task)
+            self._by_priority = (ordered, groups)
+        return self._by_priority
 
     def get_tasks_by_priority(self, priority: int) -> List[Task]:
         """Return all tasks matching the given priority level."""
-        return [t for t in self.tasks if t.priority == priority]
+        return list(self._priority_views()[1].get(priority, ()))
 
     def get_all_tasks(self) -> List[Task]:
         """Return all tasks sorted from highest to lowest priority."""
-        return sorted(self.tasks, key=lambda t: t.priority, reverse=True)
+        return list(self._priority_views()[0])
 
 
 @dataclass
@@ -65,49 +476,506 @@ class Owner:
     name: str
     available_minutes: int
     pets: List[Pet] = field(default_factory=list)
+    # Per-day budgets for multi-day planning, keyed by "YYYY-MM-DD" or a weekday name
+    # such as "saturday"; days not listed fall back to available_minutes.
+    daily_minutes: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Build the time-interval and field indexes over any pets passed to the constructor."""
+        self._intervals = IntervalIndex()
+        self._index = TaskIndex()
+        self._ranks: Dict[int, int] = {}           # id(pet) -> position in self.pets
+        self._all_tasks: Optional[List[Task]] = None
+        self._listeners: List[Callable[[], Optional[TaskListener]]] = []
+        self.version = 0                           # bumped on every pet or task change
+        for pet in self.pets:
+            self._attach(pet)
+
+    def __getstate__(self) -> dict:
+        """Pickle only the dataclass fields; indexes and listeners are rebuilt on load."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled owner and rebuild its indexes."""
+        self.__dict__.update(state)
+        self.__post_init__()
+
+    def subscribe(self, listener: TaskListener, weak: bool = False) -> None:
+        """Call listener with a TaskEvent whenever any pet's tasks change.
+
+        With weak=True a bound-method listener does not keep its object alive, and its
+        entry is removed as soon as that object is garbage collected.
+        """
+        self._listeners.append(weakref.WeakMethod(listener, self._forget) if weak else (lambda: listener))
+
+    def _forget(self, ref: weakref.WeakMethod) -> None:
+        """Drop the entry of a weak listener whose object has been collected."""
+        self._listeners = [r for r in self._listeners if r is not ref]
+
+    def unsubscribe(self, listener: TaskListener) -> None:
+        """Stop sending task events to a previously subscribed listener."""
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, listener)]
+
+    def _notify(self, event: TaskEvent) -> None:
+        """Forward a task event to every live listener."""
+        for ref in list(self._listeners):
+            listener = ref()
+            if listener is not None:
+                listener(event)
 
     def add_pet(self, pet: Pet) -> None:
         """Add a pet to this owner's pet list."""
         self.pets.append(pet)
+        self._attach(pet)
+        if self._listeners:
+            for task in pet._loaded_tasks():
+                self._notify(TaskEvent(kind="add", task=task, pet=pet))
+
+    def _attach(self, pet: Pet) -> None:
+        """Index a pet's existing tasks and keep the indexes current as they change."""
+        pet.subscribe(self._on_task_event)
+        self.version += 1
+        rank = self._ranks.setdefault(id(pet), len(self._ranks))
+        for task in pet._loaded_tasks():
+            self._intervals.add(task)
+            self._index.add(task, rank)
+        self._all_tasks = None
+
+    def _on_task_event(self, event: TaskEvent) -> None:
+        """Update the indexes for a task that was added, removed, or changed."""
+        self.version += 1
+        if event.kind == "add":
+            self._intervals.add(event.task)
+            self._index.add(event.task, self._ranks[id(event.pet)])
+            self._all_tasks = None
+        elif event.kind == "remove":
+            self._intervals.discard(event.task)
+            self._index.discard(event.task)
+            self._all_tasks = None
+        else:
+            if event.field in ("time", "date", "duration_minutes"):
+                self._intervals.discard(event.task)
+                self._intervals.add(event.task)
+            self._index.update(event.task, event.field)
+        if self._listeners:
+            self._notify(event)
+
+    def _ensure_loaded(self) -> None:
+        """Read any lazily loaded pets, so their tasks reach the indexes before a lookup."""
+        for pet in self.pets:
+            pet.tasks
+
+    def overlapping(self, task: Task) -> List[Task]:
+        """Return this owner's tasks whose time interval overlaps the given task's."""
+        self._ensure_loaded()
+        return self._intervals.overlapping(task)
+
+    def iter_conflicts(self) -> Iterator[Tuple[Task, Task]]:
+        """Yield pairs of tasks, across all pets, whose time intervals overlap on the same date."""
+        self._ensure_loaded()
+        return self._intervals.pairs()
+
+    def budget_for(self, day: date) -> int:
+        """Return the minutes available on a given day."""
+        if not self.daily_minutes:
+            return self.available_minutes
+        iso = day.isoformat()
+        if iso in self.daily_minutes:
+            return self.daily_minutes[iso]
+        return self.daily_minutes.get(day.strftime("%A").lower(), self.available_minutes)
 
     def get_all_tasks(self) -> List[Task]:
         """Collect every task from every pet this owner has."""
-        all_tasks = []
-        for pet in self.pets:
-            all_tasks.extend(pet.tasks)
-        return all_tasks
+        if self._all_tasks is None:
+            all_tasks = []
+            for pet in self.pets:
+                all_tasks.extend(pet.tasks)
+            self._all_tasks = all_tasks
+        return list(self._all_tasks)
+
+    def query(self, priority: Optional[int] = None, category: Optional[str] = None,
+              date: Optional[str] = None, completed: Optional[bool] = None) -> List[Task]:
+        """Return tasks matching every given filter, in get_all_tasks() order.
+
+        Filters are answered from the secondary indexes by intersecting their buckets,
+        so the cost follows the smallest matching bucket rather than the task count.
+        """
+        self._ensure_loaded()
+        return self._index.query(priority=priority, category=category, date=date, completed=completed)
 
     def filter_by_priority(self, priority: int) -> List[Task]:
         """Return all tasks across all pets matching the given priority level."""
-        return [t for t in self.get_all_tasks() if t.priority == priority]
+        return self.query(priority=priority)
+
+
+@dataclass
+class DayPlan:
+    """The greedy plan for one day of a multi-day horizon."""
+    date: str                          # "YYYY-MM-DD"
+    budget: int
+    scheduled: List[Task] = field(default_factory=list)
+    unscheduled: List[Task] = field(default_factory=list)   # carried into the next day
+
+    @property
+    def minutes_used(self) -> int:
+        """Return the total minutes of the scheduled tasks."""
+        return sum(t.duration_minutes for t in self.scheduled)
+
+
+PRIORITY_LABELS = {1: "low", 2: "medium", 3: "high"}
+MAX_CONFLICTS_NAMED = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Explanation:
+    """Why one task is in or out of the schedule; text() renders it on demand.
+
+    reason is one of:
+      "fits_budget"     scheduled; minutes_used is the running total including it
+      "lower_priority"  skipped; higher-priority tasks (outranked_by is the nearest one
+                        scheduled) left too little time, short by shortfall minutes
+      "over_budget"     skipped; the time left was shortfall minutes too little, with no
+                        higher-priority task to blame (same-priority tasks came first, or
+                        the task is longer than the whole budget)
+      "traded_off"      skipped by "optimal" mode even though it would have fit at its turn,
+                        because other tasks packed more priority-weighted minutes
+      "unplanned"       no schedule has been built yet
+
+    conflicts is looked up through find_conflicts only when read, so walking many
+    records costs no interval queries unless something asks for the overlaps.
+    """
+    task: Task
+    reason: str
+    budget: int
+    minutes_used: int = 0
+    shortfall: int = 0
+    outranked_by: Optional[Task] = None
+    find_conflicts: Optional[Callable[[Task], Iterable[Task]]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def conflicts(self) -> Tuple[Task, ...]:
+        """Return the tasks whose time interval overlaps this task's."""
+        return tuple(self.find_conflicts(self.task)) if self.find_conflicts else ()
+
+    @property
+    def scheduled(self) -> bool:
+        """Return True if the task made it into the schedule."""
+        return self.reason == "fits_budget"
+
+    def text(self) -> str:
+        """Render the explanation as one English sentence or two."""
+        text = _explanation_head(self.task) + _explanation_body(self.reason, self.budget, self.minutes_used,
+                                                                self.shortfall, self.outranked_by)
+        conflicts = self.conflicts
+        return text + _overlaps_text(conflicts) if conflicts else text
+
+
+def _explanation_head(task: Task) -> str:
+    """Render the part of an explanation that names the task."""
+    return (f"'{task.title}' ({task.duration_minutes} min, "
+            f"{PRIORITY_LABELS.get(task.priority, 'unknown')} priority) — ")
+
+
+def _explanation_body(reason: str, budget: int, minutes_used: int, shortfall: int,
+                      outranked_by: Optional[Task]) -> str:
+    """Render the part of an explanation that gives the reason.
+
+    It does not depend on the task itself, so Scheduler.explain() renders each
+    distinct body once and reuses it across the long runs of skipped tasks that share it.
+    """
+    if reason == "lower_priority":
+        return (f"skipped: higher-priority tasks such as '{outranked_by.title}' came first, "
+                f"leaving {budget - minutes_used} min ({shortfall} min short).")
+    if reason == "over_budget":
+        return f"skipped: only {budget - minutes_used} min remained ({shortfall} min short)."
+    if reason == "fits_budget":
+        return (f"included because it fits within your time budget. "
+                f"Time used so far: {minutes_used}/{budget} min.")
+    if reason == "traded_off":
+        return "skipped: other tasks made better use of the time budget."
+    return "not scheduled yet; build a schedule first."
+
+
+def _overlaps_text(conflicts: Sequence[Task]) -> str:
+    """Render the " Overlaps ..." sentence appended to an explanation."""
+    names = ", ".join(f"'{t.title}'" for t in conflicts[:MAX_CONFLICTS_NAMED])
+    extra = len(conflicts) - MAX_CONFLICTS_NAMED
+    return f" Overlaps {names}" + (f" and {extra} more." if extra > 0 else ".")
+
+
+def _knapsack(items: List[Tuple[int, int]], budget: int) -> List[int]:
+    """Return indexes of (weight, value) items that maximise total value within budget.
+
+    Classic 0/1 DP over minutes: one flat row of best values plus one bytearray of
+    "taken" flags per item for reconstruction, so memory is len(items) * (budget + 1) bytes.
+    """
+    best = [0] * (budget + 1)
+    taken: List[bytearray] = []
+    for weight, value in items:
+        # best[w - weight] + value for every w >= weight, compared against best[w].
+        with_item = [b + value for b in best[:budget + 1 - weight]]
+        without = best[weight:]
+        taken.append(bytearray(weight) + bytearray(c > u for c, u in zip(with_item, without)))
+        best[weight:] = [c if c > u else u for c, u in zip(with_item, without)]
+    chosen = []
+    remaining = budget
+    for i in range(len(items) - 1, -1, -1):
+        if taken[i][remaining]:
+            chosen.append(i)
+            remaining -= items[i][0]
+    return chosen
+
+
+def greedy_fill(durations: Sequence[int], budget: int) -> List[int]:
+    """Return the positions greedy scheduling takes from durations already in priority order."""
+    picked = []
+    for i, duration in enumerate(durations):
+        if duration <= budget:
+            picked.append(i)
+            budget -= duration
+    return picked
+
+
+def optimal_fill(durations: Sequence[int], priorities: Sequence[int], budget: int,
+                 max_cells: int) -> Optional[List[int]]:
+    """Return the positions that maximise total priority x duration within budget.
+
+    Columns must already be in priority order; ties inside a (duration, priority) group
+    go to the earliest positions, as greedy would. Returns None when the DP would need
+    more than max_cells cells. Tasks with the same (duration, priority) are
+    interchangeable, so each group becomes a handful of bundled items (1, 2, 4, ...
+    copies) instead of one item per task.
+    """
+    picked = [i for i, d in enumerate(durations) if d <= 0]
+    groups: Dict[Tuple[int, int], List[int]] = {}
+    for i, (duration, priority) in enumerate(zip(durations, priorities)):
+        if 0 < duration <= budget:
+            groups.setdefault((duration, priority), []).append(i)
+
+    items: List[Tuple[int, int]] = []
+    owners: List[Tuple[Tuple[int, int], int]] = []   # item -> (group key, copies)
+    for (duration, priority), members in groups.items():
+        count = min(len(members), budget // duration)
+        bundle = 1
+        while count > 0:
+            copies = min(bundle, count)
+            items.append((duration * copies, priority * duration * copies))
+            owners.append(((duration, priority), copies))
+            count -= copies
+            bundle *= 2
+    if len(items) * (budget + 1) > max_cells:
+        return None
+
+    taken: Dict[Tuple[int, int], int] = {}
+    for i in _knapsack(items, budget):
+        key, copies = owners[i]
+        taken[key] = taken.get(key, 0) + copies
+    for key, copies in taken.items():
+        picked.extend(groups[key][:copies])
+    return sorted(picked)
 
 
 class Scheduler:
+    SCHEDULE_MODES = ("greedy", "optimal")
+    # Past this many DP cells (items x minutes) "optimal" mode falls back to greedy.
+    OPTIMAL_MAX_CELLS = 2_000_000
+    # Public methods timed by instrument(); see pawpal_profile.
+    INSTRUMENTED_METHODS = ("build_schedule", "detect_conflicts", "explain", "get_unscheduled",
+                            "mark_task_complete")
+
     def __init__(self, owner: Owner):
         """Initialize the scheduler with an Owner and an empty schedule."""
         self.owner = owner
-        self.schedule: List[Task] = []
-
-    def build_schedule(self) -> None:
-        """Greedily fill the schedule with highest-priority tasks that fit within the time budget."""
-        all_tasks = self.owner.get_all_tasks()
-        sorted_tasks = sorted(all_tasks, key=lambda t: t.priority, reverse=True)
-        time_remaining = self.owner.available_minutes
-        self.schedule = []
-        for task in sorted_tasks:
-            if task.duration_minutes <= time_remaining:
-                self.schedule.append(task)
-                time_remaining -= task.duration_minutes
+        self.mode_used = ""
+        self._mode = ""                                    # "" until build_schedule has run
+        # Every task, kept sorted in greedy order by (-priority, pet position, arrival).
+        self._entries: List[Tuple[int, int, int, Task]] = []
+        self._key_of: Dict[int, Tuple[int, int, int]] = {}  # id(task) -> its sort key
+        self._before: List[int] = []                        # minutes left before entry j is tried
+        self._chosen: Dict[int, Task] = {}                  # id(task) -> scheduled task
+        self._budget = 0
+        self._left = 0                                      # minutes left after the last entry
+        self._stale = False                                 # optimal plan needs recomputing
+        self._schedule: Optional[List[Task]] = []
+        self._seq = 0
+        self._pet_rank: Dict[int, int] = {}
+        self._explained: Tuple[tuple, List[str]] = ((), [])  # (owner version, mode, budget), explain() lines
+
+    def instrument(self, capture: str = "", stats=None):
+        """Return a context manager that times INSTRUMENTED_METHODS and yields the stats.
+
+        capture may be "cprofile" or "tracemalloc" for a deeper look. Nothing is wrapped
+        outside the with-block, so an uninstrumented scheduler pays no overhead.
+        """
+        from pawpal_profile import instrument
+        return instrument(self, capture, stats)
+
+    def build_schedule(self, mode: str = "greedy") -> None:
+        """Fill the schedule with tasks that fit within the time budget.
+
+        "greedy" takes tasks from highest to lowest priority while they fit. "optimal"
+        maximises total priority-weighted minutes (priority x duration) instead, falling
+        back to greedy when the problem is too large; mode_used records which ran.
+
+        Afterwards the scheduler follows the owner's change events, so adding, removing,
+        or re-prioritising a task updates the schedule without another full rebuild.
+        """
+        if mode not in self.SCHEDULE_MODES:
+            raise ValueError(f"Unknown schedule mode {mode!r}; expected one of {self.SCHEDULE_MODES}")
+        self._entries, self._key_of, self._pet_rank = [], {}, {}
+        for rank, pet in enumerate(self.owner.pets):
+            self._pet_rank[id(pet)] = rank
+            for task in pet.tasks:
+                self._seq += 1
+                key = (-task.priority, rank, self._seq)
+                self._entries.append(key + (task,))
+                self._key_of[id(task)] = key
+        self._entries.sort(key=lambda e: e[:3])
+        self._before = [0] * len(self._entries)
+        self._budget = max(self.owner.available_minutes, 0)
+        if not self._mode:
+            # Only a built schedule has anything to keep current, so follow the owner from here.
+            self.owner.subscribe(self._on_task_event, weak=True)
+        self._mode = mode
+        if mode == "optimal":
+            self._replan_optimal()
+        else:
+            self._refill_all()
+
+    @property
+    def schedule(self) -> List[Task]:
+        """Return the scheduled tasks, highest priority first."""
+        self._sync()
+        if self._schedule is None:
+            self._schedule = [e[3] for e in self._entries if id(e[3]) in self._chosen]
+        return self._schedule
+
+    @property
+    def remaining_minutes(self) -> int:
+        """Return how many minutes of the budget the current schedule leaves unused."""
+        self._sync()
+        if self._mode == "greedy":
+            return self._left
+        return self._budget - sum(t.duration_minutes for t in self.schedule)
+
+    def _sync(self) -> None:
+        """Catch up with budget edits (which raise no event) and stale optimal plans."""
+        if not self._mode:
+            return
+        budget = max(self.owner.available_minutes, 0)
+        if budget != self._budget:
+            self._budget = budget
+            if self._mode == "greedy":
+                self._refill(0, check_from=0)
+            else:
+                self._stale = True
+        if self._stale:
+            self._replan_optimal()
+
+    def _replan_optimal(self) -> None:
+        """Re-run the knapsack over the already-sorted entries, or drop to greedy if too big."""
+        self._stale = False
+        chosen = self._optimal_selection([e[3] for e in self._entries], self._budget)
+        if chosen is None:
+            self._mode = "greedy"
+            self._refill_all()
+            return
+        self.mode_used = "optimal"
+        self._chosen = {id(e[3]): e[3] for e in self._entries if id(e[3]) in chosen}
+        self._schedule = None
+
+    def _on_task_event(self, event: TaskEvent) -> None:
+        """Apply one owner change event to the sorted entries and the schedule."""
+        if not self._mode:
+            return
+        task = event.task
+        if event.kind == "add":
+            self._insert(task, event.pet)
+        elif event.kind == "remove":
+            self._delete(task)
+        elif event.field in ("priority", "duration_minutes") and id(task) in self._key_of:
+            self._insert(task, event.pet, self._delete(task))
+
+    def _insert(self, task: Task, pet: Pet, seq: int = 0) -> None:
+        """Place a task at its sorted position in O(log n) and refresh the fill after it."""
+        rank = self._pet_rank.get(id(pet))
+        if rank is None:
+            rank = next(i for i, p in enumerate(self.owner.pets) if p is pet)
+            self._pet_rank[id(pet)] = rank
+        if not seq:
+            self._seq += 1
+            seq = self._seq
+        key = (-task.priority, rank, seq)
+        i = bisect_left(self._entries, key)
+        self._entries.insert(i, key + (task,))
+        self._before.insert(i, 0)
+        self._key_of[id(task)] = key
+        self._changed(i, check_from=i + 1)
+
+    def _delete(self, task: Task) -> int:
+        """Drop a task from the sorted entries and return its arrival number."""
+        key = self._key_of.pop(id(task), None)
+        if key is None:
+            return 0
+        i = bisect_left(self._entries, key)
+        del self._entries[i]
+        del self._before[i]
+        self._chosen.pop(id(task), None)
+        self._changed(i, check_from=i)
+        return key[2]
+
+    def _changed(self, start: int, check_from: int) -> None:
+        """Update the plan after the entries changed at position start."""
+        self._schedule = None
+        if self._mode == "greedy":
+            self._refill(start, check_from)
+        else:
+            self._stale = True
+
+    def _refill_all(self) -> None:
+        """Run the greedy fill over every entry from scratch."""
+        self.mode_used = "greedy"
+        self._chosen = {}
+        self._refill(0, check_from=len(self._entries))
+
+    def _refill(self, start: int, check_from: int) -> None:
+        """Redo the greedy fill from entry start onward.
+
+        From entry check_from on, stops as soon as an entry sees the same minutes left as
+        it did last time, since everything after it must then come out the same as well.
+        """
+        self._schedule = None
+        if start == 0:
+            left = self._budget
+        else:
+            prev_left = self._before[start - 1]
+            prev = self._entries[start - 1][3]
+            left = prev_left - prev.duration_minutes if id(prev) in self._chosen else prev_left
+        for j in range(start, len(self._entries)):
+            if j >= check_from and self._before[j] == left:
+                return
+            self._before[j] = left
+            task = self._entries[j][3]
+            if task.duration_minutes <= left:
+                self._chosen[id(task)] = task
+                left -= task.duration_minutes
+            else:
+                self._chosen.pop(id(task), None)
+        self._left = left
+
+    def _optimal_selection(self, sorted_tasks: List[Task], budget: int) -> Optional[set]:
+        """Return id()s of the best-value task set, or None if the DP would be too large."""
+        picked = optimal_fill([t.duration_minutes for t in sorted_tasks],
+                              [t.priority for t in sorted_tasks], budget, self.OPTIMAL_MAX_CELLS)
+        if picked is None:
+            return None
+        return {id(sorted_tasks[i]) for i in picked}
 
     def mark_task_complete(self, task: Task) -> None:
         """Mark a task complete and auto-schedule the next occurrence if it is recurring."""
         task.mark_complete()
-        if task.frequency in ("daily", "weekly"):
-            next_task = self.handle_recurring(task)
-            for pet in self.owner.pets:
-                if task in pet.tasks:
-                    pet.add_task(next_task)
-                    break
+        if task.frequency in RECURRENCE_DAYS and task.pet is not None:
+            task.pet.add_task(self.handle_recurring(task))
 
     def sort_by_time(self, tasks: List[Task]) -> List[Task]:
         """Return tasks sorted by duration, shortest first."""
@@ -137,40 +1005,205 @@ class Scheduler:
             time=task.time,
         )
 
-    def detect_conflicts(self) -> List[Tuple[Task, Task]]:
-        """Return pairs of tasks that share the same non-empty time slot."""
-        all_tasks = self.owner.get_all_tasks()
-        timed = [t for t in all_tasks if t.time]
-        conflicts = []
-        for i, a in enumerate(timed):
-            for b in timed[i + 1:]:
-                if a.time == b.time:
-                    conflicts.append((a, b))
-        return conflicts
-
-    def explain(self) -> List[str]:
-        """Return a human-readable explanation for each scheduled and skipped task."""
-        # Could be improved to return structured objects per scheduled task.
-        priority_labels = {1: "low", 2: "medium", 3: "high"}
-        explanations = []
-        time_used = 0
+    def iter_occurrences(self, start: date, end: date, pet: Optional[Pet] = None) -> Iterator[Occurrence]:
+        """Yield every task occurrence from start to end inclusive, in date order.
+
+        Recurring tasks are expanded lazily from their rule, so a month view costs one
+        small Occurrence per due date rather than one Task per date. Pass pet to limit
+        the view to that pet's tasks.
+        """
+        first, last = start.toordinal(), end.toordinal()
+        tasks = pet.tasks if pet is not None else self.owner.get_all_tasks()
+        def stream(seq: int, task: Task) -> Iterator[Tuple[int, int, Task]]:
+            for day in task.occurrence_ordinals(first, last):
+                yield day, seq, task
+
+        for day, _, task in heapq.merge(*(stream(i, t) for i, t in enumerate(tasks))):
+            yield Occurrence(date=_iso(day), task=task)
+
+    def plan_range(self, start: date, end: date) -> List[DayPlan]:
+        """Greedily plan every day from start to end inclusive, carrying leftovers forward.
+
+        Each day's candidates are the tasks due that day plus whatever earlier days could
+        not fit, taken highest priority first (older work first within a priority) against
+        Owner.budget_for(day). Pending one-off tasks dated before start are overdue and
+        join the backlog on the first day. A carried instance of a recurring task is
+        dropped once the task comes due again. Completed tasks are skipped.
+
+        Tasks are sorted once for the whole horizon: each day's due list is bucketed in
+        that order and merged with the already-ordered backlog, so no day re-sorts.
+        """
+        first, last = start.toordinal(), end.toordinal()
+        ranked = sorted((t for t in self.owner.get_all_tasks() if not t.completed),
+                        key=lambda t: t.priority, reverse=True)
+        # day -> [(-priority, due day, rank)], already in order because ranked is.
+        due: Dict[int, List[Tuple[int, int, int]]] = {}
+        overdue: List[Tuple[int, int, int]] = []
+        for rank, task in enumerate(ranked):
+            if task.date and task.frequency not in RECURRENCE_DAYS and _ordinal(task.date) < first:
+                overdue.append((-task.priority, _ordinal(task.date), rank))
+                continue
+            for day in task.occurrence_ordinals(first, last):
+                due.setdefault(day, []).append((-task.priority, day, rank))
+
+        plans = []
+        backlog = sorted(overdue)
+        for day in range(first, last + 1):
+            today = due.pop(day, [])
+            if backlog and today:
+                superseded = {rank for _, _, rank in today}
+                backlog = [e for e in backlog if e[2] not in superseded]
+            budget = self.owner.budget_for(date.fromordinal(day))
+            plan = DayPlan(date=_iso(day), budget=budget)
+            left = budget
+            carried = []
+            for entry in heapq.merge(backlog, today):
+                task = ranked[entry[2]]
+                if task.duration_minutes <= left:
+                    plan.scheduled.append(task)
+                    left -= task.duration_minutes
+                else:
+                    carried.append(entry)
+            plan.unscheduled = [ranked[e[2]] for e in carried]
+            backlog = carried
+            plans.append(plan)
+        return plans
+
+    def occurrences_on(self, day: date, pet: Optional[Pet] = None) -> List[Task]:
+        """Return the tasks due on a single day."""
+        return [o.task for o in self.iter_occurrences(day, day, pet)]
+
+    def detect_conflicts(self, pet: Optional[Pet] = None) -> List[Tuple[Task, Task]]:
+        """Return pairs of tasks whose time intervals overlap on the same date."""
+        return list(self.iter_conflicts(pet))
+
+    def iter_conflicts(self, pet: Optional[Pet] = None) -> Iterator[Tuple[Task, Task]]:
+        """Yield overlapping task pairs for one pet, or for the whole owner if pet is None."""
+        # The owner keeps its intervals sorted, so owner-wide queries skip the sort entirely.
+        return pet.iter_conflicts() if pet is not None else self.owner.iter_conflicts()
+
+    def conflicts_with(self, task: Task) -> List[Task]:
+        """Return the owner's tasks that overlap the given task's time interval."""
+        return self.owner.overlapping(task)
+
+    def iter_explanations(self) -> Iterator[Explanation]:
+        """Yield an Explanation per task: scheduled tasks first, then skipped ones.
+
+        Records are produced lazily in priority order, so reading the first few costs
+        only those few, whatever the size of the account. Each record queries the
+        owner's interval index for its conflicts only when they are read.
+        """
+        find_conflicts = self.owner.overlapping
+        for task, reason, used, shortfall, outranked_by in self._verdicts():
+            yield Explanation(task, reason, self._budget, used, shortfall, outranked_by, find_conflicts)
+
+    def _render_explanations(self) -> List[str]:
+        """Render every explanation, taking the overlaps from one sweep over the whole owner."""
+        overlaps: Dict[int, List[Task]] = {}
+        for a, b in self.owner.iter_conflicts():
+            overlaps.setdefault(id(a), []).append(b)
+            overlaps.setdefault(id(b), []).append(a)
+        budget = self._budget
+        bodies: Dict[Tuple[str, int, int, int], str] = {}   # runs of skipped tasks share a body
+        lines = []
+        for task, reason, used, shortfall, outranked_by in self._verdicts():
+            key = (reason, used, shortfall, id(outranked_by))
+            body = bodies.get(key)
+            if body is None:
+                body = bodies[key] = _explanation_body(reason, budget, used, shortfall, outranked_by)
+            conflicts = overlaps.get(id(task))
+            lines.append(_explanation_head(task) + body + (_overlaps_text(conflicts) if conflicts else ""))
+        return lines
+
+    def _verdicts(self) -> Iterator[Tuple[Task, str, int, int, Optional[Task]]]:
+        """Yield (task, reason, minutes used, shortfall, outranked by) in explanation order."""
+        self._sync()
+        if not self._mode:
+            for task in self.owner.get_all_tasks():
+                yield task, "unplanned", 0, 0, None
+            return
+        used = 0
         for task in self.schedule:
-            time_used += task.duration_minutes
-            label = priority_labels.get(task.priority, "unknown")
-            explanations.append(
-                f"'{task.title}' ({task.duration_minutes} min, {label} priority) — "
-                f"included because it fits within your time budget. "
-                f"Time used so far: {time_used}/{self.owner.available_minutes} min."
-            )
-        scheduled_ids = {t.id for t in self.schedule}
-        skipped = [t for t in self.owner.get_all_tasks() if t.id not in scheduled_ids]
-        for task in skipped:
-            explanations.append(
-                f"'{task.title}' ({task.duration_minutes} min) — skipped: not enough time remaining."
-            )
-        return explanations
+            used += task.duration_minutes
+            yield task, "fits_budget", used, 0, None
+        left = self._budget
+        higher: Optional[Task] = None      # last scheduled task of a strictly higher priority
+        group_last: Optional[Task] = None  # last scheduled task at the current priority
+        group = None
+        for _, _, _, task in self._entries:
+            if task.priority != group:
+                group = task.priority
+                higher = group_last or higher
+                group_last = None
+            if id(task) in self._chosen:
+                left -= task.duration_minutes
+                group_last = task
+                continue
+            shortfall = task.duration_minutes - left
+            if shortfall <= 0:
+                yield task, "traded_off", self._budget - left, 0, None
+            elif higher is not None:
+                yield task, "lower_priority", self._budget - left, shortfall, higher
+            else:
+                yield task, "over_budget", self._budget - left, shortfall, None
+
+    def explain(self, limit: Optional[int] = None, offset: int = 0) -> List[str]:
+        """Return human-readable explanations, optionally just one page of them.
+
+        Only the requested page is rendered: explain(limit=50) formats 50 sentences
+        however many tasks the owner has, querying the interval index once per task on
+        the page. Without a limit every task is rendered: the overlaps come from one sweep
+        over the whole owner, no Explanation records are built, and the lines are kept
+        until the owner, mode or budget changes.
+        """
+        if limit is not None:
+            return [e.text() for e in islice(self.iter_explanations(), offset, offset + limit)]
+        self.owner._ensure_loaded()
+        self._sync()
+        key = (self.owner.version, self._mode, self._budget)
+        if self._explained[0] != key:
+            self._explained = (key, self._render_explanations())
+        return self._explained[1][offset:]
 
     def get_unscheduled(self) -> List[Task]:
         """Return tasks that were not included in the schedule due to time constraints."""
-        scheduled_ids = {t.id for t in self.schedule}
-        return [t for t in self.owner.get_all_tasks() if t.id not in scheduled_ids]
+        self._sync()
+        if not self._mode:
+            return self.owner.get_all_tasks()
+        return [e[3] for e in self._entries if id(e[3]) not in self._chosen]
+
+
+# Optional subsystems are imported the first time one of their names is looked up
+# here (PEP 562), so `import pawpal_system` stays cheap for short-lived scripts.
+_LAZY_EXPORTS = {
+    "PawPalDB": "pawpal_db",
+    "write_snapshot": "pawpal_snapshot",
+    "read_snapshot": "pawpal_snapshot",
+    "iter_tasks": "pawpal_snapshot",
+    "TaskStore": "pawpal_store",
+    "BatchScheduler": "pawpal_batch",
+    "PawPalService": "pawpal_service",
+    "SchedulerStats": "pawpal_profile",
+    "RenderCache": "pawpal_cache",
+    "SlotPlanner": "pawpal_slots",
+    "Caregiver": "pawpal_team",
+    "CompletionLog": "pawpal_history",
+    "WhatIf": "pawpal_whatif",
+    "TaskArrays": "pawpal_vector",
+    "TeamPlanner": "pawpal_team",
+}
+
+
+def __getattr__(name: str):
+    """Import an optional subsystem on first use of one of its names."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module's own names plus the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,189 @@
+import heapq
+from bisect import insort
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pawpal_system import Owner, Scheduler, Task
+from pawpal_slots import DEFAULT_WINDOWS, FreeIntervals, Slot, parse_window, split_fixed
+
+# Task categories that only a caregiver listing them in skills may take on;
+# tasks in any other category can go to anyone.
+SKILLED_CATEGORIES = frozenset({"meds", "grooming"})
+GENERAL = ""                    # pool of every caregiver, for unskilled tasks
+
+
+@dataclass
+class Caregiver:
+    """One person sharing the pet care, with their own time budget and shifts."""
+    name: str
+    available_minutes: int
+    skills: Tuple[str, ...] = ()                                   # skilled categories they may do
+    windows: Sequence[Tuple[str, str]] = DEFAULT_WINDOWS           # ("HH:MM", "HH:MM") shifts
+
+
+@dataclass
+class TeamPlan:
+    """Who does which task, and when, on one day."""
+    date: str                                                      # "YYYY-MM-DD"
+    slots: Dict[str, List[Slot]] = field(default_factory=dict)     # caregiver name -> slots in start order
+    unassigned: List[Task] = field(default_factory=list)           # no eligible caregiver had room
+
+    def minutes_for(self, name: str) -> int:
+        """Return the minutes of work given to one caregiver."""
+        return sum(slot.task.duration_minutes for slot in self.slots[name])
+
+    def loads(self) -> Dict[str, int]:
+        """Return the minutes of work given to each caregiver."""
+        return {name: self.minutes_for(name) for name in self.slots}
+
+    def lines(self) -> List[str]:
+        """Return one "name  HH:MM-HH:MM title" line per slot, caregiver by caregiver."""
+        return [f"{name}  {s.start_time}-{s.end_time}  {s.task.title}"
+                for name, slots in self.slots.items() for s in slots]
+
+
+class Roster:
+    """The caregivers' remaining time on one day, handing out tasks one at a time.
+
+    Caregivers are pooled by skill (GENERAL plus each skilled category) and shift
+    pattern. Each pool is a heap of (load, index, stamp) entries, where load is the
+    share of the caregiver's budget already used, so the least-loaded eligible
+    caregiver is the smallest top among the pools for the task's skill, and a
+    fixed-time task only looks at pools whose shifts cover it. Taking a
+    task bumps the caregiver's stamp and pushes a fresh entry to each of their pools;
+    older entries are skipped when popped. A caregiver with less than min_duration
+    minutes of budget or free time left is dropped from every pool, and once no one in
+    a pool can fit a flexible task, longer ones are turned away without a search.
+    """
+
+    def __init__(self, caregivers: Sequence[Caregiver], day: date,
+                 skilled_categories: Iterable[str] = SKILLED_CATEGORIES, min_duration: int = 1):
+        """Start the day with every caregiver's full budget and shifts free."""
+        names = [c.name for c in caregivers]
+        if len(set(names)) != len(names):
+            raise ValueError("Caregiver names must be unique")
+        self.plan = TeamPlan(date=day.isoformat(), slots={name: [] for name in names})
+        self.min_duration = min_duration
+        self._caregivers = list(caregivers)
+        self._skilled = frozenset(skilled_categories)
+        self._free = [FreeIntervals(parse_window(w) for w in c.windows) for c in caregivers]
+        self._left = [c.available_minutes for c in caregivers]
+        self._stamps = [0] * len(caregivers)
+        self._shifts = [tuple(sorted(free)) for free in self._free]
+        self._pools: Dict[Tuple[str, tuple], list] = {}
+        self._no_room: Dict[str, int] = {}         # skill -> shortest flexible duration nobody could take
+        for i, caregiver in enumerate(self._caregivers):
+            for key in self._pool_keys(i):
+                self._pools.setdefault(key, []).append((0.0, i, 0))
+        self._by_skill: Dict[str, List[Tuple[tuple, list]]] = {}
+        for (skill, shifts), pool in self._pools.items():
+            heapq.heapify(pool)
+            self._by_skill.setdefault(skill, []).append((shifts, pool))
+
+    def _pool_keys(self, i: int) -> List[Tuple[str, tuple]]:
+        """Return the (skill, shifts) pools caregiver i belongs to."""
+        skills = [GENERAL] + sorted(self._skilled.intersection(self._caregivers[i].skills))
+        return [(skill, self._shifts[i]) for skill in skills]
+
+    def _load(self, i: int) -> float:
+        """Return the share of caregiver i's budget already used."""
+        budget = self._caregivers[i].available_minutes
+        return 1.0 - self._left[i] / budget if budget > 0 else 1.0
+
+    def _fits(self, i: int, task: Task, span: Optional[Tuple[int, int]]) -> Optional[int]:
+        """Return where caregiver i could start task, or None if they cannot take it."""
+        duration = task.duration_minutes
+        if duration > self._left[i]:
+            return None
+        if span is None:
+            return self._free[i].best_fit(duration)
+        return span[0] if self._free[i].covers(*span) else None
+
+    def assign(self, task: Task, span: Optional[Tuple[int, int]] = None) -> Optional[str]:
+        """Give task to the least-loaded eligible caregiver and return their name.
+
+        With span=(start, end) in minutes the task must happen then; otherwise it goes
+        into the caregiver's smallest free gap that holds it. Returns None, and lists
+        the task as unassigned, if no caregiver with the skill has room.
+        """
+        key = task.category if task.category in self._skilled else GENERAL
+        if span is None and task.duration_minutes >= self._no_room.get(key, task.duration_minutes + 1):
+            self.plan.unassigned.append(task)      # free time only shrinks, so this cannot fit either
+            return None
+        pools = [pool for shifts, pool in self._by_skill.get(key, ())
+                 if span is None or any(s <= span[0] and span[1] <= e for s, e in shifts)]
+        chosen = start = None
+        passed_over = []
+        while True:
+            best = None
+            for pool in pools:
+                while pool and pool[0][2] != self._stamps[pool[0][1]]:
+                    heapq.heappop(pool)                # stale: caregiver has since taken a task
+                if pool and (best is None or pool[0] < best[0]):
+                    best = pool
+            if best is None:
+                break
+            entry = heapq.heappop(best)
+            start = self._fits(entry[1], task, span)
+            if start is not None:
+                chosen = entry[1]
+                break
+            passed_over.append((best, entry))
+        for pool, entry in passed_over:
+            heapq.heappush(pool, entry)
+        if chosen is None:
+            if span is None:
+                self._no_room[key] = task.duration_minutes
+            self.plan.unassigned.append(task)
+            return None
+
+        end = span[1] if span is not None else start + task.duration_minutes
+        self._free[chosen].reserve(start, end)
+        self._left[chosen] -= task.duration_minutes
+        self._stamps[chosen] += 1
+        caregiver = self._caregivers[chosen]
+        insort(self.plan.slots[caregiver.name], Slot(start, end, task, fixed=span is not None),
+               key=lambda s: (s.start, s.end))
+        if self._left[chosen] >= self.min_duration and self._free[chosen].longest() >= self.min_duration:
+            entry = (self._load(chosen), chosen, self._stamps[chosen])
+            for pool_key in self._pool_keys(chosen):
+                heapq.heappush(self._pools[pool_key], entry)
+        return caregiver.name
+
+
+class TeamPlanner:
+    """Share the tasks of an owner's pets among several caregivers, one day at a time.
+
+    Fixed-time tasks are handed out first, highest priority first, each to the
+    least-loaded caregiver who has the skill and is on shift and free at that time.
+    Flexible tasks follow by priority, longest first, so the large ones are spread
+    before the small ones fill the gaps. Each assignment costs a few heap operations
+    rather than a pass over every caregiver.
+    """
+
+    def __init__(self, owner: Owner, caregivers: Sequence[Caregiver],
+                 skilled_categories: Iterable[str] = SKILLED_CATEGORIES):
+        """Plan owner's pets' tasks for the given caregivers."""
+        self.owner = owner
+        self.caregivers = list(caregivers)
+        self.skilled_categories = frozenset(skilled_categories)
+        self._scheduler = Scheduler(owner=owner)
+
+    def start_day(self, day: date) -> Roster:
+        """Return an empty roster for day, for assigning tasks one at a time."""
+        return Roster(self.caregivers, day, self.skilled_categories)
+
+    def plan_day(self, day: date) -> TeamPlan:
+        """Assign every pending task due on day and return the plan."""
+        fixed, flexible = split_fixed(self._scheduler.occurrences_on(day))
+        roster = self.start_day(day)
+        durations = [f[2].duration_minutes for f in fixed] + [t.duration_minutes for t in flexible]
+        roster.min_duration = min(durations, default=1)
+        fixed.sort(key=lambda f: f[2].priority, reverse=True)       # stable: time order within a priority
+        for start, end, task in fixed:
+            roster.assign(task, (start, end))
+        flexible.sort(key=lambda t: (t.priority, t.duration_minutes), reverse=True)
+        for task in flexible:
+            roster.assign(task)
+        return roster.plan
@@ -0,0 +1,242 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from pawpal_system import Owner, Task, parse_minute_of_day
+
+# One row per task. Rows are stored owner by owner and pet by pet, in get_all_tasks() order.
+TASK_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("owner", np.int32),       # position in the owners list
+    ("pet", np.int32),         # position in the owner's pets
+    ("duration", np.int64),
+    ("priority", np.int64),
+    ("date", np.int32),        # index into TaskArrays.dates ("" is a date too)
+    ("minute", np.int16),      # minute of day, -1 = untimed or not HH:MM
+    ("completed", np.bool_),
+    ("category", np.int32),    # index into TaskArrays.categories
+])
+SCAN_WINDOW = 32               # tasks checked per round when greedy looks past one that does not fit
+
+
+def _suffix_min(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Return, for each position, the minimum of values from there to the end of its group.
+
+    groups must be non-decreasing. Offsetting each value by its group number times a
+    bound makes every later group larger, so one reversed running minimum resets at
+    each group boundary by itself.
+    """
+    if not len(values):
+        return values.copy()
+    bound = int(values.max()) + 1
+    shifted = values + groups.astype(np.int64) * bound
+    return np.minimum.accumulate(shifted[::-1])[::-1] - groups.astype(np.int64) * bound
+
+
+def greedy_fill_groups(durations: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                       budgets: np.ndarray) -> np.ndarray:
+    """Return a mask of the positions greedy scheduling takes, for many groups at once.
+
+    durations holds each group's tasks already in priority order; group g is
+    durations[starts[g]:ends[g]] with budget budgets[g]. The result matches
+    greedy_fill() run on every group. Each round advances all unfinished groups
+    together: cumsum plus searchsorted takes the whole run of tasks that still fit,
+    then a window scan finds the next task small enough after the one that did not.
+    A group stops once no later task fits (a per-group suffix minimum), so rounds
+    follow the number of runs per group, not the number of tasks.
+    """
+    durations = np.asarray(durations, dtype=np.int64)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    n = len(durations)
+    if n and durations.min() < 0:
+        raise ValueError("greedy_fill_groups needs non-negative durations")
+    prefix = np.concatenate(([0], np.cumsum(durations)))
+    sizes = ends - starts
+    groups = np.repeat(np.arange(len(starts)), sizes)
+    tail_min = np.append(_suffix_min(durations, groups), 0)     # padded so pos == n indexes safely
+    marks = np.zeros(n + 1, dtype=np.int64)                     # +1 where a run starts, -1 after it
+    pos = starts.copy()
+    left = np.maximum(np.asarray(budgets, dtype=np.int64), 0)
+    end = ends.copy()
+    window = np.arange(1, SCAN_WINDOW + 1)
+    active = (pos < end) & (tail_min[np.minimum(pos, n)] <= left)
+    pos, left, end = pos[active], left[active], end[active]
+    while len(pos):
+        # Take every task from pos while the running total stays within the budget.
+        stop = np.minimum(np.searchsorted(prefix, prefix[pos] + left, side="right") - 1, end)
+        ran = stop > pos
+        np.add.at(marks, pos[ran], 1)
+        np.add.at(marks, stop[ran], -1)
+        left = left - (prefix[stop] - prefix[pos])
+        # durations[stop] (if any) did not fit; look for the next one that does.
+        ahead = stop[:, None] + window
+        fits = (ahead < end[:, None]) & (durations[np.minimum(ahead, n - 1)] <= left[:, None])
+        found = fits.any(axis=1)
+        pos = np.where(found, stop + 1 + fits.argmax(axis=1), np.minimum(stop + 1 + SCAN_WINDOW, end))
+        keep = (pos < end) & (tail_min[np.minimum(pos, n)] <= left)
+        pos, left, end = pos[keep], left[keep], end[keep]
+    return np.cumsum(marks[:n]) > 0
+
+
+class TaskArrays:
+    """A structured-array snapshot of many owners' tasks for vectorized batch work.
+
+    The tasks are converted once; filtering, sorting, greedy fills and conflict
+    detection then run as NumPy operations over whole columns, and every result is
+    an array of Task ids (tasks() maps ids back to the Task objects). Each method
+    matches its pure-Python counterpart: Owner.query, Scheduler.sort_by_time,
+    Scheduler.schedule and get_unscheduled in greedy mode, and detect_conflicts.
+    The snapshot does not follow later edits; build a new one after changes.
+    """
+
+    def __init__(self, rows: np.ndarray, owners: Sequence[Owner], tasks: Dict[int, Task],
+                 dates: List[str], categories: List[str]):
+        """Wrap rows already in TASK_DTYPE; use from_owners() to build one."""
+        self.rows = rows
+        self.owners = list(owners)
+        self.dates = dates
+        self.categories = categories
+        self.budgets = np.array([max(o.available_minutes, 0) for o in self.owners], dtype=np.int64)
+        counts = np.bincount(rows["owner"], minlength=len(self.owners))
+        self.ends = np.cumsum(counts)
+        self.starts = self.ends - counts
+        self._tasks = tasks
+        self._order: Optional[np.ndarray] = None
+        self._by_id: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_owners(cls, owners: Iterable[Owner]) -> "TaskArrays":
+        """Convert every task of every owner into one structured array."""
+        owners = list(owners)
+        tasks: Dict[int, Task] = {}
+        date_codes: Dict[str, int] = {}
+        category_codes: Dict[str, int] = {}
+        records = []
+        for o, owner in enumerate(owners):
+            for p, pet in enumerate(owner.pets):
+                for task in pet.tasks:
+                    if task.duration_minutes < 0:
+                        raise ValueError(f"Task {task.id} has a negative duration")
+                    minute = parse_minute_of_day(task.time) if task.time else None
+                    records.append((task.id, o, p, task.duration_minutes, task.priority,
+                                    date_codes.setdefault(task.date, len(date_codes)),
+                                    -1 if minute is None else minute, task.completed,
+                                    category_codes.setdefault(task.category, len(category_codes))))
+                    tasks[task.id] = task
+        rows = np.array(records, dtype=TASK_DTYPE)
+        return cls(rows, owners, tasks, list(date_codes), list(category_codes))
+
+    @classmethod
+    def from_owner(cls, owner: Owner) -> "TaskArrays":
+        """Convert one owner's tasks."""
+        return cls.from_owners([owner])
+
+    def __len__(self) -> int:
+        """Return the number of tasks."""
+        return len(self.rows)
+
+    def tasks(self, ids: Iterable[int]) -> List[Task]:
+        """Return the Task objects for an array of ids, in the same order."""
+        return [self._tasks[i] for i in np.asarray(ids).tolist()]
+
+    def _owner_rows(self, owner: Optional[int]) -> slice:
+        """Return the row slice for one owner's tasks, or every row if owner is None."""
+        return slice(None) if owner is None else slice(self.starts[owner], self.ends[owner])
+
+    def mask(self, priority: Optional[int] = None, category: Optional[str] = None,
+             date: Optional[str] = None, completed: Optional[bool] = None) -> np.ndarray:
+        """Return a boolean row mask for tasks matching every given filter; None means "any"."""
+        rows = self.rows
+        keep = np.ones(len(rows), dtype=bool)
+        if priority is not None:
+            keep &= rows["priority"] == priority
+        if category is not None:
+            keep &= rows["category"] == (self.categories.index(category)
+                                         if category in self.categories else -1)
+        if date is not None:
+            keep &= rows["date"] == (self.dates.index(date) if date in self.dates else -1)
+        if completed is not None:
+            keep &= rows["completed"] == completed
+        return keep
+
+    def query(self, owner: Optional[int] = None, **criteria) -> np.ndarray:
+        """Return ids of tasks matching the filters, in Owner.query() order."""
+        return self.rows["id"][self._owner_rows(owner)][self.mask(**criteria)[self._owner_rows(owner)]]
+
+    def filter_by_priority(self, priority: int, owner: Optional[int] = None) -> np.ndarray:
+        """Return ids of tasks at the given priority level."""
+        return self.query(owner, priority=priority)
+
+    def sort_by_time(self, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return ids (default: all, in row order) stably sorted by duration, shortest first."""
+        if ids is None:
+            return self.rows["id"][np.argsort(self.rows["duration"], kind="stable")]
+        ids = np.asarray(ids, dtype=np.int64)
+        sorter = self._id_sorter()
+        durations = self.rows["duration"][sorter[np.searchsorted(self.rows["id"], ids, sorter=sorter)]]
+        return ids[np.argsort(durations, kind="stable")]
+
+    def _id_sorter(self) -> np.ndarray:
+        """Return the argsort of the id column, for looking rows up by id."""
+        if self._by_id is None:
+            self._by_id = np.argsort(self.rows["id"], kind="stable")
+        return self._by_id
+
+    def greedy_order(self) -> np.ndarray:
+        """Return row numbers owner by owner in greedy order: priority, then pet, then arrival."""
+        if self._order is None:
+            # Rows are already in pet-then-arrival order, so a stable sort finishes the key.
+            self._order = np.lexsort((-self.rows["priority"], self.rows["owner"]))
+        return self._order
+
+    def scheduled(self, budgets: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return a mask over greedy_order() of the tasks each owner's greedy schedule takes."""
+        budgets = self.budgets if budgets is None else np.asarray(budgets, dtype=np.int64)
+        return greedy_fill_groups(self.rows["duration"][self.greedy_order()], self.starts, self.ends, budgets)
+
+    def schedule(self, owner: Optional[int] = None, budgets: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return ids of the scheduled tasks in greedy order, as Scheduler.schedule lists them."""
+        span = self._owner_rows(owner)
+        return self.rows["id"][self.greedy_order()[span][self.scheduled(budgets)[span]]]
+
+    def get_unscheduled(self, owner: Optional[int] = None, budgets: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return ids of the tasks left out of the schedule, in greedy order."""
+        span = self._owner_rows(owner)
+        return self.rows["id"][self.greedy_order()[span][~self.scheduled(budgets)[span]]]
+
+    def scheduled_minutes(self, budgets: Optional[np.ndarray] = None) -> np.ndarray:
+        """Return the minutes each owner's greedy schedule fills."""
+        order = self.greedy_order()
+        picked = order[self.scheduled(budgets)]
+        return np.bincount(self.rows["owner"][picked], weights=self.rows["duration"][picked],
+                           minlength=len(self.owners)).astype(np.int64)
+
+    def conflicts(self, owner: Optional[int] = None) -> np.ndarray:
+        """Return an (n, 2) array of (earlier id, later id) pairs that overlap on the same date.
+
+        Pairs never cross owners. Timed tasks are sorted by (owner, date, start, end);
+        each task then clashes with every later one starting before it ends, a run that
+        one searchsorted per task finds, so the cost is O(n log n + pairs).
+        """
+        rows = self.rows[self._owner_rows(owner)]
+        timed = np.flatnonzero(rows["minute"] >= 0)
+        start = rows["minute"][timed].astype(np.int64)
+        end = start + np.maximum(rows["duration"][timed], 1)
+        day = rows["owner"][timed].astype(np.int64) * len(self.dates) + rows["date"][timed]
+        bound = int(end.max()) + 1 if len(end) else 1
+        if len(day) and (int(day.max()) + 1) * 24 * 60 * bound < 2 ** 63:
+            # One packed int64 key sorts several times faster than a multi-key lexsort.
+            order = np.argsort((day * (24 * 60) + start) * bound + end, kind="stable")
+        else:
+            order = np.lexsort((end, start, day))
+        timed, start, end, day = timed[order], start[order], end[order], day[order]
+        group = np.concatenate(([0], np.cumsum(day[1:] != day[:-1])))
+        begins = group * bound + start
+        last = np.searchsorted(begins, group * bound + end, side="left")
+        counts = last - np.arange(len(timed)) - 1
+        earlier = np.repeat(np.arange(len(timed)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        later = earlier + 1 + offsets
+        ids = rows["id"][timed]
+        return np.stack((ids[earlier], ids[later]), axis=1)
@@ -0,0 +1,250 @@
+from bisect import bisect_right, insort
+from dataclasses import dataclass, replace
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from pawpal_system import Owner, Pet, Task, greedy_fill
+
+DEFAULT_BUDGETS = range(1, 481)
+_Changes = Tuple[Set[int], Dict[int, Task], List[Tuple[Pet, Task]]]
+
+
+class Scenario:
+    """A copy-on-write variation of an owner: another budget, dropped, edited or added tasks.
+
+    Nothing is copied up front and the owner is never modified. Unchanged tasks are
+    the owner's own objects; edit() copies only the task it changes. fork() layers a
+    child scenario on this one, so a family of variations shares its common changes.
+    """
+
+    def __init__(self, owner: Owner, name: str = "", available_minutes: Optional[int] = None,
+                 parent: Optional["Scenario"] = None):
+        """Start a scenario over owner, or over parent's changes when given."""
+        self.owner = owner
+        self.name = name
+        self.parent = parent
+        self._budget = available_minutes
+        self._dropped: Set[int] = set()                   # task ids
+        self._edited: Dict[int, Task] = {}                # task id -> changed copy
+        self._added: List[Tuple[Pet, Task]] = []
+
+    @property
+    def available_minutes(self) -> int:
+        """Return the scenario's budget, inherited from the parent or owner unless set."""
+        if self._budget is not None:
+            return self._budget
+        return self.parent.available_minutes if self.parent else self.owner.available_minutes
+
+    def with_budget(self, minutes: int) -> "Scenario":
+        """Set the scenario's time budget and return the scenario."""
+        self._budget = minutes
+        return self
+
+    def drop(self, task: Task) -> "Scenario":
+        """Leave a task out of the scenario and return the scenario."""
+        self._dropped.add(task.id)
+        self._edited.pop(task.id, None)
+        return self
+
+    def edit(self, task: Task, **changes) -> Task:
+        """Return a changed copy of task that stands in for it in this scenario."""
+        current = self.changes()[1].get(task.id, task)
+        copy = replace(current, **changes)
+        self._edited[task.id] = copy
+        return copy
+
+    def add(self, task: Task, pet: Pet) -> "Scenario":
+        """Add a task for pet (one of the owner's pets or a new one) and return the scenario."""
+        self._added.append((pet, task))
+        return self
+
+    def fork(self, name: str = "", available_minutes: Optional[int] = None) -> "Scenario":
+        """Return a child scenario that starts from this one's changes."""
+        return Scenario(self.owner, name, available_minutes, parent=self)
+
+    def changes(self) -> _Changes:
+        """Return (dropped ids, edited copies by id, added (pet, task)) down the parent chain."""
+        if self.parent is None:
+            dropped, edited, added = set(), {}, []
+        else:
+            dropped, edited, added = self.parent.changes()
+        dropped |= self._dropped
+        for task_id in self._dropped:
+            edited.pop(task_id, None)
+        edited.update(self._edited)
+        added = [(pet, edited.get(task.id, task)) for pet, task in added + self._added
+                 if task.id not in dropped]
+        return dropped, edited, added
+
+    def pet_tasks(self) -> List[Tuple[Pet, List[Task]]]:
+        """Return each pet with its tasks under this scenario, in the owner's order."""
+        dropped, edited, added = self.changes()
+        result = [(pet, [edited.get(t.id, t) for t in pet.tasks if t.id not in dropped])
+                  for pet in self.owner.pets]
+        index = {id(pet): i for i, (pet, _) in enumerate(result)}
+        for pet, task in added:
+            if id(pet) not in index:
+                index[id(pet)] = len(result)
+                result.append((pet, []))
+            result[index[id(pet)]][1].append(task)
+        return result
+
+    def tasks(self) -> List[Task]:
+        """Return every task under this scenario, pet by pet, like Owner.get_all_tasks()."""
+        return [task for _, tasks in self.pet_tasks() for task in tasks]
+
+    def to_owner(self) -> Owner:
+        """Return an independent Owner with this scenario applied; every task is copied."""
+        pets = [Pet(name=pet.name, species=pet.species, tasks=[Task.from_dict(t.to_dict()) for t in tasks])
+                for pet, tasks in self.pet_tasks()]
+        return Owner(name=self.owner.name, available_minutes=self.available_minutes, pets=pets,
+                     daily_minutes=dict(self.owner.daily_minutes))
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetPoint:
+    """What the greedy schedule achieves with one budget."""
+    budget: int
+    minutes: int           # minutes scheduled
+    tasks: int             # tasks scheduled
+    score: int             # sum of priority x duration, the value optimal mode maximises
+
+
+def _min_tree(values: Sequence[int]) -> Tuple[List[float], int]:
+    """Build a bottom-up min segment tree over values; return (tree, leaf offset)."""
+    size = 1
+    while size < len(values):
+        size *= 2
+    tree = [float("inf")] * (2 * size)
+    tree[size:size + len(values)] = values
+    for i in range(size - 1, 0, -1):
+        tree[i] = min(tree[2 * i], tree[2 * i + 1])
+    return tree, size
+
+
+def _first_at_most(tree: List[float], size: int, start: int, limit: int) -> Optional[int]:
+    """Return the first position >= start whose value is <= limit, or None."""
+    i = start + size
+    if i >= 2 * size:
+        return None
+    if tree[i] > limit:
+        while True:
+            while i & 1:                       # climb while i is a right child
+                i >>= 1
+            if i == 0:
+                return None
+            i += 1                             # the subtree just to the right
+            if tree[i] <= limit:
+                break
+        while i < size:
+            i = 2 * i if tree[2 * i] <= limit else 2 * i + 1
+    return i - size
+
+
+def greedy_curve(durations: Sequence[int], priorities: Sequence[int],
+                 budgets: Iterable[int] = DEFAULT_BUDGETS) -> List[BudgetPoint]:
+    """Return the greedy result at each budget for tasks already in priority order.
+
+    Greedy takes runs of consecutive tasks until one does not fit, then skips to the
+    next task that does. Prefix sums over durations and scores measure a whole run
+    with one bisect, and a min tree over durations finds the next task that fits in
+    O(log n), so each budget costs O(runs x log n) rather than a pass over every task.
+    """
+    prefix = [0, *accumulate(durations)]
+    scores = [0, *accumulate(p * d for p, d in zip(priorities, durations))]
+    tree, size = _min_tree(durations)
+    n = len(durations)
+    points = []
+    for budget in budgets:
+        left = max(budget, 0)
+        start = count = score = 0
+        while start < n:
+            j = _first_at_most(tree, size, start, left)
+            if j is None:
+                break
+            start = bisect_right(prefix, prefix[j] + left, lo=j + 1) - 1   # the run is j .. start-1
+            left -= prefix[start] - prefix[j]
+            count += start - j
+            score += scores[start] - scores[j]
+        points.append(BudgetPoint(budget, max(budget, 0) - left, count, score))
+    return points
+
+
+class WhatIf:
+    """Evaluate budget and task variations of one owner from a single sorted task order.
+
+    The owner's tasks are sorted into greedy order once (rebuilt only after the owner
+    changes). A scenario reuses that order: dropped tasks are filtered out, and only
+    its edited or added tasks are re-placed with bisect, so no scenario sorts again.
+    """
+
+    def __init__(self, owner: Owner):
+        """Prepare what-ifs for owner."""
+        self.owner = owner
+        self._version: Optional[int] = None
+        self._base: List[Tuple[Tuple[int, int, int], Task]] = []
+        self._ranks: Dict[int, int] = {}
+
+    def scenario(self, name: str = "", available_minutes: Optional[int] = None) -> Scenario:
+        """Return a new, empty scenario over the owner."""
+        return Scenario(self.owner, name, available_minutes)
+
+    def _base_order(self) -> List[Tuple[Tuple[int, int, int], Task]]:
+        """Return the owner's tasks keyed and sorted as Scheduler orders them."""
+        if self._version != self.owner.version:
+            self._ranks = {id(pet): rank for rank, pet in enumerate(self.owner.pets)}
+            keyed = []
+            for rank, pet in enumerate(self.owner.pets):
+                for task in pet.tasks:
+                    keyed.append(((-task.priority, rank, len(keyed)), task))
+            keyed.sort(key=lambda e: e[0])
+            self._base = keyed
+            self._version = self.owner.version
+        return self._base
+
+    def order(self, scenario: Optional[Scenario] = None) -> List[Task]:
+        """Return the scenario's tasks in greedy order: priority, then pet, then arrival."""
+        base = self._base_order()
+        if scenario is None:
+            return [task for _, task in base]
+        dropped, edited, added = scenario.changes()
+        entries = []
+        moved = []
+        changed = dropped | edited.keys()
+        for entry in base:
+            task_id = entry[1].id
+            if task_id not in changed:
+                entries.append(entry)                      # unchanged: the shared entry itself
+            elif task_id not in dropped:
+                key, copy = entry[0], edited[task_id]
+                if copy.priority == -key[0]:
+                    entries.append((key, copy))
+                else:
+                    moved.append(((-copy.priority,) + key[1:], copy))
+        new_ranks: Dict[int, int] = {}
+        for seq, (pet, task) in enumerate(added, start=len(base)):
+            rank = self._ranks.get(id(pet))
+            if rank is None:
+                rank = new_ranks.setdefault(id(pet), len(self._ranks) + len(new_ranks))
+            moved.append(((-task.priority, rank, seq), task))
+        for entry in moved:
+            insort(entries, entry, key=lambda e: e[0])
+        return [task for _, task in entries]
+
+    def schedule(self, scenario: Optional[Scenario] = None) -> List[Task]:
+        """Return the tasks a greedy schedule takes under the scenario, in priority order."""
+        ordered = self.order(scenario)
+        budget = scenario.available_minutes if scenario else self.owner.available_minutes
+        return [ordered[i] for i in greedy_fill([t.duration_minutes for t in ordered], max(budget, 0))]
+
+    def curve(self, scenario: Optional[Scenario] = None,
+              budgets: Iterable[int] = DEFAULT_BUDGETS) -> List[BudgetPoint]:
+        """Return the greedy result at every budget for the owner or a scenario."""
+        ordered = self.order(scenario)
+        return greedy_curve([t.duration_minutes for t in ordered], [t.priority for t in ordered], budgets)
+
+    def compare(self, scenarios: Iterable[Scenario],
+                budgets: Iterable[int] = DEFAULT_BUDGETS) -> Dict[str, List[BudgetPoint]]:
+        """Return each scenario's budget curve by name, all from the one shared order."""
+        budgets = list(budgets)
+        return {scenario.name: self.curve(scenario, budgets) for scenario in scenarios}
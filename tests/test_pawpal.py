@@ -1,4 +1,16 @@
-from pawpal_system import Task, Pet, Owner, Scheduler
+import gc
+import multiprocessing
+import os
+import pickle
+import random
+import subprocess
+import sys
+from datetime import date
+from itertools import combinations
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner, Scheduler, IntervalIndex, ID_BLOCK_BITS, reserve_task_ids
 
 
 # --- Helpers ---
@@ -126,3 +138,543 @@ def test_detect_conflicts_ignores_tasks_without_time():
     pet.add_task(Task(title="Breakfast", duration_minutes=5,  priority=3))
     scheduler = Scheduler(owner=make_owner(pet))
     assert scheduler.detect_conflicts() == []
+
+
+def test_detect_conflicts_sees_time_set_after_adding():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk",       duration_minutes=20, priority=3))
+    luna.add_task( Task(title="Litter box", duration_minutes=5,  priority=2))
+    scheduler = Scheduler(owner=make_owner(mochi, luna))
+    mochi.tasks[0].time = "09:00"
+    luna.tasks[0].time = "09:00"
+    assert len(scheduler.detect_conflicts()) == 1
+    luna.tasks[0].time = "10:00"
+    assert scheduler.detect_conflicts() == []
+
+
+def test_detect_conflicts_forgets_removed_task():
+    pet = Pet(name="Mochi", species="dog")
+    walk = Task(title="Walk",      duration_minutes=20, priority=3, time="09:00")
+    food = Task(title="Breakfast", duration_minutes=5,  priority=3, time="09:00")
+    pet.add_task(walk)
+    pet.add_task(food)
+    scheduler = Scheduler(owner=make_owner(pet))
+    pet.remove_task(walk.id)
+    assert scheduler.detect_conflicts() == []
+
+
+def test_conflicts_with_returns_overlapping_tasks():
+    mochi = Pet(name="Mochi", species="dog")
+    mochi.add_task(Task(title="Walk",      duration_minutes=20, priority=3, time="09:00"))
+    mochi.add_task(Task(title="Breakfast", duration_minutes=5,  priority=3, time="08:00"))
+    scheduler = Scheduler(owner=make_owner(mochi))
+    new_task = Task(title="Vet call", duration_minutes=10, priority=2, time="09:00")
+    assert [t.title for t in scheduler.conflicts_with(new_task)] == ["Walk"]
+
+
+def test_recurring_occurrence_on_next_day_does_not_conflict():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=20, priority=3,
+                      frequency="daily", date="2026-02-23", time="09:00"))
+    scheduler = Scheduler(owner=make_owner(pet))
+    scheduler.mark_task_complete(pet.tasks[0])
+    assert scheduler.detect_conflicts() == []
+    pet.tasks[1].date = "2026-02-23"
+    assert len(scheduler.detect_conflicts()) == 1
+
+
+def test_detect_conflicts_finds_overlapping_durations():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk",    duration_minutes=20, priority=3, time="09:00"))
+    luna.add_task( Task(title="Feeding", duration_minutes=5,  priority=3, time="09:10"))
+    luna.add_task( Task(title="Brush",   duration_minutes=5,  priority=1, time="09:20"))
+    scheduler = Scheduler(owner=make_owner(mochi, luna))
+    conflicts = scheduler.detect_conflicts()
+    assert [(a.title, b.title) for a, b in conflicts] == [("Walk", "Feeding")]
+
+
+def test_detect_conflicts_ignores_tasks_on_different_dates():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=20, priority=3, date="2026-02-23", time="09:00"))
+    pet.add_task(Task(title="Walk", duration_minutes=20, priority=3, date="2026-02-24", time="09:00"))
+    scheduler = Scheduler(owner=make_owner(pet))
+    assert scheduler.detect_conflicts() == []
+
+
+def test_detect_conflicts_can_be_scoped_to_one_pet():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk",      duration_minutes=30, priority=3, time="09:00"))
+    mochi.add_task(Task(title="Breakfast", duration_minutes=5,  priority=3, time="09:15"))
+    luna.add_task( Task(title="Litter box", duration_minutes=5, priority=2, time="09:05"))
+    scheduler = Scheduler(owner=make_owner(mochi, luna))
+    assert len(scheduler.detect_conflicts()) == 2
+    assert [(a.title, b.title) for a, b in scheduler.iter_conflicts(pet=luna)] == []
+    assert [(a.title, b.title) for a, b in scheduler.iter_conflicts(pet=mochi)] == [("Walk", "Breakfast")]
+
+
+def test_owner_conflicts_match_unindexed_sweep():
+    rng = random.Random(7)
+    pets = [Pet(name=f"Pet {i}", species="dog") for i in range(3)]
+    owner = make_owner(*pets)
+    for i in range(200):
+        minute = rng.randrange(6 * 60, 9 * 60)
+        rng.choice(pets).add_task(Task(
+            title=f"Task {i}", duration_minutes=rng.randint(0, 45), priority=2,
+            date=rng.choice(["", "2026-02-23"]), time=f"{minute // 60:02d}:{minute % 60:02d}",
+        ))
+    scheduler = Scheduler(owner=owner)
+    indexed = {frozenset((a.id, b.id)) for a, b in scheduler.iter_conflicts()}
+    brute = set()
+    tasks = owner.get_all_tasks()
+    for i, a in enumerate(tasks):
+        for b in tasks[i + 1:]:
+            sa, ea = IntervalIndex.span(a)
+            sb, eb = IntervalIndex.span(b)
+            if a.date == b.date and sa < eb and sb < ea:
+                brute.add(frozenset((a.id, b.id)))
+    assert indexed == brute
+    probe = tasks[0]
+    expected = {t.id for t in tasks if t is not probe and frozenset((probe.id, t.id)) in brute}
+    assert {t.id for t in scheduler.conflicts_with(probe)} == expected
+
+
+# --- Schedule mode tests ---
+
+def test_optimal_mode_fills_minutes_greedy_leaves_unused():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Long walk",  duration_minutes=40, priority=2))
+    pet.add_task(Task(title="Vet call",   duration_minutes=30, priority=2))
+    pet.add_task(Task(title="Grooming",   duration_minutes=30, priority=2))
+    owner = make_owner(pet)
+    scheduler = Scheduler(owner=owner)
+
+    scheduler.build_schedule()
+    assert sum(t.duration_minutes for t in scheduler.schedule) == 40
+
+    scheduler.build_schedule(mode="optimal")
+    assert scheduler.mode_used == "optimal"
+    assert {t.title for t in scheduler.schedule} == {"Vet call", "Grooming"}
+    assert sum(t.duration_minutes for t in scheduler.schedule) == 60
+
+
+def test_optimal_mode_matches_brute_force():
+    rng = random.Random(3)
+    pet = Pet(name="Mochi", species="dog")
+    for i in range(10):
+        pet.add_task(Task(title=f"Task {i}", duration_minutes=rng.choice([5, 10, 15, 25, 40]),
+                          priority=rng.randint(1, 3)))
+    owner = make_owner(pet)
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule(mode="optimal")
+    value = lambda tasks: sum(t.priority * t.duration_minutes for t in tasks)
+    best = max(
+        value(combo)
+        for r in range(len(pet.tasks) + 1)
+        for combo in combinations(pet.tasks, r)
+        if sum(t.duration_minutes for t in combo) <= owner.available_minutes
+    )
+    assert value(scheduler.schedule) == best
+    assert sum(t.duration_minutes for t in scheduler.schedule) <= owner.available_minutes
+
+
+def test_optimal_mode_falls_back_to_greedy_when_too_large():
+    pet = Pet(name="Mochi", species="dog")
+    for i in range(5):
+        pet.add_task(Task(title=f"Task {i}", duration_minutes=i + 1, priority=2))
+    scheduler = Scheduler(owner=make_owner(pet))
+    scheduler.OPTIMAL_MAX_CELLS = 10
+    scheduler.build_schedule(mode="optimal")
+    assert scheduler.mode_used == "greedy"
+    assert len(scheduler.schedule) == 5
+
+
+def test_build_schedule_rejects_unknown_mode():
+    scheduler = Scheduler(owner=make_owner(Pet(name="Mochi", species="dog")))
+    with pytest.raises(ValueError):
+        scheduler.build_schedule(mode="fastest")
+
+
+# --- Incremental schedule tests ---
+
+def fresh_titles(owner, mode="greedy"):
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule(mode=mode)
+    return [t.title for t in scheduler.schedule], [t.title for t in scheduler.get_unscheduled()]
+
+
+@pytest.mark.parametrize("mode", ["greedy", "optimal"])
+def test_schedule_tracks_changes_without_rebuild(mode):
+    rng = random.Random(11)
+    pets = [Pet(name="Mochi", species="dog"), Pet(name="Luna", species="cat")]
+    owner = make_owner(*pets)
+    for i in range(30):
+        rng.choice(pets).add_task(Task(title=f"Task {i}", duration_minutes=rng.randint(1, 30),
+                                       priority=rng.randint(1, 3)))
+    live = Scheduler(owner=owner)
+    live.build_schedule(mode=mode)
+    for step in range(60):
+        action = rng.choice(["add", "remove", "priority", "duration", "budget"])
+        pet = rng.choice(pets)
+        if action == "add":
+            pet.add_task(Task(title=f"New {step}", duration_minutes=rng.randint(1, 30),
+                              priority=rng.randint(1, 3)))
+        elif action == "remove" and pet.tasks:
+            pet.remove_task(rng.choice(pet.tasks).id)
+        elif action == "priority" and pet.tasks:
+            rng.choice(pet.tasks).priority = rng.randint(1, 3)
+        elif action == "duration" and pet.tasks:
+            rng.choice(pet.tasks).duration_minutes = rng.randint(1, 30)
+        elif action == "budget":
+            owner.available_minutes = rng.randint(10, 120)
+        expected_schedule, expected_unscheduled = fresh_titles(owner, mode)
+        assert [t.title for t in live.schedule] == expected_schedule
+        assert [t.title for t in live.get_unscheduled()] == expected_unscheduled
+        used = sum(t.duration_minutes for t in live.schedule)
+        assert live.remaining_minutes == owner.available_minutes - used
+
+
+def test_schedule_picks_up_tasks_of_newly_added_pet():
+    mochi = Pet(name="Mochi", species="dog")
+    mochi.add_task(Task(title="Walk", duration_minutes=20, priority=3))
+    owner = make_owner(mochi)
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule()
+    luna = Pet(name="Luna", species="cat")
+    luna.add_task(Task(title="Litter box", duration_minutes=5, priority=2))
+    owner.add_pet(luna)
+    assert [t.title for t in scheduler.schedule] == ["Walk", "Litter box"]
+
+
+def test_owner_drops_weak_listener_of_discarded_scheduler():
+    owner = make_owner(Pet(name="Mochi", species="dog"))
+    for _ in range(5):
+        Scheduler(owner=owner)
+    assert owner._listeners == []              # unbuilt schedulers never subscribe
+    kept = Scheduler(owner=owner)
+    kept.build_schedule()
+    for _ in range(1000):
+        Scheduler(owner=owner).build_schedule()
+    gc.collect()
+    assert len(owner._listeners) == 1          # without any edit to prune them
+    owner.pets[0].add_task(Task(title="Walk", duration_minutes=20, priority=3))
+    assert [t.title for t in kept.schedule] == ["Walk"]
+
+
+def test_owner_subscribe_receives_task_events():
+    pet = Pet(name="Mochi", species="dog")
+    owner = make_owner(pet)
+    events = []
+    owner.subscribe(events.append)
+    walk = Task(title="Walk", duration_minutes=20, priority=3)
+    pet.add_task(walk)
+    walk.priority = 2
+    pet.remove_task(walk.id)
+    assert [(e.kind, e.field) for e in events] == [("add", ""), ("change", "priority"), ("remove", "")]
+    owner.unsubscribe(events.append)
+    pet.add_task(Task(title="Breakfast", duration_minutes=5, priority=3))
+    assert len(events) == 3
+
+
+# --- Task storage tests ---
+
+def test_task_ids_are_unique_integers():
+    a = Task(title="Walk", duration_minutes=20, priority=3)
+    b = Task(title="Walk", duration_minutes=20, priority=3)
+    assert isinstance(a.id, int) and a.id != b.id
+
+
+def _new_task_id(_=None):
+    return Task(title="Walk", duration_minutes=20, priority=3).id
+
+
+def _pid_and_block(_):
+    return os.getpid(), _new_task_id() >> ID_BLOCK_BITS
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_task_ids_do_not_repeat_across_processes():
+    code = "from pawpal_system import Task; print(Task(title='Walk', duration_minutes=20, priority=3).id)"
+    blocks = {(i, int(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                      check=True).stdout) >> ID_BLOCK_BITS) for i in range(3)}
+    blocks.add((os.getpid(), _new_task_id() >> ID_BLOCK_BITS))
+    with multiprocessing.get_context("fork").Pool(2) as pool:      # forked workers draw their own block
+        blocks.update(pool.map(_pid_and_block, range(4), chunksize=1))
+    assert len({block for _, block in blocks}) == len(blocks)
+
+
+def test_task_ids_work_without_fork_hooks():
+    code = "import os; del os.register_at_fork; import pawpal_system; print(pawpal_system.Task('Walk', 20, 3).id)"
+    assert int(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout) > 0
+
+
+def test_reserving_ids_from_another_block_leaves_new_ids_alone():
+    mine = _new_task_id()
+    reserve_task_ids(mine ^ (1 << 40))                 # an id from some other process's block
+    reserve_task_ids(mine + 50)                        # and one from this process's block
+    assert mine + 50 < _new_task_id() < mine + 100
+
+
+def test_task_pet_link_is_set_before_init():
+    task = Task.__new__(Task)
+    assert task._pet is None
+    copied = pickle.loads(pickle.dumps(Task(title="Walk", duration_minutes=20, priority=3)))
+    assert copied.pet is None and copied.title == "Walk"
+
+
+def test_task_has_no_instance_dict():
+    assert not hasattr(Task(title="Walk", duration_minutes=20, priority=3), "__dict__")
+
+
+def test_pickled_owner_keeps_tracking_changes():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk",      duration_minutes=20, priority=3, time="09:00"))
+    pet.add_task(Task(title="Breakfast", duration_minutes=5,  priority=3, time="10:00"))
+    copy = pickle.loads(pickle.dumps(make_owner(pet)))
+    copy.pets[0].tasks[1].time = "09:05"
+    assert len(Scheduler(owner=copy).detect_conflicts()) == 1
+
+
+# --- Recurrence expansion tests ---
+
+def test_iter_occurrences_expands_daily_and_weekly_rules():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=20, priority=3,
+                      frequency="daily", date="2026-03-01"))
+    pet.add_task(Task(title="Bath", duration_minutes=15, priority=2,
+                      frequency="weekly", date="2026-02-23"))
+    pet.add_task(Task(title="Vet", duration_minutes=60, priority=3, date="2026-03-04"))
+    scheduler = Scheduler(owner=make_owner(pet))
+    occurrences = list(scheduler.iter_occurrences(date(2026, 3, 1), date(2026, 3, 9)))
+    assert [(o.date, o.task.title) for o in occurrences if o.task.title != "Walk"] == [
+        ("2026-03-02", "Bath"), ("2026-03-04", "Vet"), ("2026-03-09", "Bath"),
+    ]
+    assert sum(o.task.title == "Walk" for o in occurrences) == 9
+    assert [o.date for o in occurrences] == sorted(o.date for o in occurrences)
+    assert len(pet.tasks) == 3
+
+
+def test_completed_recurring_chain_does_not_double_count():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=20, priority=3,
+                      frequency="daily", date="2026-03-01"))
+    scheduler = Scheduler(owner=make_owner(pet))
+    scheduler.mark_task_complete(pet.tasks[0])
+    days = [o.date for o in scheduler.iter_occurrences(date(2026, 3, 1), date(2026, 3, 3))]
+    assert days == ["2026-03-01", "2026-03-02", "2026-03-03"]
+
+
+def test_occurrences_on_can_be_scoped_to_one_pet():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk", duration_minutes=20, priority=3, frequency="daily"))
+    luna.add_task( Task(title="Brush", duration_minutes=5, priority=1, frequency="weekly",
+                        date="2026-03-01"))
+    scheduler = Scheduler(owner=make_owner(mochi, luna))
+    assert [t.title for t in scheduler.occurrences_on(date(2026, 3, 8))] == ["Walk", "Brush"]
+    assert [t.title for t in scheduler.occurrences_on(date(2026, 3, 8), pet=luna)] == ["Brush"]
+    assert scheduler.occurrences_on(date(2026, 3, 9), pet=luna) == []
+
+
+def test_task_knows_its_pet():
+    pet = Pet(name="Mochi", species="dog")
+    walk = Task(title="Walk", duration_minutes=20, priority=3)
+    assert walk.pet is None
+    pet.add_task(walk)
+    assert walk.pet is pet
+    pet.remove_task(walk.id)
+    assert walk.pet is None
+
+
+# --- Multi-day planning tests ---
+
+def test_plan_range_uses_per_day_budgets():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=30, priority=3, frequency="daily",
+                      date="2026-03-06"))
+    pet.add_task(Task(title="Play", duration_minutes=30, priority=1, frequency="daily",
+                      date="2026-03-06"))
+    owner = make_owner(pet)
+    owner.daily_minutes = {"saturday": 90, "2026-03-08": 0}
+    plans = Scheduler(owner=owner).plan_range(date(2026, 3, 6), date(2026, 3, 8))
+    assert [p.date for p in plans] == ["2026-03-06", "2026-03-07", "2026-03-08"]
+    assert [p.budget for p in plans] == [60, 90, 0]
+    assert [[t.title for t in p.scheduled] for p in plans] == [["Walk", "Play"], ["Walk", "Play"], []]
+
+
+def test_plan_range_carries_one_off_work_forward():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk",     duration_minutes=50, priority=3, frequency="daily",
+                      date="2026-03-01"))
+    pet.add_task(Task(title="Grooming", duration_minutes=30, priority=2, date="2026-03-01"))
+    pet.add_task(Task(title="Nails",    duration_minutes=10, priority=2, date="2026-03-02"))
+    owner = make_owner(pet)
+    owner.daily_minutes = {"2026-03-02": 100}
+    day1, day2 = Scheduler(owner=owner).plan_range(date(2026, 3, 1), date(2026, 3, 2))
+    assert [t.title for t in day1.scheduled] == ["Walk"]
+    assert [t.title for t in day1.unscheduled] == ["Grooming"]
+    # Carried grooming is older than today's nails, so it goes first within priority 2.
+    assert [t.title for t in day2.scheduled] == ["Walk", "Grooming", "Nails"]
+    assert day2.unscheduled == []
+    assert day2.minutes_used == 90
+
+
+def test_plan_range_drops_missed_recurring_instance_when_it_recurs():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Long walk", duration_minutes=90, priority=3, frequency="daily",
+                      date="2026-03-01"))
+    plans = Scheduler(owner=make_owner(pet)).plan_range(date(2026, 3, 1), date(2026, 3, 3))
+    assert all(len(p.unscheduled) == 1 for p in plans)
+
+
+def test_plan_range_carries_overdue_one_off_tasks_in():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=30, priority=3, frequency="daily",
+                      date="2026-02-20"))
+    pet.add_task(Task(title="Vet call", duration_minutes=20, priority=2, date="2026-02-27"))
+    pet.add_task(Task(title="Bath", duration_minutes=20, priority=2, date="2026-02-25"))
+    pet.add_task(Task(title="Old trim", duration_minutes=20, priority=2, date="2026-02-25",
+                      completed=True))
+    plans = Scheduler(owner=make_owner(pet)).plan_range(date(2026, 3, 1), date(2026, 3, 2))
+    # The older overdue task goes first within its priority; the other waits a day.
+    assert [t.title for t in plans[0].scheduled] == ["Walk", "Bath"]
+    assert [t.title for t in plans[0].unscheduled] == ["Vet call"]
+    assert [t.title for t in plans[1].scheduled] == ["Walk", "Vet call"]
+
+
+def test_plan_range_skips_completed_tasks():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Vet", duration_minutes=30, priority=3, date="2026-03-01",
+                      completed=True))
+    plans = Scheduler(owner=make_owner(pet)).plan_range(date(2026, 3, 1), date(2026, 3, 1))
+    assert plans[0].scheduled == [] and plans[0].unscheduled == []
+
+
+def test_task_from_dict_round_trips_to_dict():
+    task = Task(title="Walk", duration_minutes=20, priority=3, category="exercise", notes="leash",
+                completed=True, frequency="daily", date="2026-02-23", time="09:00")
+    assert Task.from_dict(task.to_dict()) == task
+
+
+def test_owner_query_intersects_indexes_and_tracks_changes():
+    mochi = Pet(name="Mochi", species="dog")
+    luna = Pet(name="Luna", species="cat")
+    walk = Task(title="Walk", duration_minutes=20, priority=3, category="exercise", date="2026-02-23")
+    pills = Task(title="Pills", duration_minutes=5, priority=3, category="meds", date="2026-02-23")
+    play = Task(title="Play", duration_minutes=15, priority=2, category="exercise", date="2026-02-23")
+    mochi.add_task(walk)
+    owner = make_owner(mochi, luna)
+    luna.add_task(play)
+    mochi.add_task(pills)
+
+    assert owner.query(date="2026-02-23") == [walk, pills, play]
+    assert owner.query(priority=3, category="exercise") == [walk]
+    assert owner.query(category="grooming") == []
+
+    walk.mark_complete()
+    play.priority = 3
+    assert owner.query(priority=3, completed=False) == [pills, play]
+    assert owner.filter_by_priority(2) == []
+
+    mochi.remove_task(pills.id)
+    assert owner.query(priority=3) == [walk, play]
+    assert owner.get_all_tasks() == [walk, play]
+
+
+def test_owner_query_rejects_unindexed_fields():
+    with pytest.raises(TypeError):
+        make_owner().query(title="Walk")
+
+
+def test_pet_priority_views_refresh_after_changes():
+    pet = Pet(name="Mochi", species="dog")
+    feed = Task(title="Feed", duration_minutes=10, priority=2)
+    walk = Task(title="Walk", duration_minutes=20, priority=1)
+    pet.add_task(feed)
+    pet.add_task(walk)
+    assert pet.get_all_tasks() == [feed, walk]
+
+    walk.priority = 3
+    assert pet.get_all_tasks() == [walk, feed]
+    assert pet.get_tasks_by_priority(3) == [walk]
+
+    pet.get_all_tasks().clear()
+    assert pet.get_all_tasks() == [walk, feed]
+
+
+def test_explanations_give_structured_reasons():
+    pet = Pet(name="Mochi", species="dog")
+    walk = Task(title="Walk", duration_minutes=30, priority=3, date="2026-02-23", time="09:00")
+    feed = Task(title="Feed", duration_minutes=10, priority=2, date="2026-02-23", time="09:10")
+    brush = Task(title="Brush", duration_minutes=40, priority=1)
+    hike = Task(title="Hike", duration_minutes=90, priority=3)
+    for task in (hike, walk, feed, brush):
+        pet.add_task(task)
+    scheduler = Scheduler(owner=make_owner(pet))
+    assert {e.reason for e in scheduler.iter_explanations()} == {"unplanned"}
+
+    scheduler.build_schedule()
+    by_task = {e.task.title: e for e in scheduler.iter_explanations()}
+    assert by_task["Walk"].reason == "fits_budget" and by_task["Walk"].conflicts == (feed,)
+    assert by_task["Feed"].minutes_used == 40
+    assert by_task["Hike"].reason == "over_budget" and by_task["Hike"].shortfall == 30
+    assert by_task["Brush"].reason == "lower_priority"
+    assert by_task["Brush"].outranked_by is feed and by_task["Brush"].shortfall == 20
+    assert "20 min short" in by_task["Brush"].text()
+
+
+def test_optimal_explanations_mark_trade_offs():
+    pet = Pet(name="Mochi", species="dog")
+    big = Task(title="Big", duration_minutes=35, priority=3)
+    pet.add_task(big)
+    pet.add_task(Task(title="Half A", duration_minutes=30, priority=3))
+    pet.add_task(Task(title="Half B", duration_minutes=30, priority=3))
+    scheduler = Scheduler(owner=make_owner(pet))
+    scheduler.build_schedule(mode="optimal")
+    skipped = [e for e in scheduler.iter_explanations() if not e.scheduled]
+    assert [(e.task, e.reason) for e in skipped] == [(big, "traded_off")]
+
+
+def test_explain_renders_only_the_requested_page():
+    pet = Pet(name="Mochi", species="dog")
+    for i in range(10):
+        pet.add_task(Task(title=f"Task {i}", duration_minutes=15, priority=2))
+    scheduler = Scheduler(owner=make_owner(pet))
+    scheduler.build_schedule()
+    everything = scheduler.explain()
+    assert len(everything) == 10
+    assert scheduler.explain(limit=3, offset=3) == everything[3:6]
+
+
+def test_explanations_look_up_conflicts_only_when_read():
+    pet = Pet(name="Mochi", species="dog")
+    for i in range(6):
+        pet.add_task(Task(title=f"Task {i}", duration_minutes=30, priority=i % 3 + 1,
+                          date="2026-02-23", time=f"09:{i * 5:02d}"))
+    owner = make_owner(pet)
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule()
+    lookups = []
+    overlapping = owner.overlapping
+    owner.overlapping = lambda task: lookups.append(task) or overlapping(task)
+    records = list(scheduler.iter_explanations())
+    assert lookups == []
+    assert len(records[0].conflicts) == 5 and lookups == [records[0].task]
+
+    everything = scheduler.explain()
+    assert everything == [e.text() for e in records] and "Overlaps" in everything[0]
+    pet.tasks[0].title = "Renamed"
+    assert scheduler.explain() == [e.text() for e in scheduler.iter_explanations()]
+    assert any(line.startswith("'Renamed'") for line in scheduler.explain())
+
+
+def test_optional_subsystems_load_on_first_use():
+    import pawpal_system
+    import pawpal_slots
+
+    assert pawpal_system.SlotPlanner is pawpal_slots.SlotPlanner
+    assert "TeamPlanner" in dir(pawpal_system)
+    with pytest.raises(AttributeError):
+        pawpal_system.NoSuchThing
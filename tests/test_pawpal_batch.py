@@ -0,0 +1,91 @@
+import random
+from array import array
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_batch import BatchScheduler, pack_owner, unpack_owner
+
+
+def make_owners(count, seed=5):
+    rng = random.Random(seed)
+    owners = []
+    for n in range(count):
+        owner = Owner(name=f"Owner {n}", available_minutes=rng.randint(30, 120))
+        for p in range(2):
+            pet = Pet(name=f"Pet {p}", species="dog")
+            for i in range(rng.randint(0, 8)):
+                pet.add_task(Task(title=f"Task {i}", duration_minutes=rng.randint(5, 40),
+                                  priority=rng.randint(1, 3)))
+            owner.add_pet(pet)
+        owners.append(owner)
+    return owners
+
+
+def expected_ids(owner, mode="greedy"):
+    scheduler = Scheduler(owner=owner)
+    scheduler.build_schedule(mode=mode)
+    return [t.id for t in scheduler.schedule]
+
+
+def test_unpacked_owner_schedules_like_original():
+    for owner in make_owners(10):
+        assert expected_ids(unpack_owner(pack_owner(owner))) == expected_ids(owner)
+
+
+def test_packing_keeps_priorities_outside_a_byte():
+    pet = Pet(name="Mochi", species="dog", tasks=[
+        Task(title="Walk", duration_minutes=20, priority=500),
+        Task(title="Brush", duration_minutes=20, priority=-200),
+        Task(title="Feed", duration_minutes=20, priority=128),
+    ])
+    owner = Owner(name="Jordan", available_minutes=40, pets=[pet])
+    assert list(pack_owner(owner)[4]) == [t.priority for t in owner.get_all_tasks()]
+    assert expected_ids(unpack_owner(pack_owner(owner))) == expected_ids(owner)
+
+
+@pytest.mark.parametrize("mode", ["greedy", "optimal"])
+def test_inline_batch_matches_scheduler(mode):
+    owners = make_owners(20)
+    batch = BatchScheduler(workers=0, chunk_size=3, mode=mode)
+    results = list(batch.run(owners))
+    assert [r.index for r in results] == list(range(20))
+    assert [r.scheduled_ids for r in results] == [expected_ids(o, mode) for o in owners]
+    assert sum(s.owners for s in batch.stats.values()) == 20
+
+
+def test_process_pool_batch_keeps_input_order_when_asked():
+    owners = make_owners(40)
+    batch = BatchScheduler(workers=2, chunk_size=4)
+    results = list(batch.run(iter(owners), ordered=True))
+    assert [r.index for r in results] == list(range(40))
+    assert [r.scheduled_ids for r in results] == [expected_ids(o) for o in owners]
+    assert all(rate > 0 for rate in batch.throughput().values())
+
+
+def test_ordered_batch_bounds_results_waiting_on_a_slow_chunk():
+    size = 400_000
+    slow = ("Slow", 60, array("q", range(size)), array("l", [5] * size), array("l", [1, 2, 3, 2] * (size // 4)))
+    read = []
+
+    def payloads():
+        yield slow
+        for owner in make_owners(200):
+            read.append(owner)
+            yield pack_owner(owner)
+
+    results = BatchScheduler(workers=2, chunk_size=1).run(payloads(), ordered=True)
+    first = next(results)
+    assert first.name == "Slow" and len(read) <= 2 * 2
+    assert len(list(results)) == 200
+
+
+def test_batch_accepts_packed_payloads():
+    owners = make_owners(5)
+    results = list(BatchScheduler(workers=0).run(pack_owner(o) for o in owners))
+    assert [r.name for r in results] == [o.name for o in owners]
+
+
+def test_batch_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        BatchScheduler(mode="fastest")
@@ -0,0 +1,40 @@
+from pawpal_system import Task, Pet, Owner
+from pawpal_cache import RenderCache, owner_key
+
+
+def test_cache_counts_hits_and_misses():
+    cache = RenderCache()
+    calls = []
+    compute = lambda: calls.append(1) or len(calls)
+    assert cache.get_or_compute("a", compute) == 1
+    assert cache.get_or_compute("a", compute) == 1
+    assert (cache.stats.hits, cache.stats.misses, len(calls)) == (1, 1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_cache_evicts_least_recently_used():
+    cache = RenderCache(max_entries=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 1)      # "b" is now the oldest
+    cache.get_or_compute("c", lambda: 3)
+    assert len(cache) == 2 and cache.stats.evictions == 1
+    assert cache.get_or_compute("a", lambda: "recomputed") == 1
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+
+
+def test_owner_key_changes_with_tasks_and_budget():
+    pet = Pet(name="Mochi", species="dog")
+    owner = Owner(name="Jordan", available_minutes=60)
+    keys = [owner_key(owner)]
+    owner.add_pet(pet)
+    keys.append(owner_key(owner))
+    task = Task(title="Walk", duration_minutes=20, priority=3)
+    pet.add_task(task)
+    keys.append(owner_key(owner))
+    task.mark_complete()
+    keys.append(owner_key(owner))
+    owner.available_minutes = 90
+    keys.append(owner_key(owner))
+    assert len(set(keys)) == len(keys)
+    assert owner_key(owner) == keys[-1]
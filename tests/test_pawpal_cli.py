@@ -0,0 +1,60 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+from pawpal_system import Task, Pet, Owner
+from pawpal_snapshot import write_snapshot
+from pawpal_cli import main
+
+ROOT = Path(__file__).resolve().parent.parent
+# Modules a CLI run must not pay for unless it asks for them.
+OPTIONAL = ["streamlit", "app", "sqlite3", "asyncio", "concurrent.futures", "multiprocessing",
+            "cProfile", "tracemalloc", "pawpal_db", "pawpal_service", "pawpal_batch",
+            "pawpal_profile", "pawpal_slots", "pawpal_team", "pawpal_store", "pawpal_cache",
+            "pawpal_history", "pawpal_whatif", "pawpal_vector", "numpy"]
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def make_snapshot(tmp_path):
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=30, priority=3, date="2026-02-23", time="09:00"))
+    pet.add_task(Task(title="Brush", duration_minutes=20, priority=1, date="2026-02-23", time="09:10"))
+    pet.add_task(Task(title="Bath", duration_minutes=45, priority=2))
+    owner = Owner(name="Jordan", available_minutes=60)
+    owner.add_pet(pet)
+    path = str(tmp_path / "owner.jsonl")
+    write_snapshot(owner, path)
+    return path
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def test_cli_schedules_from_a_snapshot(tmp_path):
+    out = io.StringIO()
+    assert main([make_snapshot(tmp_path), "--conflicts", "--explain", "--day", "2026-02-23"], out) == 0
+    text = out.getvalue()
+    assert "  - [high] Walk (30 min)" in text
+    assert "Skipped (not enough time):\n  - Bath (45 min)" in text
+    assert "Walk (2026-02-23 09:00) overlaps Brush (09:10)" in text
+    assert "09:00-09:30  Walk" in text
+
+
+def test_cli_reports_a_missing_snapshot(tmp_path, capsys):
+    assert main([str(tmp_path / "missing.jsonl")], io.StringIO()) == 2
+    assert "Could not read" in capsys.readouterr().err
+
+
+def test_cli_import_skips_optional_subsystems():
+    result = run_python(f"import sys, pawpal_cli; print([m for m in {OPTIONAL!r} if m in sys.modules])")
+    assert result.stdout.strip() == "[]"
+
+
+def test_cli_import_time_within_budget():
+    # -X importtime prints "self | cumulative | name" in microseconds; the last line is pawpal_cli.
+    best = min(int(run_python("import pawpal_cli").stderr.strip().splitlines()[-1].split("|")[1])
+               for _ in range(3))
+    assert best / 1e6 < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,140 @@
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_db import LazyPet, PawPalDB
+
+
+def make_owner():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk", duration_minutes=20, priority=3, category="exercise",
+                        frequency="daily", date="2026-02-23", time="09:00"))
+    mochi.add_task(Task(title="Flea treatment", duration_minutes=10, priority=2, category="meds",
+                        notes="left shoulder", completed=True, date="2026-02-20"))
+    luna.add_task(Task(title="Litter box", duration_minutes=5, priority=2, category="grooming",
+                       time="09:10"))
+    owner = Owner(name="Jordan", available_minutes=60, daily_minutes={"saturday": 120})
+    owner.add_pet(mochi)
+    owner.add_pet(luna)
+    return owner
+
+
+def test_round_trip_keeps_every_field(tmp_path):
+    owner = make_owner()
+    with PawPalDB(str(tmp_path / "pawpal.db")) as db:
+        owner_id = db.save_owner(owner)
+    with PawPalDB(str(tmp_path / "pawpal.db")) as db:
+        loaded = db.load_owner(owner_id, lazy=False)
+    assert loaded == owner
+
+
+def test_lazy_pets_read_tasks_on_first_access():
+    db = PawPalDB()
+    owner_id = db.save_owner(make_owner())
+    loaded = db.load_owner(owner_id)
+    mochi, luna = loaded.pets
+    assert isinstance(mochi, LazyPet) and not mochi.is_loaded and not luna.is_loaded
+    assert [t.title for t in mochi.tasks] == ["Walk", "Flea treatment"]
+    assert mochi.is_loaded and not luna.is_loaded
+    # Scheduling needs everything, and loaded tasks reach the owner's conflict index.
+    scheduler = Scheduler(owner=loaded)
+    scheduler.build_schedule()
+    assert luna.is_loaded
+    assert len(scheduler.detect_conflicts()) == 0
+    loaded.pets[1].tasks[0].date = "2026-02-23"
+    assert len(scheduler.detect_conflicts()) == 1
+
+
+def test_saving_again_updates_in_place_and_keeps_unread_pets():
+    db = PawPalDB()
+    owner_id = db.save_owner(make_owner())
+    loaded = db.load_owner(owner_id)
+    loaded.pets[1].add_task(Task(title="Brush", duration_minutes=5, priority=1))
+    loaded.add_pet(Pet(name="Pip", species="other"))
+    assert db.save_owner(loaded) == owner_id
+    assert db.list_owners() == [(owner_id, "Jordan")]
+    reloaded = db.load_owner(owner_id, lazy=False)
+    assert [p.name for p in reloaded.pets] == ["Mochi", "Luna", "Pip"]
+    assert [t.title for t in reloaded.pets[0].tasks] == ["Walk", "Flea treatment"]
+    assert [t.title for t in reloaded.pets[1].tasks] == ["Litter box", "Brush"]
+
+
+def test_removed_pet_is_deleted_on_save():
+    db = PawPalDB()
+    owner = make_owner()
+    owner_id = db.save_owner(owner)
+    owner.pets.pop()
+    db.save_owner(owner)
+    assert [p.name for p in db.load_owner(owner_id).pets] == ["Mochi"]
+    assert len(db.query_tasks(owner_id)) == 2
+
+
+def test_query_tasks_pushes_filters_into_sql():
+    db = PawPalDB()
+    owner_id = db.save_owner(make_owner())
+    assert [t.title for t in db.query_tasks(owner_id)] == ["Walk", "Flea treatment", "Litter box"]
+    assert [t.title for t in db.query_tasks(owner_id, priority=2)] == ["Flea treatment", "Litter box"]
+    assert [t.title for t in db.query_tasks(owner_id, pet="Luna")] == ["Litter box"]
+    assert [t.title for t in db.query_tasks(owner_id, completed=False, category="exercise")] == ["Walk"]
+    assert [t.title for t in db.query_tasks(owner_id, date_from="2026-02-21")] == ["Walk"]
+    assert [t.title for t in db.query_tasks(owner_id, time_from="09:05", time_to="10:00")] == ["Litter box"]
+
+
+def test_new_tasks_get_ids_above_saved_ones(tmp_path):
+    path = str(tmp_path / "pawpal.db")
+    with PawPalDB(path) as db:
+        owner = Owner(name="Jordan", available_minutes=60)
+        pet = Pet(name="Mochi", species="dog")
+        pet.add_task(Task(title="Walk", duration_minutes=20, priority=3, id=10_000_000))
+        owner.add_pet(pet)
+        db.save_owner(owner)
+    with PawPalDB(path):
+        assert Task(title="New", duration_minutes=5, priority=1).id > 10_000_000
+
+
+def test_conflicts_on_a_lazily_loaded_owner():
+    db = PawPalDB()
+    owner = make_owner()
+    owner.pets[1].tasks[0].date = "2026-02-23"
+    loaded = db.load_owner(db.save_owner(owner))
+    assert not loaded.pets[0].is_loaded
+    scheduler = Scheduler(owner=loaded)
+    assert [(a.title, b.title) for a, b in scheduler.detect_conflicts()] == [("Walk", "Litter box")]
+    assert [t.title for t in scheduler.conflicts_with(loaded.pets[0].tasks[0])] == ["Litter box"]
+
+
+def test_save_rewrites_only_changed_pets():
+    db = PawPalDB()
+    owner = make_owner()
+    owner_id = db.save_owner(owner)
+    loaded = db.load_owner(owner_id)
+    loaded.get_all_tasks()                         # reading the tasks is not an edit
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    db.save_owner(loaded)
+    assert not [s for s in statements if "tasks" in s]
+
+    loaded.pets[1].tasks[0].priority = 3
+    statements.clear()
+    db.save_owner(loaded)
+    written = [s for s in statements if "tasks" in s]
+    assert written and all(f"pet_id = {loaded.pets[1]._db_marks[db.key][0]}" in s or "INSERT" in s for s in written)
+    assert len([s for s in written if "INSERT" in s]) == 1
+    assert [t.priority for t in db.load_owner(owner_id, lazy=False).pets[1].tasks] == [3]
+
+
+def test_save_to_a_second_database_inserts_everything(tmp_path):
+    first = PawPalDB(str(tmp_path / "a.db"))
+    second = PawPalDB(str(tmp_path / "b.db"))
+    owner = make_owner()
+    loaded = first.load_owner(first.save_owner(owner))             # pets not read yet
+    owner_id = second.save_owner(loaded)
+    assert second.list_owners() == [(owner_id, "Jordan")]
+    assert second.load_owner(owner_id, lazy=False) == owner
+
+    loaded.pets[0].tasks[0].priority = 1
+    assert second.save_owner(loaded) == owner_id and first.save_owner(loaded) == 1
+    assert len(first.list_owners()) == 1 and len(second.list_owners()) == 1
+    for db in (first, second):
+        assert db.load_owner(1, lazy=False).pets[0].tasks[0].priority == 1
+        db.close()
+    with PawPalDB(str(tmp_path / "a.db")) as reopened:
+        assert reopened.save_owner(loaded) == 1 and len(reopened.list_owners()) == 1
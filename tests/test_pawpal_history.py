@@ -0,0 +1,108 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_history import CompletionLog, RollingStats
+
+DAY = date(2026, 2, 23)
+
+
+def make_owner(*tasks):
+    pet = Pet(name="Mochi", species="dog")
+    for task in tasks:
+        pet.add_task(task)
+    owner = Owner(name="Jordan", available_minutes=60)
+    owner.add_pet(pet)
+    return owner
+
+
+def test_log_records_each_completion_once(tmp_path):
+    walk = Task(title="Walk", duration_minutes=20, priority=3, category="exercise",
+                frequency="daily", date="2026-02-23")
+    owner = make_owner(walk)
+    path = str(tmp_path / "log.jsonl")
+    log = CompletionLog(owner, path=path, clock=lambda: DAY)
+
+    Scheduler(owner=owner).mark_task_complete(walk)
+    walk.mark_complete()                                   # already done: not logged again
+    assert [(c.task_id, c.pet, c.minutes) for c in log] == [(walk.id, "Mochi", 20)]
+    assert log.stats[7].minutes_by_category(DAY) == {"exercise": 20}
+
+    reopened = CompletionLog(make_owner(), path=path)      # the file is appended to, not rewritten
+    assert len(reopened) == 1
+
+
+def test_reopened_log_restores_its_stats(tmp_path):
+    path = str(tmp_path / "log.jsonl")
+    log = CompletionLog(make_owner(), path=path, clock=lambda: DAY)
+    walk = Task(title="Walk", duration_minutes=20, priority=3, category="exercise")
+    for back in (40, 9, 2, 1, 0):
+        log.record(walk, "Mochi", day=DAY - timedelta(days=back))
+
+    reopened = CompletionLog(make_owner(), path=path, clock=lambda: DAY)
+    assert len(reopened) == 5
+    for days in (7, 30):
+        assert reopened.stats[days].completed(DAY) == log.stats[days].completed(DAY)
+        assert reopened.stats[days].minutes(DAY) == log.stats[days].minutes(DAY)
+    assert reopened.stats[7].completed(DAY) == 3 and reopened.stats[30].completed(DAY) == 4
+    assert reopened.stats[7].streak(DAY) == 3
+
+
+def test_rolling_stats_slide_the_window():
+    stats = RollingStats(3)
+    stats.add(DAY, 10, "meds")
+    stats.add(DAY + timedelta(days=1), 20, "exercise")
+    stats.add(DAY + timedelta(days=1), 5, "meds")
+    assert stats.completed(DAY + timedelta(days=1)) == 3
+    assert stats.minutes_by_category(DAY + timedelta(days=2)) == {"meds": 15, "exercise": 20}
+    assert stats.streak(DAY + timedelta(days=2)) == 2
+
+    later = DAY + timedelta(days=3)                        # DAY drops out of the window
+    assert stats.minutes_by_category(later) == {"meds": 5, "exercise": 20}
+    assert stats.completion_rate(later) == pytest.approx(2 / 3)
+    assert stats.streak(later) == 0
+    stats.add(DAY, 99)                                     # too old to count
+    assert stats.minutes(later) == 25
+
+
+def test_rolling_stats_match_a_rescan():
+    rng = random.Random(11)
+    stats = RollingStats(7)
+    history = []
+    today = DAY
+    for _ in range(300):
+        today += timedelta(days=rng.choice([0, 0, 1, 1, 2, 9]))
+        day = today - timedelta(days=rng.randint(0, 3))
+        minutes, category = rng.randint(5, 60), rng.choice(["meds", "walk", ""])
+        stats.add(day, minutes, category)
+        history.append((day, minutes, category))
+        window = [(d, m, c) for d, m, c in history if 0 <= (today - d).days < 7]
+        expected = {}
+        for _, m, c in window:
+            expected[c] = expected.get(c, 0) + m
+        assert stats.completed(today) == len(window)
+        assert stats.minutes(today) == sum(m for _, m, _ in window)
+        assert stats.minutes_by_category(today) == expected
+
+
+def test_compact_moves_finished_tasks_to_the_archive(tmp_path):
+    walk = Task(title="Walk", duration_minutes=20, priority=3, frequency="daily", date="2026-02-20")
+    vet = Task(title="Vet", duration_minutes=60, priority=3, date="2026-02-21", completed=True)
+    bath = Task(title="Bath", duration_minutes=30, priority=2, date="2026-02-20")
+    owner = make_owner(walk, vet, bath)
+    log = CompletionLog(owner, archive_path=str(tmp_path / "archive.jsonl"), clock=lambda: DAY)
+    scheduler = Scheduler(owner=owner)
+    for _ in range(3):
+        scheduler.mark_task_complete(next(t for t in owner.get_all_tasks() if t.title == "Walk"
+                                          and not t.completed))
+    assert len(owner.pets[0].tasks) == 6
+
+    assert log.compact() == 4                              # walks of the 20th-22nd and the vet visit
+    remaining = sorted((t.title, t.date) for t in owner.pets[0].tasks)
+    assert remaining == [("Bath", "2026-02-20"), ("Walk", "2026-02-23")]
+    assert owner.query(completed=True) == []
+    assert sorted(t.date for _, t in log.archived()) == ["2026-02-20", "2026-02-21", "2026-02-21",
+                                                          "2026-02-22"]
+    assert len(log) == 3
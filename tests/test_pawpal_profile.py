@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner, Scheduler
+
+
+def make_scheduler():
+    pet = Pet(name="Mochi", species="dog")
+    pet.add_task(Task(title="Walk", duration_minutes=30, priority=3, frequency="daily",
+                      date="2026-02-23", time="09:00"))
+    pet.add_task(Task(title="Feed", duration_minutes=10, priority=2, time="09:10", date="2026-02-23"))
+    pet.add_task(Task(title="Brush", duration_minutes=40, priority=1))
+    owner = Owner(name="Jordan", available_minutes=60)
+    owner.add_pet(pet)
+    return Scheduler(owner=owner)
+
+
+def test_instrument_counts_calls_and_sizes():
+    scheduler = make_scheduler()
+    with scheduler.instrument() as stats:
+        scheduler.build_schedule()
+        scheduler.explain()
+        scheduler.get_unscheduled()
+        scheduler.detect_conflicts()
+        scheduler.mark_task_complete(scheduler.schedule[0])
+
+    assert stats.methods["build_schedule"].calls == 1
+    assert stats.methods["get_unscheduled"].calls == 1
+    assert stats.methods["build_schedule"].max_tasks == 3
+    assert stats.methods["mark_task_complete"].max_tasks == 4
+    assert set(stats.slowest()) == set(Scheduler.INSTRUMENTED_METHODS)
+    assert json.loads(stats.to_json())["methods"]["explain"]["calls"] == 1
+
+
+def test_instrumentation_is_removed_after_the_block():
+    scheduler = make_scheduler()
+    with scheduler.instrument() as stats:
+        scheduler.build_schedule()
+    scheduler.build_schedule()
+    assert stats.methods["build_schedule"].calls == 1
+    assert not set(Scheduler.INSTRUMENTED_METHODS) & set(vars(scheduler))
+
+
+@pytest.mark.parametrize("capture, field", [("cprofile", "profile"), ("tracemalloc", "allocations")])
+def test_capture_modes_fill_their_section(capture, field):
+    scheduler = make_scheduler()
+    with scheduler.instrument(capture=capture) as stats:
+        scheduler.build_schedule(mode="optimal")
+    assert getattr(stats, field)
+    json.dumps(stats.to_dict())
+
+
+def test_instrument_rejects_unknown_capture():
+    with pytest.raises(ValueError):
+        with make_scheduler().instrument(capture="perf"):
+            pass
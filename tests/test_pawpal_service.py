@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner, Scheduler
+from pawpal_service import PawPalClient, PawPalServer, PawPalService, ServiceError
+
+
+def make_owner():
+    mochi = Pet(name="Mochi", species="dog")
+    mochi.add_task(Task(title="Walk", duration_minutes=30, priority=3, date="2026-02-23", time="09:00"))
+    mochi.add_task(Task(title="Feed", duration_minutes=10, priority=2, date="2026-02-23", time="09:10"))
+    mochi.add_task(Task(title="Brush", duration_minutes=40, priority=1, frequency="daily",
+                        date="2026-02-23"))
+    owner = Owner(name="Jordan", available_minutes=60)
+    owner.add_pet(mochi)
+    return owner
+
+
+def test_schedule_matches_scheduler():
+    owner = make_owner()
+    expected = Scheduler(owner=owner)
+    expected.build_schedule()
+
+    async def run():
+        async with PawPalService([owner], workers=2) as service:
+            return await service.schedule("Jordan")
+
+    result = asyncio.run(run())
+    assert [t["id"] for t in result["scheduled"]] == [t.id for t in expected.schedule]
+    assert result["remaining_minutes"] == expected.remaining_minutes
+
+
+def test_concurrent_requests_share_one_batch():
+    async def run():
+        async with PawPalService([make_owner()], batch_window=0.01) as service:
+            results = await asyncio.gather(
+                *(service.schedule("Jordan") for _ in range(10)),
+                service.conflicts("Jordan"),
+            )
+            return service.stats, results
+
+    stats, results = asyncio.run(run())
+    assert (stats.requests, stats.batches, stats.jobs) == (11, 1, 2)
+    assert all(r == results[0] for r in results[:10])
+    assert len(results[10]["conflicts"]) == 1
+
+
+def test_backpressure_caps_requests_in_flight():
+    async def run():
+        async with PawPalService([make_owner()], max_pending=3, batch_window=0) as service:
+            await asyncio.gather(*(service.conflicts("Jordan") for _ in range(20)))
+            return service.stats
+
+    stats = asyncio.run(run())
+    assert stats.requests == 20 and stats.peak_in_flight == 3
+
+
+def test_unknown_owner_raises_key_error():
+    async def run():
+        async with PawPalService([make_owner()]) as service:
+            await service.conflicts("Nobody")
+
+    with pytest.raises(KeyError):
+        asyncio.run(run())
+
+
+def test_process_pool_executor_gives_same_answer():
+    owner = make_owner()
+
+    async def run(executor=None):
+        async with PawPalService([owner], executor=executor) as service:
+            return await service.occurrences("Jordan", "2026-02-23", "2026-02-25")
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        assert asyncio.run(run(pool)) == asyncio.run(run())
+
+
+def test_client_and_server_round_trip():
+    async def run():
+        async with PawPalService([make_owner()]) as service, PawPalServer(service) as server:
+            async with PawPalClient(port=server.port) as client:
+                occurrences, conflicts = await asyncio.gather(
+                    client.occurrences("Jordan", "2026-02-23", "2026-02-24"),
+                    client.conflicts("Jordan"),
+                )
+                with pytest.raises(ServiceError):
+                    await client.schedule("Jordan", mode="fastest")
+                return occurrences, conflicts
+
+    occurrences, conflicts = asyncio.run(run())
+    assert [o["date"] for o in occurrences["occurrences"]] == ["2026-02-23"] * 3 + ["2026-02-24"]
+    assert len(conflicts["conflicts"]) == 1
@@ -0,0 +1,95 @@
+import random
+from datetime import date
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner
+from pawpal_slots import FreeIntervals, SlotPlanner, parse_window
+
+DAY = date(2026, 2, 23)
+
+
+def make_owner(*tasks, minutes=480):
+    pet = Pet(name="Mochi", species="dog")
+    for task in tasks:
+        pet.add_task(task)
+    owner = Owner(name="Jordan", available_minutes=minutes)
+    owner.add_pet(pet)
+    return owner
+
+
+def test_free_intervals_merge_split_and_best_fit():
+    free = FreeIntervals([(0, 60), (60, 120), (200, 230)])
+    assert list(free) == [(0, 120), (200, 230)]
+    assert free.reserve(100, 210) == 30
+    assert list(free) == [(0, 100), (210, 230)]
+    assert free.best_fit(15) == 210
+    assert free.best_fit(50) == 0
+    assert free.best_fit(101) is None
+
+
+def test_free_intervals_match_a_minute_by_minute_model():
+    rng = random.Random(3)
+    free = FreeIntervals([(0, 1440)])
+    model = set(range(1440))
+    for _ in range(300):
+        start = rng.randrange(1440)
+        end = start + rng.randint(1, 90)
+        if rng.random() < 0.7:
+            assert free.reserve(start, end) == len(model & set(range(start, end)))
+            model -= set(range(start, end))
+        else:
+            free.add(start, end)
+            model |= set(range(start, end))
+        assert sum(e - s for s, e in free) == free.total() == len(model)
+        gaps = list(free)
+        assert all(a[1] < b[0] for a, b in zip(gaps, gaps[1:]))   # disjoint and not touching
+
+
+def test_planner_keeps_fixed_times_and_packs_flexible_tasks_into_gaps():
+    vet = Task(title="Vet", duration_minutes=60, priority=3, date="2026-02-23", time="08:00")
+    walk = Task(title="Walk", duration_minutes=45, priority=3)
+    feed = Task(title="Feed", duration_minutes=10, priority=2)
+    groom = Task(title="Groom", duration_minutes=120, priority=1)
+    owner = make_owner(vet, walk, feed, groom)
+    planner = SlotPlanner(owner, windows=[("07:00", "10:00"), ("18:00", "19:00")])
+    itinerary = planner.plan_day(DAY)
+
+    assert itinerary.lines() == [
+        "07:00-07:45  Walk (flexible)",
+        "07:45-07:55  Feed (flexible)",
+        "08:00-09:00  Vet",
+    ]
+    assert itinerary.unplaced == [groom]
+    assert itinerary.minutes_used == 115
+
+
+def test_planner_respects_budget_and_reports_clashes():
+    a = Task(title="Meds", duration_minutes=30, priority=3, time="09:00")
+    b = Task(title="Call", duration_minutes=10, priority=3, time="09:15")
+    extra = Task(title="Play", duration_minutes=30, priority=2)
+    itinerary = SlotPlanner(make_owner(a, b, extra, minutes=60)).plan_day(DAY)
+    assert itinerary.clashes == [b]
+    assert itinerary.unplaced == [extra]
+
+
+def test_recurring_tasks_appear_on_each_day():
+    walk = Task(title="Walk", duration_minutes=30, priority=3, frequency="daily", date="2026-02-23")
+    days = SlotPlanner(make_owner(walk)).plan_range(DAY, date(2026, 2, 25))
+    assert [[s.task for s in d.slots] for d in days] == [[walk]] * 3
+    assert days[0].slots[0].start_time == "06:00"
+
+
+def test_plan_range_places_undated_one_off_tasks_once():
+    walk = Task(title="Walk", duration_minutes=30, priority=3, frequency="daily", date="2026-02-23")
+    bath = Task(title="Bath", duration_minutes=20, priority=2)
+    vet = Task(title="Vet", duration_minutes=40, priority=2, date="2026-02-24", time="10:00")
+    days = SlotPlanner(make_owner(walk, bath, vet)).plan_range(DAY, date(2026, 2, 25))
+    assert [[s.task.title for s in d.slots] for d in days] == [["Walk", "Bath"], ["Walk", "Vet"], ["Walk"]]
+    assert [d.date for d in days] == ["2026-02-23", "2026-02-24", "2026-02-25"]
+
+
+def test_parse_window_rejects_backwards_windows():
+    assert parse_window(("21:00", "24:00")) == (1260, 1440)
+    with pytest.raises(ValueError):
+        parse_window(("10:00", "09:00"))
@@ -0,0 +1,90 @@
+import pytest
+
+import pawpal_snapshot as snap
+from pawpal_system import Task, Pet, Owner
+from pawpal_snapshot import SnapshotWriter, iter_tasks, read_snapshot, write_snapshot
+
+
+def make_owner():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk", duration_minutes=20, priority=3, category="exercise",
+                        frequency="daily", date="2026-02-23", time="09:00"))
+    mochi.add_task(Task(title="Flea treatment", duration_minutes=10, priority=2, category="meds",
+                        notes="left shoulder — use glove", completed=True))
+    luna.add_task(Task(title="Litter box", duration_minutes=5, priority=2, time="morning"))
+    owner = Owner(name="Jordan", available_minutes=60, daily_minutes={"saturday": 120})
+    owner.add_pet(mochi)
+    owner.add_pet(luna)
+    owner.add_pet(Pet(name="Pip", species="other"))
+    return owner
+
+
+@pytest.mark.parametrize("mode", ["jsonl", "binary"])
+def test_snapshot_round_trips_owner(tmp_path, mode):
+    owner = make_owner()
+    path = str(tmp_path / f"owner.{mode}")
+    write_snapshot(owner, path, mode=mode)
+    assert read_snapshot(path) == owner
+
+
+@pytest.mark.parametrize("mode", ["jsonl", "binary"])
+def test_iter_tasks_streams_every_task(tmp_path, mode):
+    owner = make_owner()
+    path = str(tmp_path / f"owner.{mode}")
+    write_snapshot(owner, path, mode=mode)
+    stream = iter_tasks(path)
+    assert next(stream).title == "Walk"
+    assert [t.title for t in stream] == ["Flea treatment", "Litter box"]
+
+
+def test_binary_snapshot_is_smaller_than_jsonl(tmp_path):
+    owner = Owner(name="Kennel", available_minutes=480)
+    pet = Pet(name="Mochi", species="dog")
+    for i in range(500):
+        pet.add_task(Task(title="Walk", duration_minutes=20, priority=3, frequency="daily",
+                          date="2026-02-23", time="09:00"))
+    owner.add_pet(pet)
+    write_snapshot(owner, str(tmp_path / "a.jsonl"), mode="jsonl")
+    write_snapshot(owner, str(tmp_path / "a.bin"), mode="binary")
+    assert (tmp_path / "a.bin").stat().st_size * 3 < (tmp_path / "a.jsonl").stat().st_size
+
+
+def test_binary_string_table_holds_only_repeated_columns(tmp_path):
+    owner = Owner(name="Kennel", available_minutes=480)
+    pet = Pet(name="Mochi", species="dog")
+    for i in range(1000):
+        pet.add_task(Task(title=f"Walk {i}", duration_minutes=20, priority=3, notes=f"note {i}",
+                          category="exercise", date="2026-02-23"))
+    owner.add_pet(pet)
+    with SnapshotWriter(str(tmp_path / "a.bin"), mode="binary") as writer:
+        writer.owner(owner)
+        writer.pet(pet)
+        for task in pet.tasks:
+            writer.task(task)
+        assert len(writer._strings) < 10
+    assert read_snapshot(str(tmp_path / "a.bin")) == owner
+
+
+def test_stopping_a_stream_early_still_reserves_ids(tmp_path):
+    owner = make_owner()
+    first = owner.pets[0].tasks[0]
+    first.id = Task(title="Probe", duration_minutes=1, priority=1).id + 1000
+    path = str(tmp_path / "owner.jsonl")
+    write_snapshot(owner, path)
+    stream = iter_tasks(path)
+    assert next(stream).id == first.id
+    del stream
+    assert Task(title="New", duration_minutes=5, priority=1).id > first.id
+
+
+def test_read_rejects_other_versions(tmp_path):
+    path = tmp_path / "future.jsonl"
+    path.write_text('{"format": "pawpal-snapshot", "version": 99, "owner": {}}\n')
+    with pytest.raises(ValueError):
+        read_snapshot(str(path))
+
+
+def test_write_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        write_snapshot(make_owner(), str(tmp_path / "x"), mode="xml")
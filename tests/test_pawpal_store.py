@@ -0,0 +1,79 @@
+import pytest
+
+from pawpal_system import Task, Pet, Owner
+from pawpal_store import TaskStore
+
+
+def make_owner():
+    mochi = Pet(name="Mochi", species="dog")
+    luna  = Pet(name="Luna",  species="cat")
+    mochi.add_task(Task(title="Walk", duration_minutes=20, priority=3, category="exercise",
+                        frequency="daily", date="2026-02-23", time="09:00"))
+    mochi.add_task(Task(title="Flea treatment", duration_minutes=10, priority=2, category="meds",
+                        notes="left shoulder", completed=True))
+    luna.add_task(Task(title="Litter box", duration_minutes=5, priority=2, category="grooming"))
+    owner = Owner(name="Jordan", available_minutes=60)
+    owner.add_pet(mochi)
+    owner.add_pet(luna)
+    return owner
+
+
+def test_store_round_trips_every_field():
+    owner = make_owner()
+    store = TaskStore.from_owner(owner)
+    assert len(store) == 3
+    assert [store.task(i) for i in range(len(store))] == owner.get_all_tasks()
+
+
+def test_store_interns_repeated_strings():
+    store = TaskStore()
+    for i in range(100):
+        store.append(Task(title=f"Walk {i}", duration_minutes=20, priority=3,
+                          category="exercise", frequency="daily"), "Mochi")
+    assert set(store.strings) == {"exercise", "daily", "Mochi"}
+
+
+def test_pet_view_reads_like_a_pet():
+    owner = make_owner()
+    store = TaskStore.from_owner(owner)
+    mochi = store.pet_view("Mochi")
+    assert [t.title for t in mochi.tasks] == ["Walk", "Flea treatment"]
+    assert [t.title for t in mochi.get_tasks_by_priority(2)] == ["Flea treatment"]
+    assert [t.title for t in mochi.get_all_tasks()] == ["Walk", "Flea treatment"]
+    assert mochi.tasks[0].time == "09:00"
+    assert mochi.tasks[0].date == "2026-02-23"
+    assert mochi.tasks[1].completed is True
+
+
+def test_owner_view_reads_like_an_owner():
+    owner = make_owner()
+    view = TaskStore.from_owner(owner).owner_view(owner.name, owner.available_minutes)
+    assert [p.name for p in view.pets] == ["Mochi", "Luna"]
+    assert [t.title for t in view.filter_by_priority(2)] == ["Flea treatment", "Litter box"]
+    assert len(view.get_all_tasks()) == 3
+
+
+def test_pets_with_the_same_name_stay_apart():
+    owner = make_owner()
+    other = Pet(name="Mochi", species="cat")
+    other.add_task(Task(title="Brush", duration_minutes=5, priority=1))
+    owner.add_pet(other)
+    owner.add_pet(Pet(name="Bean", species="dog"))
+    store = TaskStore.from_owner(owner)
+    pets = store.owner_view().pets
+    assert [p.name for p in pets] == ["Mochi", "Luna", "Mochi", "Bean"]
+    assert [[t.title for t in p.tasks] for p in pets] == [[t.title for t in p.tasks] for p in owner.pets]
+    assert [t.title for t in store.pet_view(2).tasks] == ["Brush"]
+    assert [t.title for t in store.pet_view("Mochi").tasks] == ["Walk", "Flea treatment"]
+
+
+def test_store_keeps_priorities_outside_a_byte():
+    store = TaskStore()
+    for priority in (500, -200, 128):
+        store.append(Task(title="Walk", duration_minutes=20, priority=priority), "Mochi")
+    assert [t.priority for t in store] == [500, -200, 128]
+
+
+def test_store_rejects_free_form_time():
+    with pytest.raises(ValueError):
+        TaskStore().append(Task(title="Walk", duration_minutes=20, priority=3, time="morning"))
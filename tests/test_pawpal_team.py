@@ -0,0 +1,95 @@
+import random
+from datetime import date
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner
+from pawpal_slots import parse_window
+from pawpal_team import SKILLED_CATEGORIES, Caregiver, TeamPlanner
+
+DAY = date(2026, 2, 23)
+
+
+def make_owner(*tasks):
+    pet = Pet(name="Mochi", species="dog")
+    for task in tasks:
+        pet.add_task(task)
+    owner = Owner(name="Shop", available_minutes=480)
+    owner.add_pet(pet)
+    return owner
+
+
+def test_skilled_tasks_only_go_to_caregivers_with_the_skill():
+    pills = Task(title="Pills", duration_minutes=10, priority=3, category="meds")
+    brush = Task(title="Brush", duration_minutes=20, priority=2, category="grooming")
+    walk = Task(title="Walk", duration_minutes=30, priority=2, category="exercise")
+    team = [Caregiver("Ana", 60), Caregiver("Ben", 60, skills=("meds",))]
+    plan = TeamPlanner(make_owner(pills, brush, walk), team).plan_day(DAY)
+
+    assert [s.task for s in plan.slots["Ben"]] == [pills]
+    assert [s.task for s in plan.slots["Ana"]] == [walk]
+    assert plan.unassigned == [brush]              # nobody grooms
+
+
+def test_load_is_balanced_across_caregivers():
+    tasks = [Task(title=f"Walk {i}", duration_minutes=30, priority=2) for i in range(5)]
+    team = [Caregiver("Ana", 120), Caregiver("Ben", 120), Caregiver("Cy", 60)]
+    plan = TeamPlanner(make_owner(*tasks), team).plan_day(DAY)
+    # Balanced by share of budget: the 60-minute caregiver gets half as much.
+    assert plan.loads() == {"Ana": 60, "Ben": 60, "Cy": 30}
+    assert not plan.unassigned
+
+
+def test_fixed_tasks_need_a_caregiver_on_shift_and_free():
+    vet = Task(title="Vet", duration_minutes=60, priority=3, time="09:00")
+    call = Task(title="Call", duration_minutes=15, priority=2, time="09:30")
+    late = Task(title="Late feed", duration_minutes=10, priority=2, time="23:00")
+    team = [Caregiver("Ana", 240, windows=[("08:00", "12:00")]),
+            Caregiver("Ben", 240, windows=[("09:00", "17:00")])]
+    plan = TeamPlanner(make_owner(vet, call, late), team).plan_day(DAY)
+
+    assigned = {s.task.title: name for name, slots in plan.slots.items() for s in slots}
+    assert assigned["Vet"] != assigned["Call"]     # they overlap, so two people
+    assert plan.slots[assigned["Call"]][0].start_time == "09:30"
+    assert plan.unassigned == [late]               # nobody works at 23:00
+
+
+def test_roster_assigns_tasks_incrementally():
+    team = [Caregiver("Ana", 30), Caregiver("Ben", 30)]
+    roster = TeamPlanner(make_owner(), team).start_day(DAY)
+    names = [roster.assign(Task(title=f"T{i}", duration_minutes=20, priority=2)) for i in range(3)]
+    assert sorted(names[:2]) == ["Ana", "Ben"]
+    assert names[2] is None
+    assert roster.plan.minutes_for("Ana") == roster.plan.minutes_for("Ben") == 20
+
+    with pytest.raises(ValueError):
+        TeamPlanner(make_owner(), [Caregiver("Ana", 30), Caregiver("Ana", 60)]).start_day(DAY)
+
+
+def test_random_plans_respect_every_constraint():
+    rng = random.Random(5)
+    categories = ["exercise", "feeding", "meds", "grooming"]
+    tasks = []
+    for i in range(400):
+        minute = rng.randrange(6 * 60, 21 * 60)
+        tasks.append(Task(
+            title=f"T{i}", duration_minutes=rng.choice([5, 10, 15, 30, 45]), priority=rng.randint(1, 3),
+            category=rng.choice(categories),
+            time=f"{minute // 60:02d}:{minute % 60:02d}" if rng.random() < 0.3 else "",
+        ))
+    team = [Caregiver(f"C{i}", rng.choice([120, 240, 480]),
+                      skills=tuple(rng.sample(sorted(SKILLED_CATEGORIES), rng.randint(0, 2))),
+                      windows=[rng.choice([("06:00", "14:00"), ("12:00", "22:00"), ("08:00", "18:00")])])
+            for i in range(12)]
+    plan = TeamPlanner(make_owner(*tasks), team).plan_day(DAY)
+
+    placed = [s.task for slots in plan.slots.values() for s in slots]
+    assert sorted(t.id for t in placed + plan.unassigned) == sorted(t.id for t in tasks)
+    for caregiver in team:
+        slots = plan.slots[caregiver.name]
+        window = parse_window(caregiver.windows[0])
+        assert plan.minutes_for(caregiver.name) <= caregiver.available_minutes
+        assert all(window[0] <= s.start and s.end <= window[1] for s in slots)
+        assert all(a.end <= b.start for a, b in zip(slots, slots[1:]))
+        assert all(s.task.category in caregiver.skills for s in slots
+                   if s.task.category in SKILLED_CATEGORIES)
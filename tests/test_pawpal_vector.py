@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from pawpal_system import Task, Pet, Owner, Scheduler, greedy_fill
+
+np = pytest.importorskip("numpy")
+from pawpal_vector import TaskArrays, greedy_fill_groups  # noqa: E402
+
+CATEGORIES = ["exercise", "feeding", "meds", "grooming", ""]
+DATES = ["2026-03-01", "2026-03-02", ""]
+
+
+def random_owner(rng, pets=3, tasks=40):
+    owner = Owner(name="Jordan", available_minutes=rng.randint(-10, 300))
+    for p in range(pets):
+        pet = Pet(name=f"Pet {p}", species="dog")
+        for i in range(rng.randint(0, tasks)):
+            pet.add_task(Task(title=f"T{p}-{i}", duration_minutes=rng.choice([0, 5, 10, 15, 30, 45, 60, 120]),
+                              priority=rng.randint(1, 3), category=rng.choice(CATEGORIES),
+                              date=rng.choice(DATES), completed=rng.random() < 0.2,
+                              time=rng.choice(["", "morning", f"{rng.randint(6, 20):02d}:{rng.choice([0, 15, 30, 45]):02d}"])))
+        owner.add_pet(pet)
+    return owner
+
+
+def ids(tasks):
+    return [t.id for t in tasks]
+
+
+@pytest.fixture
+def owners():
+    rng = random.Random(22)
+    return [random_owner(rng) for _ in range(25)]
+
+
+def test_schedules_match_the_scheduler(owners):
+    arrays = TaskArrays.from_owners(owners)
+    for o, owner in enumerate(owners):
+        scheduler = Scheduler(owner=owner)
+        scheduler.build_schedule()
+        assert arrays.schedule(o).tolist() == ids(scheduler.schedule)
+        assert arrays.get_unscheduled(o).tolist() == ids(scheduler.get_unscheduled())
+        assert arrays.scheduled_minutes()[o] == sum(t.duration_minutes for t in scheduler.schedule)
+
+
+def test_filters_and_sorts_match_the_owner_and_scheduler(owners):
+    arrays = TaskArrays.from_owners(owners)
+    for o, owner in enumerate(owners):
+        for priority in (1, 2, 3):
+            assert arrays.filter_by_priority(priority, o).tolist() == ids(owner.filter_by_priority(priority))
+        for category in CATEGORIES + ["missing"]:
+            for completed in (None, True, False):
+                assert (arrays.query(o, category=category, completed=completed, date="2026-03-01").tolist()
+                        == ids(owner.query(category=category, completed=completed, date="2026-03-01")))
+        tasks = owner.get_all_tasks()
+        assert arrays.sort_by_time(ids(tasks)).tolist() == ids(Scheduler(owner=owner).sort_by_time(tasks))
+
+
+def test_conflicts_match_the_scheduler(owners):
+    arrays = TaskArrays.from_owners(owners)
+    for o, owner in enumerate(owners):
+        expected = sorted((a.id, b.id) for a, b in Scheduler(owner=owner).detect_conflicts())
+        assert sorted(map(tuple, arrays.conflicts(o).tolist())) == expected
+    assert len(arrays.conflicts()) == sum(len(Scheduler(owner=o).detect_conflicts()) for o in owners)
+
+
+def test_grouped_fill_matches_greedy_fill():
+    rng = random.Random(5)
+    groups = [[rng.choice([0, 1, 5, 30, 90, 200]) for _ in range(rng.randint(0, 300))] for _ in range(40)]
+    budgets = [rng.randint(0, 400) for _ in groups]
+    sizes = np.array([len(g) for g in groups])
+    picked = greedy_fill_groups(np.array([d for g in groups for d in g]), np.cumsum(sizes) - sizes,
+                                np.cumsum(sizes), np.array(budgets))
+    offset = 0
+    for group, budget in zip(groups, budgets):
+        assert np.flatnonzero(picked[offset:offset + len(group)]).tolist() == greedy_fill(group, budget)
+        offset += len(group)
+
+
+def test_results_map_back_to_tasks():
+    pet = Pet(name="Mochi", species="dog")
+    walk = Task(title="Walk", duration_minutes=30, priority=3, time="09:00")
+    brush = Task(title="Brush", duration_minutes=20, priority=1, time="09:10")
+    pet.add_task(walk)
+    pet.add_task(brush)
+    owner = Owner(name="Jordan", available_minutes=40, pets=[pet])
+    arrays = TaskArrays.from_owner(owner)
+    assert arrays.tasks(arrays.schedule()) == [walk]
+    assert arrays.tasks(arrays.conflicts()[0]) == [walk, brush]
+
+    pet.add_task(Task(title="Urgent", duration_minutes=10, priority=500))
+    pet.add_task(Task(title="Never", duration_minutes=10, priority=-200))
+    arrays = TaskArrays.from_owner(owner)
+    assert arrays.tasks(arrays.schedule()) == [pet.tasks[2], walk]
+    assert arrays.filter_by_priority(500).tolist() == [pet.tasks[2].id]
+
+    pet.add_task(Task(title="Bad", duration_minutes=-5, priority=1))
+    with pytest.raises(ValueError):
+        TaskArrays.from_owner(owner)
@@ -0,0 +1,89 @@
+import random
+
+from pawpal_system import Task, Pet, Owner, Scheduler, greedy_fill
+from pawpal_whatif import WhatIf, greedy_curve
+
+
+def make_owner():
+    mochi = Pet(name="Mochi", species="dog")
+    luna = Pet(name="Luna", species="cat")
+    mochi.add_task(Task(title="Walk", duration_minutes=30, priority=3))
+    mochi.add_task(Task(title="Brush", duration_minutes=20, priority=1))
+    luna.add_task(Task(title="Feed", duration_minutes=10, priority=3))
+    luna.add_task(Task(title="Play", duration_minutes=25, priority=2))
+    owner = Owner(name="Jordan", available_minutes=60)
+    owner.add_pet(mochi)
+    owner.add_pet(luna)
+    return owner
+
+
+def titles(tasks):
+    return [t.title for t in tasks]
+
+
+def test_scenarios_share_unchanged_tasks_and_leave_the_owner_alone():
+    owner = make_owner()
+    walk, brush = owner.pets[0].tasks
+    feed, play = owner.pets[1].tasks
+    version = owner.version
+
+    scenario = WhatIf(owner).scenario("busy day", available_minutes=30).drop(brush)
+    quick_walk = scenario.edit(walk, duration_minutes=15)
+    bath = Task(title="Bath", duration_minutes=10, priority=2)
+    child = scenario.fork("plus a bath").add(bath, owner.pets[1])
+
+    assert titles(scenario.tasks()) == ["Walk", "Feed", "Play"]
+    assert scenario.tasks()[1] is feed and scenario.tasks()[0] is quick_walk
+    assert titles(child.tasks()) == ["Walk", "Feed", "Play", "Bath"]
+    assert child.available_minutes == 30
+    assert walk.duration_minutes == 30 and len(owner.pets[0].tasks) == 2
+    assert owner.version == version
+
+
+def test_what_if_schedules_match_the_scheduler():
+    rng = random.Random(9)
+    owner = Owner(name="Jordan", available_minutes=90)
+    for p in range(3):
+        pet = Pet(name=f"Pet {p}", species="dog")
+        for i in range(15):
+            pet.add_task(Task(title=f"T{p}-{i}", duration_minutes=rng.randint(0, 40),
+                              priority=rng.randint(1, 3)))
+        owner.add_pet(pet)
+    what_if = WhatIf(owner)
+    tasks = owner.get_all_tasks()
+    for _ in range(20):
+        scenario = what_if.scenario(available_minutes=rng.randint(0, 200))
+        for task in rng.sample(tasks, 5):
+            scenario.drop(task)
+        for task in rng.sample(tasks, 5):
+            scenario.edit(task, priority=rng.randint(1, 3), duration_minutes=rng.randint(1, 40))
+        scenario.add(Task(title="New", duration_minutes=rng.randint(1, 30), priority=3), rng.choice(owner.pets))
+
+        expected = Scheduler(owner=scenario.to_owner())
+        expected.build_schedule()
+        assert titles(what_if.schedule(scenario)) == titles(expected.schedule)
+        point = what_if.curve(scenario, [scenario.available_minutes])[0]
+        assert point.minutes == sum(t.duration_minutes for t in expected.schedule)
+
+
+def test_greedy_curve_matches_greedy_fill_at_every_budget():
+    rng = random.Random(4)
+    durations = [rng.choice([0, 5, 10, 15, 30, 45, 60, 120]) for _ in range(200)]
+    priorities = [rng.randint(1, 3) for _ in durations]
+    for point in greedy_curve(durations, priorities, range(0, 481, 7)):
+        picked = greedy_fill(durations, point.budget)
+        assert point.minutes == sum(durations[i] for i in picked)
+        assert point.tasks == len(picked)
+        assert point.score == sum(durations[i] * priorities[i] for i in picked)
+
+
+def test_compare_reuses_the_order_until_the_owner_changes():
+    owner = make_owner()
+    what_if = WhatIf(owner)
+    no_walk = what_if.scenario("no walk").drop(owner.pets[0].tasks[0])
+    curves = what_if.compare([what_if.scenario("as is"), no_walk], budgets=[40])
+    assert [p.tasks for p in curves["as is"]] == [2]        # Walk + Feed
+    assert [p.tasks for p in curves["no walk"]] == [2]      # Feed + Play
+
+    owner.pets[1].add_task(Task(title="Meds", duration_minutes=5, priority=3))
+    assert titles(what_if.order()) == ["Walk", "Feed", "Meds", "Play", "Brush"]